@@ -0,0 +1,32 @@
+"""content queue keyset pagination indexes
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-10-19
+
+"""
+from alembic import op
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_content_queue_site_status_id",
+        "content_queue",
+        ["site_id", "status", "id"],
+    )
+    op.create_index(
+        "ix_content_queue_created_at_id",
+        "content_queue",
+        ["created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_content_queue_created_at_id", table_name="content_queue")
+    op.drop_index("ix_content_queue_site_status_id", table_name="content_queue")
@@ -0,0 +1,48 @@
+"""content queue full-text and trigram search
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-10-19
+
+"""
+from alembic import op
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # tsvector/GIN and pg_trgm only exist on PostgreSQL; other backends
+    # fall back to LIKE scans in src.database.search
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        """
+        ALTER TABLE content_queue
+        ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(body, '')), 'B')
+        ) STORED
+        """
+    )
+    op.execute(
+        "CREATE INDEX ix_content_queue_search_vector "
+        "ON content_queue USING gin (search_vector)"
+    )
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_content_queue_title_trgm "
+        "ON content_queue USING gin (title gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_content_queue_title_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_content_queue_search_vector")
+    op.execute("ALTER TABLE content_queue DROP COLUMN IF EXISTS search_vector")
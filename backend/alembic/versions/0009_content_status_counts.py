@@ -0,0 +1,83 @@
+"""content status counter table
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2025-10-19
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "content_status_counts",
+        sa.Column("site_id", sa.Integer(), primary_key=True),
+        sa.Column("status", sa.String(length=50), primary_key=True),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # Counters follow every write path (ORM, bulk UPDATE, COPY) via triggers
+    op.execute(
+        """
+        CREATE FUNCTION content_status_counts_apply() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE')
+                    AND OLD.site_id IS NOT NULL AND OLD.status IS NOT NULL THEN
+                UPDATE content_status_counts SET count = count - 1
+                WHERE site_id = OLD.site_id AND status = OLD.status;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE')
+                    AND NEW.site_id IS NOT NULL AND NEW.status IS NOT NULL THEN
+                INSERT INTO content_status_counts (site_id, status, count)
+                VALUES (NEW.site_id, NEW.status, 1)
+                ON CONFLICT (site_id, status)
+                DO UPDATE SET count = content_status_counts.count + 1;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER content_queue_status_counts_ins_del
+        AFTER INSERT OR DELETE ON content_queue
+        FOR EACH ROW EXECUTE FUNCTION content_status_counts_apply()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER content_queue_status_counts_upd
+        AFTER UPDATE OF site_id, status ON content_queue
+        FOR EACH ROW
+        WHEN (OLD.site_id IS DISTINCT FROM NEW.site_id
+              OR OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION content_status_counts_apply()
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO content_status_counts (site_id, status, count)
+        SELECT site_id, status, count(*) FROM content_queue
+        WHERE site_id IS NOT NULL AND status IS NOT NULL
+        GROUP BY site_id, status
+        """
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP TRIGGER IF EXISTS content_queue_status_counts_upd ON content_queue")
+        op.execute(
+            "DROP TRIGGER IF EXISTS content_queue_status_counts_ins_del ON content_queue"
+        )
+        op.execute("DROP FUNCTION IF EXISTS content_status_counts_apply()")
+    op.drop_table("content_status_counts")
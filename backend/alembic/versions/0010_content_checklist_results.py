@@ -0,0 +1,38 @@
+"""persist checklist results on content_queue
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2025-10-20
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("content_queue", sa.Column("checklist_hash", sa.String(length=64)))
+    op.add_column("content_queue", sa.Column("checklist_score", sa.Integer()))
+    op.add_column("content_queue", sa.Column("checklist_passed", sa.Boolean()))
+    op.add_column("content_queue", sa.Column("checklist_report", sa.Text()))
+    op.create_index(
+        "ix_content_queue_checklist_score_id",
+        "content_queue",
+        ["checklist_score", "id"],
+    )
+
+    # Existing rows are left unscored: the score_unscored_content task (sent
+    # when beat starts) scores them with whatever the checklist is then, so
+    # this revision never imports application code that later changes
+
+def downgrade() -> None:
+    op.drop_index("ix_content_queue_checklist_score_id", table_name="content_queue")
+    op.drop_column("content_queue", "checklist_report")
+    op.drop_column("content_queue", "checklist_passed")
+    op.drop_column("content_queue", "checklist_score")
+    op.drop_column("content_queue", "checklist_hash")
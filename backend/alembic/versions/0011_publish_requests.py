@@ -0,0 +1,48 @@
+"""publish jobs and WordPress post ids on content_queue
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2025-10-22
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("content_queue", sa.Column("wp_post_id", sa.Integer()))
+    op.add_column("content_queue", sa.Column("wp_link", sa.String(length=1000)))
+    op.create_table(
+        "publish_requests",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("idempotency_key", sa.String(length=128), nullable=False),
+        sa.Column("content_id", sa.Integer(), sa.ForeignKey("content_queue.id")),
+        sa.Column("site_id", sa.Integer(), sa.ForeignKey("sites.id"), nullable=False),
+        sa.Column("title", sa.String(length=500)),
+        sa.Column("body", sa.Text()),
+        sa.Column("wp_status", sa.String(length=20)),
+        sa.Column("status", sa.String(length=20)),
+        sa.Column("task_id", sa.String(length=64)),
+        sa.Column("attempts", sa.Integer()),
+        sa.Column("post_id", sa.Integer()),
+        sa.Column("link", sa.String(length=1000)),
+        sa.Column("error", sa.Text()),
+        sa.Column("requested_by", sa.Integer()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+        sa.UniqueConstraint(
+            "idempotency_key", name="uq_publish_requests_idempotency_key"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("publish_requests")
+    op.drop_column("content_queue", "wp_link")
+    op.drop_column("content_queue", "wp_post_id")
@@ -0,0 +1,31 @@
+"""cached connectivity check results on sites
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2025-10-22
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("sites", sa.Column("health_ok", sa.Boolean()))
+    op.add_column("sites", sa.Column("health_status_code", sa.Integer()))
+    op.add_column("sites", sa.Column("health_latency_ms", sa.Integer()))
+    op.add_column("sites", sa.Column("health_error", sa.String(length=500)))
+    op.add_column("sites", sa.Column("health_checked_at", sa.DateTime()))
+
+
+def downgrade() -> None:
+    op.drop_column("sites", "health_checked_at")
+    op.drop_column("sites", "health_error")
+    op.drop_column("sites", "health_latency_ms")
+    op.drop_column("sites", "health_status_code")
+    op.drop_column("sites", "health_ok")
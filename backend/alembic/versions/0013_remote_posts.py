@@ -0,0 +1,39 @@
+"""local mirror of remote WordPress posts
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2025-10-23
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "remote_posts",
+        sa.Column("site_id", sa.Integer(), sa.ForeignKey("sites.id"), nullable=False),
+        sa.Column("post_id", sa.Integer(), nullable=False),
+        sa.Column("slug", sa.String(length=200)),
+        sa.Column("title_hash", sa.String(length=64), nullable=False),
+        sa.Column("modified", sa.DateTime()),
+        sa.PrimaryKeyConstraint("site_id", "post_id"),
+    )
+    op.create_index(
+        "ix_remote_posts_site_title_hash", "remote_posts", ["site_id", "title_hash"]
+    )
+    op.add_column("sites", sa.Column("remote_posts_cursor", sa.DateTime()))
+    op.add_column("sites", sa.Column("remote_posts_synced_at", sa.DateTime()))
+
+
+def downgrade() -> None:
+    op.drop_column("sites", "remote_posts_synced_at")
+    op.drop_column("sites", "remote_posts_cursor")
+    op.drop_index("ix_remote_posts_site_title_hash", table_name="remote_posts")
+    op.drop_table("remote_posts")
@@ -0,0 +1,27 @@
+"""scheduler dispatcher state
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2025-10-23
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0014"
+down_revision = "0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduler_state",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("last_tick", sa.DateTime()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scheduler_state")
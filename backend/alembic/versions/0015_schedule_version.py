@@ -0,0 +1,33 @@
+"""site schedule versions for dispatcher hot reload
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2025-10-23
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0015"
+down_revision = "0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "sites",
+        sa.Column("schedule_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index("ix_sites_schedule_version", "sites", ["schedule_version"])
+    op.add_column(
+        "scheduler_state",
+        sa.Column("schedule_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("scheduler_state", "schedule_version")
+    op.drop_index("ix_sites_schedule_version", table_name="sites")
+    op.drop_column("sites", "schedule_version")
@@ -0,0 +1,29 @@
+"""per-site daily draft counters
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2025-10-23
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0016"
+down_revision = "0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "site_daily_counters",
+        sa.Column("site_id", sa.Integer(), sa.ForeignKey("sites.id"), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("generated", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("site_id", "day"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("site_daily_counters")
@@ -0,0 +1,35 @@
+"""keyword rotation for draft generation
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2025-10-23
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0017"
+down_revision = "0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "keywords",
+        sa.Column(
+            "last_used_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("'1970-01-01 00:00:00'"),
+        ),
+    )
+    op.create_index(
+        "ix_keywords_site_last_used_id", "keywords", ["site_id", "last_used_at", "id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_keywords_site_last_used_id", table_name="keywords")
+    op.drop_column("keywords", "last_used_at")
@@ -0,0 +1,37 @@
+"""unscored content sorts below every score
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2025-10-24
+
+"""
+from alembic import op
+
+
+revision = "0018"
+down_revision = "0017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # SQLite already sorts NULLs first; PostgreSQL needs it in the index so
+    # both score sorts (ASC NULLS FIRST, DESC NULLS LAST) walk it
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_content_queue_checklist_score_id", table_name="content_queue")
+    op.create_index(
+        "ix_content_queue_checklist_score_id",
+        "content_queue",
+        ["checklist_score", "id"],
+        postgresql_ops={"checklist_score": "NULLS FIRST"},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_content_queue_checklist_score_id", table_name="content_queue")
+    op.create_index(
+        "ix_content_queue_checklist_score_id", "content_queue", ["checklist_score", "id"]
+    )
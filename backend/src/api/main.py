@@ -32,6 +32,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     app.state.limiter = limiter
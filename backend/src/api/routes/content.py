@@ -1,11 +1,47 @@
+import base64
+import csv
+import hashlib
+import io
+import json
+from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from pydantic import BaseModel, Field
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, defer, joinedload
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from src.api.deps.auth import get_current_user, get_db
-from src.core.wordpress_client import WordPressClient, WordPressCredentials
-from src.database.models import ContentQueue, Site
+from src.core.content_import import ContentImporter, iter_lines
+from src.core.content_status import ALLOWED_SOURCES, bulk_transition
+from src.core.remote_posts import remember_posts, title_hash
+from src.core.seo_checklist import (
+    checklist,
+    checklist_many,
+    current_checklist,
+    refresh_checklist,
+)
+from src.core.wordpress_client import (
+    PublishJob,
+    publish_many,
+    site_credentials,
+)
+from src.database.models import ContentQueue, PublishRequest, RemotePost, Site
+from src.database.queries import content_list_query
+from src.database.search import search_content
+from src.database.session import SessionLocal
+from src.database.stats import status_counts
 
 
 class ContentIn(BaseModel):
@@ -27,46 +63,290 @@ class ContentOut(BaseModel):
     site_name: str
     created_at: str
     updated_at: str
+    checklist_score: Optional[int] = None
+    checklist_passed: Optional[bool] = None
 
 
-@router.get("/", response_model=list[ContentOut])
+class ContentSummaryOut(BaseModel):
+    id: int
+    title: str
+    excerpt: str
+    status: str
+    site_id: int
+    site_name: str
+    created_at: str
+    updated_at: str
+    checklist_score: Optional[int] = None
+    checklist_passed: Optional[bool] = None
+
+
+EXCERPT_CHARS = 200
+
+
+def _timestamps(row: ContentQueue) -> dict:
+    created_at = row.created_at.isoformat() if row.created_at else ""
+    updated_at = row.updated_at.isoformat() if row.updated_at else created_at
+    return {"created_at": created_at, "updated_at": updated_at}
+
+
+def _content_out(row: ContentQueue, report: Optional[dict] = None) -> ContentOut:
+    """``report`` overrides the stored checklist columns (see get_content)."""
+    return ContentOut(
+        id=row.id,
+        title=row.title,
+        content=row.body or "",
+        status=row.status,
+        site_id=row.site_id,
+        site_name=row.site.name,
+        checklist_score=report["score"] if report else row.checklist_score,
+        checklist_passed=report["passed"] if report else row.checklist_passed,
+        **_timestamps(row),
+    )
+
+
+class ContentSearchOut(ContentOut):
+    rank: float
+
+
+def _encode_cursor(key, row_id: int) -> str:
+    if isinstance(key, datetime):
+        key = key.isoformat()
+    payload = {"i": row_id, "k": key}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, key_is_datetime: bool) -> tuple[object, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        key = payload.get("k")
+        if key is not None and key_is_datetime:
+            key = datetime.fromisoformat(key)
+        return key, int(payload["i"])
+    except Exception:
+        raise HTTPException(status_code=400, detail="invalid_cursor")
+
+
+def _excerpt(text: Optional[str]) -> str:
+    text = text or ""
+    if len(text) > EXCERPT_CHARS:
+        return text[:EXCERPT_CHARS].rstrip() + "…"
+    return text
+
+
+@router.get("/", response_model=list[ContentOut | ContentSummaryOut])
 def list_content(
+    response: Response,
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
     limit: int = 10,
     page: int = 1,
+    cursor: Optional[str] = None,
     q: Optional[str] = None,
     status: Optional[str] = None,
+    site_id: Optional[int] = None,
+    view: str = Query("full", pattern="^(full|summary)$"),
+    min_score: Optional[int] = None,
+    passed: Optional[bool] = None,
+    sort: str = Query("created", pattern="^(created|score|-score)$"),
 ):
-    query = db.query(ContentQueue).join(Site)
+    query = content_list_query(db)
+    summary = view == "summary"
+    if summary:
+        # Never load the full body for list pages; the DB slices the excerpt
+        query = query.options(defer(ContentQueue.body)).add_columns(
+            func.substr(ContentQueue.body, 1, EXCERPT_CHARS + 1).label("excerpt")
+        )
 
     if q:
         query = query.filter(ContentQueue.title.contains(q))
+    if site_id is not None:
+        query = query.filter(ContentQueue.site_id == site_id)
     if status:
         query = query.filter(ContentQueue.status == status)
+    # Stored checklist results: no rescoring on read
+    if min_score is not None:
+        query = query.filter(ContentQueue.checklist_score >= min_score)
+    if passed is not None:
+        query = query.filter(ContentQueue.checklist_passed == passed)
+
+    # Status views walk (site_id, status, id); the full list walks (created_at, id)
+    if sort == "created":
+        lead = None if status else ContentQueue.created_at
+        descending = True
+    else:
+        lead = ContentQueue.checklist_score
+        descending = sort == "-score"
+    order = [ContentQueue.id] if lead is None else [lead, ContentQueue.id]
+    order = [c.desc() if descending else c.asc() for c in order]
+    # Rows inserted by raw SQL are unscored until first read: they sort below
+    # every score, the same on every database
+    by_score = lead is ContentQueue.checklist_score
+    if by_score:
+        order[0] = order[0].nulls_last() if descending else order[0].nulls_first()
+    query = query.order_by(*order)
+
+    def _past(left, right):
+        return left < right if descending else left > right
+
+    if cursor:
+        # Keyset mode: seek past the last row instead of scanning OFFSET rows
+        key, last_id = _decode_cursor(cursor, lead is ContentQueue.created_at)
+        if lead is None or (key is None and not by_score):
+            seek = _past(ContentQueue.id, last_id)
+        elif key is None:
+            # Last row unscored: the rest of those, then any scored rows
+            seek = lead.is_(None) & _past(ContentQueue.id, last_id)
+            if not descending:
+                seek = seek | lead.isnot(None)
+        else:
+            seek = _past(tuple_(lead, ContentQueue.id), tuple_(key, last_id))
+            if by_score and descending:
+                seek = seek | lead.is_(None)
+        query = query.filter(seek)
+    else:
+        query = query.offset((page - 1) * limit)
+    rows = query.limit(limit).all()
+    excerpts = {}
+    if summary:
+        excerpts = {r.id: excerpt for r, excerpt in rows}
+        rows = [r for r, _ in rows]
+
+    if len(rows) == limit and rows:
+        last = rows[-1]
+        key = getattr(last, lead.key) if lead is not None else None
+        response.headers["X-Next-Cursor"] = _encode_cursor(key, last.id)
+
+    if summary:
+        return [
+            ContentSummaryOut(
+                id=r.id,
+                title=r.title,
+                excerpt=_excerpt(excerpts[r.id]),
+                status=r.status,
+                site_id=r.site_id,
+                site_name=r.site.name,
+                checklist_score=r.checklist_score,
+                checklist_passed=r.checklist_passed,
+                **_timestamps(r),
+            )
+            for r in rows
+        ]
+    return [
+        _content_out(r)
+        for r in rows
+    ]
 
-    offset = (page - 1) * limit
-    rows = query.offset(offset).limit(limit).all()
 
+@router.get("/search", response_model=list[ContentSearchOut])
+def search_content_ranked(
+    q: str,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+    limit: int = Query(20, ge=1, le=100),
+    site_id: Optional[int] = None,
+    status: Optional[str] = None,
+):
+    results = search_content(db, q, site_id=site_id, status=status, limit=limit)
     return [
-        ContentOut(
-            id=r.id,
-            title=r.title,
-            content=r.body or "",
-            status=r.status,
-            site_id=r.site_id,
-            site_name=r.site.name,
-            created_at=r.created_at.isoformat() if r.created_at else "",
-            updated_at=r.updated_at.isoformat()
-            if r.updated_at
-            else r.created_at.isoformat()
-            if r.created_at
-            else "",
-        )
-        for r in rows
+        ContentSearchOut(**_content_out(r).model_dump(), rank=rank)
+        for r, rank in results
     ]
 
 
+class SiteStatsOut(BaseModel):
+    site_id: int
+    counts: dict[str, int]
+    total: int
+
+
+class StatsOut(BaseModel):
+    sites: list[SiteStatsOut]
+    totals: dict[str, int]
+    total: int
+
+
+@router.get("/stats", response_model=StatsOut)
+def content_stats(
+    site_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    counts = status_counts(db, [site_id] if site_id is not None else None)
+    totals: dict[str, int] = {}
+    sites = []
+    for sid in sorted(counts):
+        for status, count in counts[sid].items():
+            totals[status] = totals.get(status, 0) + count
+        sites.append(
+            SiteStatsOut(site_id=sid, counts=counts[sid], total=sum(counts[sid].values()))
+        )
+    return StatsOut(sites=sites, totals=totals, total=sum(totals.values()))
+
+
+EXPORT_COLUMNS = ("id", "site_id", "title", "body", "status", "created_at", "updated_at")
+EXPORT_BATCH_ROWS = 1000
+
+
+def _export_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _export_rows(fmt: str, site_id: Optional[int], status: Optional[str]):
+    # Own session: the request-scoped one is closed before the body streams
+    db = SessionLocal()
+    try:
+        stmt = select(*(getattr(ContentQueue, c) for c in EXPORT_COLUMNS)).order_by(
+            ContentQueue.id
+        )
+        if site_id is not None:
+            stmt = stmt.where(ContentQueue.site_id == site_id)
+        if status:
+            stmt = stmt.where(ContentQueue.status == status)
+        # yield_per turns on a server-side cursor where the driver supports it
+        result = db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_ROWS))
+
+        if fmt == "csv":
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow(EXPORT_COLUMNS)
+            yield buf.getvalue()
+        for batch in result.partitions():
+            if fmt == "csv":
+                buf = io.StringIO()
+                writer = csv.writer(buf)
+                writer.writerows([_export_value(v) for v in row] for row in batch)
+                yield buf.getvalue()
+            else:
+                yield "".join(
+                    json.dumps(
+                        {c: _export_value(v) for c, v in zip(EXPORT_COLUMNS, row)},
+                        ensure_ascii=False,
+                    )
+                    + "\n"
+                    for row in batch
+                )
+    finally:
+        db.close()
+
+
+@router.get("/export")
+def export_content(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    site_id: Optional[int] = None,
+    status: Optional[str] = None,
+    user=Depends(get_current_user),
+):
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    filename = f"content-queue.{format}"
+    return StreamingResponse(
+        _export_rows(format, site_id, status),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.post("/", response_model=ContentOut)
 def create_content(
     body: ContentIn = Body(...),
@@ -79,25 +359,40 @@ def create_content(
         db.commit()
         db.refresh(row)
 
-        return ContentOut(
-            id=row.id,
-            title=row.title,
-            content=row.body or "",
-            status=row.status,
-            site_id=row.site_id,
-            site_name=row.site.name,
-            created_at=row.created_at.isoformat() if row.created_at else "",
-            updated_at=row.updated_at.isoformat()
-            if row.updated_at
-            else row.created_at.isoformat()
-            if row.created_at
-            else "",
-        )
+        return _content_out(row)
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=400, detail=f"content_create_failed: {e}")
 
 
+class ImportOut(BaseModel):
+    accepted: int
+    rejected: int
+    errors: list[dict]
+
+
+@router.post("/import", response_model=ImportOut)
+async def import_content(
+    request: Request,
+    site_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    """Import NDJSON content (one object per line) streamed from the body.
+
+    Lines are validated and written in chunks, so memory stays flat no
+    matter how large the upload is. ``site_id`` is the default for lines
+    that do not carry their own.
+    """
+    importer = ContentImporter(db, default_site_id=site_id)
+    async for line_no, line in iter_lines(request.stream()):
+        importer.add(line_no, line)
+        if importer.full:
+            await run_in_threadpool(importer.flush)
+    await run_in_threadpool(importer.flush)
+    return importer.summary()
+
+
 @router.get("/{content_id}", response_model=ContentOut)
 def get_content(
     content_id: int,
@@ -107,21 +402,21 @@ def get_content(
     content = db.get(ContentQueue, content_id)
     if not content:
         raise HTTPException(status_code=404, detail="Content not found")
+    # Rows written outside the ORM (raw SQL) are scored for the response
+    # only; score_unscored_content persists them, so a GET never writes
+    return _content_out(content, current_checklist(content))
 
-    return ContentOut(
-        id=content.id,
-        title=content.title,
-        content=content.body or "",
-        status=content.status,
-        site_id=content.site_id,
-        site_name=content.site.name,
-        created_at=content.created_at.isoformat() if content.created_at else "",
-        updated_at=content.updated_at.isoformat()
-        if content.updated_at
-        else content.created_at.isoformat()
-        if content.created_at
-        else "",
-    )
+
+@router.get("/{content_id}/checklist")
+def get_content_checklist(
+    content_id: int,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    content = db.get(ContentQueue, content_id)
+    if not content:
+        raise HTTPException(status_code=404, detail="Content not found")
+    return current_checklist(content)
 
 
 @router.put("/{content_id}", response_model=ContentOut)
@@ -145,20 +440,7 @@ def update_content_full(
     db.commit()
     db.refresh(content)
 
-    return ContentOut(
-        id=content.id,
-        title=content.title,
-        content=content.body or "",
-        status=content.status,
-        site_id=content.site_id,
-        site_name=content.site.name,
-        created_at=content.created_at.isoformat() if content.created_at else "",
-        updated_at=content.updated_at.isoformat()
-        if content.updated_at
-        else content.created_at.isoformat()
-        if content.created_at
-        else "",
-    )
+    return _content_out(content)
 
 
 @router.patch("/{content_id}", response_model=ContentOut)
@@ -182,20 +464,7 @@ def update_content(
     db.commit()
     db.refresh(content)
 
-    return ContentOut(
-        id=content.id,
-        title=content.title,
-        content=content.body or "",
-        status=content.status,
-        site_id=content.site_id,
-        site_name=content.site.name,
-        created_at=content.created_at.isoformat() if content.created_at else "",
-        updated_at=content.updated_at.isoformat()
-        if content.updated_at
-        else content.created_at.isoformat()
-        if content.created_at
-        else "",
-    )
+    return _content_out(content)
 
 
 @router.delete("/{content_id}")
@@ -231,6 +500,43 @@ def update_content_status(
     return {"message": "Status updated successfully"}
 
 
+class BulkStatusIn(BaseModel):
+    ids: list[int] = Field(..., min_length=1, max_length=1000)
+    status: str
+    note: Optional[str] = None
+
+
+class BulkStatusItem(BaseModel):
+    id: int
+    ok: bool
+    error: Optional[str] = None
+
+
+class BulkStatusOut(BaseModel):
+    updated: int
+    results: list[BulkStatusItem]
+
+
+@router.post("/bulk-status", response_model=BulkStatusOut)
+def bulk_update_content_status(
+    body: BulkStatusIn,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    if body.status not in ALLOWED_SOURCES:
+        raise HTTPException(status_code=400, detail="invalid_status")
+    outcomes = bulk_transition(db, body.ids, body.status, user.id, note=body.note)
+    results = [
+        BulkStatusItem(
+            id=content_id,
+            ok=outcome == "ok",
+            error=None if outcome == "ok" else outcome,
+        )
+        for content_id, outcome in outcomes.items()
+    ]
+    return BulkStatusOut(updated=sum(r.ok for r in results), results=results)
+
+
 class PublishIn(BaseModel):
     site_id: int
     title: str
@@ -238,38 +544,14 @@ class PublishIn(BaseModel):
     status: str = "draft"  # draft|publish
 
 
-class PublishOut(BaseModel):
-    ok: bool
+class PublishJobOut(BaseModel):
+    job_id: int
+    status: str  # queued|running|succeeded|failed
+    content_id: int | None = None
     post_id: int | None = None
     link: str | None = None
-    raw: dict | None = None
-
-
-def _checklist(title: str, body: str) -> dict:
-    issues: list[str] = []
-    warnings: list[str] = []
-    score = 100
-    if len(title.strip()) < 10:
-        issues.append("title_too_short(<10)")
-        score -= 20
-    if len(title.strip()) > 120:
-        warnings.append("title_too_long(>120)")
-        score -= 5
-    if len(body.strip()) < 200:
-        issues.append("content_too_short(<200)")
-        score -= 30
-    # simple heading check
-    has_heading = any(h in body for h in ["\n# ", "\n## ", "<h1", "<h2"])
-    if not has_heading:
-        warnings.append("no_headings_found")
-        score -= 10
-    # simple alt presence (for HTML img)
-    if "<img" in body and "alt=" not in body:
-        warnings.append("image_without_alt")
-        score -= 10
-    score = max(0, score)
-    passed = score >= 60 and not issues
-    return {"passed": passed, "score": score, "issues": issues, "warnings": warnings}
+    error: str | None = None
+    attempts: int = 0
 
 
 class ChecklistIn(BaseModel):
@@ -279,13 +561,119 @@ class ChecklistIn(BaseModel):
 
 @router.post("/checklist")
 def checklist_content(body: ChecklistIn):
-    report = _checklist(title=body.title or "", body=body.body or "")
+    report = checklist(title=body.title or "", body=body.body or "")
     return report
 
 
-@router.post("/{content_id}/publish", response_model=PublishOut)
+class ChecklistBatchItem(BaseModel):
+    id: Optional[int] = None
+    title: str
+    body: Optional[str] = None
+
+
+CHECKLIST_BATCH_MAX = 20000
+
+
+class ChecklistBatchIn(BaseModel):
+    items: list[ChecklistBatchItem] = Field(
+        default_factory=list, max_length=CHECKLIST_BATCH_MAX
+    )
+    # Alternatively score a site's queue straight from the database, one
+    # page of CHECKLIST_BATCH_MAX rows after ``after_id`` at a time
+    site_id: Optional[int] = None
+    status: str = "pending"
+    after_id: int = 0
+
+
+@router.post("/checklist/batch")
+def checklist_content_batch(
+    body: ChecklistBatchIn,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    next_after_id = None
+    if body.site_id is not None:
+        rows = db.execute(
+            select(ContentQueue.id, ContentQueue.title, ContentQueue.body)
+            .where(
+                ContentQueue.site_id == body.site_id,
+                ContentQueue.status == body.status,
+                ContentQueue.id > body.after_id,
+            )
+            .order_by(ContentQueue.id)
+            .limit(CHECKLIST_BATCH_MAX + 1)
+        ).all()
+        if len(rows) > CHECKLIST_BATCH_MAX:
+            rows = rows[:CHECKLIST_BATCH_MAX]
+            next_after_id = rows[-1].id
+        ids = [r.id for r in rows]
+        docs = [(r.title or "", r.body or "") for r in rows]
+    else:
+        ids = [item.id for item in body.items]
+        docs = [(item.title or "", item.body or "") for item in body.items]
+    reports = checklist_many(docs)
+    return {
+        "count": len(reports),
+        "results": [dict(report, id=i) for i, report in zip(ids, reports)],
+        "next_after_id": next_after_id,
+    }
+
+
+def _enqueue_publish(db: Session, key: str, **fields) -> PublishRequest:
+    """Queue ``publish_content_task`` once per idempotency key.
+
+    Repeating a key returns the existing job; only a failed job is requeued.
+    """
+    req = db.query(PublishRequest).filter(PublishRequest.idempotency_key == key).first()
+    if req is not None and req.status != "failed":
+        return req
+    if req is None:
+        req = PublishRequest(idempotency_key=key, status="queued", **fields)
+        db.add(req)
+        try:
+            db.commit()
+        except IntegrityError:
+            # Same key submitted concurrently: the other request queued it
+            db.rollback()
+            return (
+                db.query(PublishRequest)
+                .filter(PublishRequest.idempotency_key == key)
+                .one()
+            )
+    else:
+        req.status = "queued"
+        req.error = None
+        db.commit()
+    # Imported here so loading the API does not import the Celery task graph
+    from src.scheduler.tasks import publish_content_task
+
+    try:
+        req.task_id = publish_content_task.delay(req.id).id
+    except Exception as e:
+        req.status = "failed"
+        req.error = f"enqueue_failed: {e}"
+        db.commit()
+        raise HTTPException(status_code=503, detail="publish_queue_unavailable")
+    db.commit()
+    return req
+
+
+def _publish_job_out(req: PublishRequest) -> dict:
+    return {
+        "job_id": req.id,
+        "status": req.status,
+        "content_id": req.content_id,
+        "post_id": req.post_id,
+        "link": req.link,
+        "error": req.error,
+        "attempts": req.attempts or 0,
+    }
+
+
+@router.post("/{content_id}/publish", response_model=PublishJobOut, status_code=202)
 def publish_content(
     content_id: int,
+    idempotency_key: Optional[str] = Header(None, max_length=128),
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
@@ -297,63 +685,195 @@ def publish_content(
     if not site:
         raise HTTPException(status_code=404, detail="site_not_found")
 
-    report = _checklist(title=content.title or "", body=content.body or "")
+    report, changed = refresh_checklist(content)
+    if changed:
+        db.commit()
     if not report.get("passed"):
         raise HTTPException(status_code=400, detail={"checklist_failed": report})
 
-    creds = WordPressCredentials(
-        base_url=site.wp_url,
-        username=site.wp_username,
-        password=site.wp_password_enc,
+    # Default key: one job per content version, so double clicks and client
+    # retries share a job while an edited item can be published again
+    key = idempotency_key or f"content:{content.id}:{content.checklist_hash}"
+    req = _enqueue_publish(
+        db,
+        key,
+        content_id=content.id,
+        site_id=site.id,
+        wp_status="publish",
+        requested_by=user.id,
     )
-    client = WordPressClient(creds)
-    try:
-        result = client.create_post(
-            title=content.title, content=content.body or "", status="publish"
-        )
-        # Update content status to published
-        content.status = "published"
-        db.add(content)
-        db.commit()
+    return _publish_job_out(req)
+
+
+@router.get("/publish-jobs/{job_id}", response_model=PublishJobOut)
+def get_publish_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    req = db.get(PublishRequest, job_id)
+    if not req:
+        raise HTTPException(status_code=404, detail="publish_job_not_found")
+    return _publish_job_out(req)
 
-        return {
-            "ok": True,
-            "post_id": result.get("id"),
-            "link": result.get("link"),
-            "raw": result,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"wp_publish_failed: {e}")
 
+class PublishBatchIn(BaseModel):
+    ids: list[int] = Field(..., min_length=1, max_length=500)
 
-@router.post("/publish", response_model=PublishOut)
+
+class PublishBatchItem(BaseModel):
+    id: int
+    ok: bool
+    post_id: int | None = None
+    link: str | None = None
+    error: str | None = None
+
+
+class PublishBatchOut(BaseModel):
+    published: int
+    results: list[PublishBatchItem]
+
+
+@router.post("/publish-batch", response_model=PublishBatchOut)
+async def publish_content_batch(
+    body: PublishBatchIn,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    """Publish approved items concurrently (bounded per site and overall)."""
+    ids = list(dict.fromkeys(body.ids))
+
+    def _load() -> tuple[dict[int, str], list[PublishJob], dict[int, tuple]]:
+        """Validate the items and build their jobs from plain values: the
+        rescore commit expires the rows, and touching them afterwards on the
+        event loop would lazy-load each one with the sync session."""
+        rows = {
+            row.id: row
+            for row in db.query(ContentQueue)
+            .options(joinedload(ContentQueue.site))
+            .filter(ContentQueue.id.in_(ids))
+        }
+        changed = False
+        for row in rows.values():
+            changed |= refresh_checklist(row)[1]
+        # One indexed lookup for every title already on its site
+        hashes = {title_hash(row.title) for row in rows.values()}
+        mirrored = {
+            (r.site_id, r.title_hash): r.post_id
+            for r in db.query(RemotePost).filter(
+                RemotePost.site_id.in_({row.site_id for row in rows.values()}),
+                RemotePost.title_hash.in_(hashes),
+            )
+        }
+        errors: dict[int, str] = {}
+        jobs: list[PublishJob] = []
+        targets: dict[int, tuple] = {}  # id -> (site_id, title)
+        for content_id in ids:
+            row = rows.get(content_id)
+            remote_id = None
+            if row is not None:
+                remote_id = row.wp_post_id or mirrored.get(
+                    (row.site_id, title_hash(row.title))
+                )
+            if row is None:
+                errors[content_id] = "not_found"
+            elif row.site is None:
+                errors[content_id] = "site_not_found"
+            elif row.status != "approved":
+                errors[content_id] = f"invalid_from:{row.status}"
+            elif not row.checklist_passed:
+                errors[content_id] = "checklist_failed"
+            elif remote_id:
+                # Batch publishing only creates posts; the per-item endpoint
+                # updates an existing one
+                errors[content_id] = f"duplicate_remote_post:{remote_id}"
+            else:
+                targets[content_id] = (row.site_id, row.title)
+                jobs.append(
+                    PublishJob(
+                        key=content_id,
+                        creds=site_credentials(row.site),
+                        title=row.title,
+                        content=row.body or "",
+                    )
+                )
+        if changed:
+            db.commit()
+        return errors, jobs, targets
+
+    errors, jobs, targets = await run_in_threadpool(_load)
+    published = {r.key: r for r in await publish_many(jobs)}
+    ok_ids = [key for key, r in published.items() if r.ok]
+    if ok_ids:
+
+        def _mark_published() -> None:
+            bulk_transition(db, ok_ids, "published", user.id)
+            db.execute(
+                update(ContentQueue),
+                [
+                    {
+                        "id": key,
+                        "wp_post_id": published[key].post.get("id"),
+                        "wp_link": published[key].post.get("link"),
+                    }
+                    for key in ok_ids
+                ],
+            )
+            by_site: dict[int, list] = {}
+            for key in ok_ids:
+                site_id, title = targets[key]
+                by_site.setdefault(site_id, []).append((published[key].post, title))
+            for site_id, posts in by_site.items():
+                remember_posts(db, site_id, posts)
+            db.commit()
+
+        await run_in_threadpool(_mark_published)
+
+    results = []
+    for content_id in ids:
+        r = published.get(content_id)
+        if r is not None and r.ok:
+            results.append(
+                PublishBatchItem(
+                    id=content_id,
+                    ok=True,
+                    post_id=r.post.get("id"),
+                    link=r.post.get("link"),
+                )
+            )
+        else:
+            error = r.error if r is not None else errors[content_id]
+            results.append(PublishBatchItem(id=content_id, ok=False, error=error))
+    return PublishBatchOut(published=len(ok_ids), results=results)
+
+
+@router.post("/publish", response_model=PublishJobOut, status_code=202)
 def publish_content_direct(
     body: PublishIn = Body(...),
+    idempotency_key: Optional[str] = Header(None, max_length=128),
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
     site: Site | None = db.get(Site, body.site_id)
     if not site:
         raise HTTPException(status_code=404, detail="site_not_found")
-    report = _checklist(title=body.title or "", body=body.body or "")
+    report = checklist(title=body.title or "", body=body.body or "")
     if not report.get("passed"):
         raise HTTPException(status_code=400, detail={"checklist_failed": report})
-    creds = WordPressCredentials(
-        base_url=site.wp_url,
-        username=site.wp_username,
-        password=site.wp_password_enc,
+    if not idempotency_key:
+        digest = hashlib.sha256(
+            "\0".join(
+                [str(site.id), body.title, body.body or "", body.status]
+            ).encode("utf-8")
+        ).hexdigest()
+        idempotency_key = f"direct:{digest}"
+    req = _enqueue_publish(
+        db,
+        idempotency_key,
+        site_id=site.id,
+        title=body.title,
+        body=body.body or "",
+        wp_status=body.status,
+        requested_by=user.id,
     )
-    client = WordPressClient(creds)
-    try:
-        result = client.create_post(
-            title=body.title, content=body.body or "", status=body.status
-        )
-        # result typically has 'id' and 'link'
-        return {
-            "ok": True,
-            "post_id": result.get("id"),
-            "link": result.get("link"),
-            "raw": result,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"wp_publish_failed: {e}")
+    return _publish_job_out(req)
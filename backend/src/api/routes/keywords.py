@@ -5,6 +5,7 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from src.api.deps.auth import get_current_user, get_db
 from src.database.models import Keyword, Site
+from src.database.queries import keyword_list_query
 
 
 class KeywordIn(BaseModel):
@@ -47,7 +48,7 @@ def list_keywords(
     status: Optional[str] = Query(None),
     category: Optional[str] = Query(None),
 ):
-    query = db.query(Keyword).join(Site)
+    query = keyword_list_query(db)
 
     if q:
         query = query.filter(Keyword.keyword.contains(q))
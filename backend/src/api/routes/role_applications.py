@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from src.api.deps.auth import get_current_user, get_db
 from src.api.middleware.permissions import require_permission
 from src.database.models import User, Role, RoleApplication
+from src.database.queries import role_application_list_query
 
 
 router = APIRouter(prefix="/api/role-applications", tags=["role-applications"])
@@ -43,7 +44,7 @@ def list_applications(
     db: Session = Depends(get_db)
 ):
     """List all role applications (admin only)"""
-    applications = db.query(RoleApplication).order_by(RoleApplication.created_at.desc()).all()
+    applications = role_application_list_query(db).order_by(RoleApplication.created_at.desc()).all()
     
     return [
         RoleApplicationOut(
@@ -67,7 +68,7 @@ def get_my_applications(
     db: Session = Depends(get_db)
 ):
     """Get current user's role applications"""
-    applications = db.query(RoleApplication).filter(
+    applications = role_application_list_query(db).filter(
         RoleApplication.user_id == current_user.id
     ).order_by(RoleApplication.created_at.desc()).all()
     
@@ -1,21 +1,47 @@
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from src.api.deps.auth import get_current_user
-from src.scheduler.tasks import generate_draft_for_site
+
+# src.scheduler.* is imported inside the handlers: loading the API should not
+# pull in Celery, its signal handlers and the task modules
 
 router = APIRouter(prefix="/scheduler", tags=["scheduler"])
 
 
 class RunDraftNowIn(BaseModel):
     site_id: int
+    count: int = Field(1, ge=1, le=100)  # >1: one task, one bulk insert
     sync: bool = False  # for quick local test, run inline instead of celery
 
 
 @router.post("/run-draft-now")
 def run_draft_now(body: RunDraftNowIn, user=Depends(get_current_user)):
+    from src.scheduler.tasks import generate_draft_for_site, generate_drafts
+
+    if body.count > 1:
+        if body.sync:
+            draft_ids = generate_drafts(body.site_id, body.count)
+            return {"ok": True, "mode": "sync", "draft_ids": draft_ids}
+        async_result = generate_drafts.delay(body.site_id, body.count)
+        return {"ok": True, "mode": "async", "task_id": async_result.id}
     if body.sync:
         draft_id = generate_draft_for_site(body.site_id)
         return {"ok": True, "mode": "sync", "draft_id": draft_id}
     # async via celery
     async_result = generate_draft_for_site.delay(body.site_id)
     return {"ok": True, "mode": "async", "task_id": async_result.id}
+
+
+@router.get("/metrics")
+def task_metrics(user=Depends(get_current_user)):
+    """Per-task queue wait/runtime histograms and outcome counts recorded by
+    the workers, plus the number of messages waiting in each queue."""
+    from src.scheduler import metrics
+    from src.scheduler.celery_app import PRIORITY_SEP, PRIORITY_STEPS, app, queue_names
+
+    return {
+        "tasks": metrics.metrics.snapshot(),
+        "queues": metrics.queue_lengths(
+            app.conf.broker_url, queue_names(), PRIORITY_STEPS, PRIORITY_SEP
+        ),
+    }
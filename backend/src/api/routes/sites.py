@@ -1,9 +1,20 @@
+from datetime import datetime
+
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from sqlalchemy import update
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from src.api.deps.auth import get_current_user, get_db
 from src.api.middleware.permissions import require_permission
-from src.core.wordpress_client import WordPressClient, WordPressCredentials
+from src.core.remote_posts import sync_site
+from src.core.site_limits import SiteUnavailableError, guard, site_key
+from src.core.wordpress_client import (
+    WordPressClient,
+    check_many,
+    connection_stats,
+    site_credentials,
+)
 from src.database.models import Site, User
 
 
@@ -20,6 +31,12 @@ class SiteOut(SiteIn):
     daily_quota: int | None = None
     active_start_hour: int | None = None
     active_end_hour: int | None = None
+    # Cached result of the last connectivity check
+    health_ok: bool | None = None
+    health_status_code: int | None = None
+    health_latency_ms: int | None = None
+    health_error: str | None = None
+    health_checked_at: str | None = None
 
 
 class SiteUpdate(BaseModel):
@@ -32,6 +49,19 @@ class SiteUpdate(BaseModel):
 
 router = APIRouter(prefix="/api/sites", tags=["sites"])
 
+HEALTH_ERROR_CHARS = 500
+
+
+def _site_health(site: Site) -> dict:
+    checked_at = site.health_checked_at
+    return {
+        "health_ok": site.health_ok,
+        "health_status_code": site.health_status_code,
+        "health_latency_ms": site.health_latency_ms,
+        "health_error": site.health_error,
+        "health_checked_at": checked_at.isoformat() if checked_at else None,
+    }
+
 
 @router.get("/", response_model=list[SiteOut])
 def list_sites(db: Session = Depends(get_db), user: User = Depends(require_permission("sites.view"))):
@@ -48,6 +78,7 @@ def list_sites(db: Session = Depends(get_db), user: User = Depends(require_permi
                 "daily_quota": getattr(r, "daily_quota", None),
                 "active_start_hour": getattr(r, "active_start_hour", None),
                 "active_end_hour": getattr(r, "active_end_hour", None),
+                **_site_health(r),
             }
         )
         for r in records
@@ -67,6 +98,78 @@ def create_site(
     return body
 
 
+@router.get("/connection-stats")
+def get_connection_stats(user: User = Depends(require_permission("sites.view"))):
+    """Pooled WordPress connection reuse for this API process"""
+    return connection_stats()
+
+
+class BreakerOut(BaseModel):
+    site_id: int
+    name: str
+    wp_url: str
+    state: str  # closed|open|half_open
+    failures: int
+    retry_in: float
+
+
+@router.get("/breakers", response_model=list[BreakerOut])
+def get_breakers(
+    db: Session = Depends(get_db), user: User = Depends(require_permission("sites.view"))
+):
+    """Circuit breaker state per site, shared by the API, workers and bot"""
+    sites = db.query(Site).order_by(Site.id).all()
+    states = guard.breaker_states(s.wp_url for s in sites)
+    return [
+        BreakerOut(
+            site_id=s.id, name=s.name, wp_url=s.wp_url, **states[site_key(s.wp_url)]
+        )
+        for s in sites
+    ]
+
+
+@router.post("/{site_id}/breaker/reset", response_model=BreakerOut)
+def reset_breaker(
+    site_id: int,
+    db: Session = Depends(get_db),
+    user: User = Depends(require_permission("sites.update")),
+):
+    site = db.get(Site, site_id)
+    if not site:
+        from fastapi import HTTPException
+
+        raise HTTPException(status_code=404, detail="Site not found")
+    guard.reset(site.wp_url)
+    state = guard.breaker_states([site.wp_url])[site_key(site.wp_url)]
+    return BreakerOut(site_id=site.id, name=site.name, wp_url=site.wp_url, **state)
+
+
+class RemotePostsSyncIn(BaseModel):
+    full: bool = False  # ignore the cursor and re-read every post
+    sync: bool = False  # for quick local test, run inline instead of celery
+
+
+@router.post("/{site_id}/remote-posts/sync")
+def sync_site_remote_posts(
+    site_id: int,
+    body: RemotePostsSyncIn,
+    db: Session = Depends(get_db),
+    user: User = Depends(require_permission("sites.update")),
+):
+    site = db.get(Site, site_id)
+    if not site:
+        from fastapi import HTTPException
+
+        raise HTTPException(status_code=404, detail="Site not found")
+    if body.sync:
+        synced = sync_site(db, site, WordPressClient(site_credentials(site)), full=body.full)
+        return {"ok": True, "mode": "sync", "synced": synced}
+    from src.scheduler.tasks import sync_remote_posts
+
+    async_result = sync_remote_posts.delay(site.id, full=body.full)
+    return {"ok": True, "mode": "async", "task_id": async_result.id}
+
+
 @router.get("/{site_id}", response_model=SiteOut)
 def get_site(
     site_id: int,
@@ -90,6 +193,7 @@ def get_site(
             "daily_quota": getattr(site, "daily_quota", None),
             "active_start_hour": getattr(site, "active_start_hour", None),
             "active_end_hour": getattr(site, "active_end_hour", None),
+            **_site_health(site),
         }
     )
 
@@ -198,27 +302,129 @@ class TestConnectionOut(BaseModel):
 
 @router.post("/{site_id}/test-connection", response_model=TestConnectionOut)
 def test_site_connection(
-    site_id: int, db: Session = Depends(get_db), user: User = Depends(require_permission("sites.view"))
+    site_id: int,
+    db: Session = Depends(get_db),
+    user: User = Depends(require_permission("sites.update")),
 ):
     site = db.get(Site, site_id)
     if not site:
         from fastapi import HTTPException
 
         raise HTTPException(status_code=404, detail="Site not found")
-    # Normalize URL to include scheme
-    wp_url = site.wp_url.strip()
-    if not (wp_url.startswith("http://") or wp_url.startswith("https://")):
-        wp_url = "https://" + wp_url
-    creds = WordPressCredentials(
-        base_url=wp_url,
-        username=site.wp_username,
-        password=site.wp_password_enc,
-    )
+    creds = site_credentials(site)
+    site.health_checked_at = datetime.utcnow()
+    site.health_status_code = site.health_latency_ms = None
     try:
         client = WordPressClient(creds)
         ok = client.test_connection()
+        site.health_ok, site.health_error = ok, None
         return TestConnectionOut(ok=ok)
+    except SiteUnavailableError as e:
+        from fastapi import HTTPException
+
+        site.health_ok, site.health_error = False, str(e)[:HEALTH_ERROR_CHARS]
+        raise HTTPException(
+            status_code=503,
+            detail=f"wp_connection_failed: {e}",
+            headers={"Retry-After": str(int(e.retry_in) + 1)},
+        )
     except Exception as e:
         from fastapi import HTTPException
 
+        site.health_ok, site.health_error = False, str(e)[:HEALTH_ERROR_CHARS]
         raise HTTPException(status_code=400, detail=f"wp_connection_failed: {e}")
+    finally:
+        db.commit()
+
+
+class TestConnectionsIn(BaseModel):
+    # Defaults to every site; narrow with ids and/or the auto-publish flag
+    site_ids: list[int] | None = Field(None, max_length=5000)
+    is_auto_enabled: bool | None = None
+    max_concurrency: int | None = Field(None, ge=1, le=200)
+
+
+class SiteHealthOut(BaseModel):
+    site_id: int
+    name: str
+    ok: bool
+    status_code: int | None = None
+    latency_ms: int | None = None
+    error: str | None = None
+    checked_at: str
+
+
+class TestConnectionsOut(BaseModel):
+    checked: int
+    ok: int
+    failed: int
+    duration_ms: int
+    results: list[SiteHealthOut]
+
+
+@router.post("/test-connections", response_model=TestConnectionsOut)
+async def test_site_connections(
+    body: TestConnectionsIn,
+    db: Session = Depends(get_db),
+    user: User = Depends(require_permission("sites.update")),
+):
+    """Check many sites concurrently and cache each result on the site."""
+
+    def _load() -> list[tuple]:
+        query = db.query(Site)
+        if body.site_ids is not None:
+            query = query.filter(Site.id.in_(body.site_ids))
+        if body.is_auto_enabled is not None:
+            query = query.filter(Site.is_auto_enabled == body.is_auto_enabled)
+        # Plain values: _store's commit expires the instances, and touching
+        # them afterwards would lazy-load each site on the event loop
+        return [(s.id, s.name, site_credentials(s)) for s in query.order_by(Site.id)]
+
+    sites = await run_in_threadpool(_load)
+    started = datetime.utcnow()
+    results = await check_many(
+        [(site_id, creds) for site_id, _, creds in sites],
+        max_concurrency=body.max_concurrency,
+    )
+    checked_at = datetime.utcnow()
+
+    def _store() -> None:
+        if not results:
+            return
+        db.execute(
+            update(Site),
+            [
+                {
+                    "id": r.key,
+                    "health_ok": r.ok,
+                    "health_status_code": r.status_code,
+                    "health_latency_ms": r.latency_ms,
+                    "health_error": r.error and r.error[:HEALTH_ERROR_CHARS],
+                    "health_checked_at": checked_at,
+                }
+                for r in results
+            ],
+        )
+        db.commit()
+
+    await run_in_threadpool(_store)
+    names = {site_id: name for site_id, name, _ in sites}
+    ok = sum(r.ok for r in results)
+    return TestConnectionsOut(
+        checked=len(results),
+        ok=ok,
+        failed=len(results) - ok,
+        duration_ms=int((checked_at - started).total_seconds() * 1000),
+        results=[
+            SiteHealthOut(
+                site_id=r.key,
+                name=names[r.key],
+                ok=r.ok,
+                status_code=r.status_code,
+                latency_ms=r.latency_ms,
+                error=r.error,
+                checked_at=checked_at.isoformat(),
+            )
+            for r in results
+        ],
+    )
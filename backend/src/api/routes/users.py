@@ -7,6 +7,7 @@ from src.api.deps.auth import get_current_user, get_db
 from src.api.middleware.permissions import require_admin, require_user_management_permission, require_permission
 from src.core.permissions import can_manage_user
 from src.database.models import User, Role
+from src.database.queries import user_list_query
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
@@ -43,7 +44,7 @@ def list_users(
     db: Session = Depends(get_db)
 ):
     """List all users with their roles"""
-    users = db.query(User).all()
+    users = user_list_query(db).all()
     return [
         UserOut(
             id=user.id,
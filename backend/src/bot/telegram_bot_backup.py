@@ -17,7 +17,10 @@ except Exception:  # pragma: no cover
     except Exception:
         ParseMode = None  # type: ignore
         PARSE_MODE_HTML = "HTML"
+from src.core.content_status import bulk_transition
 from src.database.models import AuditLog, ContentQueue, Site, TelegramAdmin
+from src.database.search import search_content
+from src.database.stats import status_counts
 from src.database.session import SessionLocal
 from telegram.ext import (
     Application,
@@ -200,39 +203,28 @@ def _fetch_by_status(
 
 def _get_available_statuses(site_id: int) -> list[str]:
     """Tìm trạng thái có dữ liệu cho site"""
-    db = SessionLocal()
-    try:
-        statuses = []
-        for status in ["pending", "approved", "rejected"]:
-            count = (
-                db.query(ContentQueue)
-                .filter(ContentQueue.site_id == site_id, ContentQueue.status == status)
-                .count()
-            )
-            if count > 0:
-                statuses.append(status)
-        return statuses
-    finally:
-        db.close()
+    counts = _get_status_counts(site_id)
+    return [s for s in ["pending", "approved", "rejected"] if counts[s] > 0]
 
 
 def _get_status_counts(site_id: int) -> dict[str, int]:
     """Lấy số lượng bài theo từng trạng thái"""
     db = SessionLocal()
     try:
-        counts = {}
-        for status in ["pending", "approved", "rejected", "published"]:
-            count = (
-                db.query(ContentQueue)
-                .filter(ContentQueue.site_id == site_id, ContentQueue.status == status)
-                .count()
-            )
-            counts[status] = count
-        return counts
+        return _pick_status_counts(status_counts(db, [site_id]), site_id)
     finally:
         db.close()
 
 
+def _pick_status_counts(
+    all_counts: dict[int, dict[str, int]], site_id: int
+) -> dict[str, int]:
+    per_site = all_counts.get(site_id, {})
+    return {
+        s: per_site.get(s, 0) for s in ["pending", "approved", "rejected", "published"]
+    }
+
+
 async def _send_queue_overview(bot, chat_id: int, site_id: int) -> None:
     """Hiển thị tổng quan tất cả trạng thái"""
     db = SessionLocal()
@@ -478,6 +470,20 @@ async def cmd_publish(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         db.close()
 
 
+def _bulk_apply(
+    db: SessionLocal,
+    rows: list[ContentQueue],
+    target: str,
+    actor_user_id: int,
+    note: str | None = None,
+) -> int:
+    """Chuyển trạng thái nhiều bài trong một UPDATE, trả về số bài thành công"""
+    outcomes = bulk_transition(
+        db, [r.id for r in rows], target, actor_user_id, note=note
+    )
+    return sum(1 for outcome in outcomes.values() if outcome == "ok")
+
+
 def _approve_item(
     db: SessionLocal, content_id: int, actor_user_id: int
 ) -> tuple[bool, str]:
@@ -894,11 +900,7 @@ async def on_action_button(update: Update, context: ContextTypes.DEFAULT_TYPE) -
                 return
             if action == "bulk_approve":
                 rows = _fetch_by_status(site_id, "pending", offset, count)
-                ok_count = 0
-                for r in rows:
-                    ok, _ = _approve_item(db, r.id, query.from_user.id)
-                    if ok:
-                        ok_count += 1
+                ok_count = _bulk_apply(db, rows, "approved", query.from_user.id)
                 await query.edit_message_text(
                     f"✅ Đã approve {ok_count}/{count} mục.",
                     reply_markup=InlineKeyboardMarkup(
@@ -965,11 +967,7 @@ async def on_action_button(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             }
             reason = reason_map.get(reason_key, reason_key)
             rows = _fetch_by_status(site_id, "pending", offset, count)
-            rej = 0
-            for r in rows:
-                ok, _ = _reject_item(db, r.id, query.from_user.id, reason)
-                if ok:
-                    rej += 1
+            rej = _bulk_apply(db, rows, "rejected", query.from_user.id, note=reason)
             await query.edit_message_text(
                 f"🛑 Đã reject {rej}/{count} mục. Lý do: {reason or 'n/a'}",
                 reply_markup=InlineKeyboardMarkup(
@@ -995,11 +993,7 @@ async def on_action_button(update: Update, context: ContextTypes.DEFAULT_TYPE) -
                 await query.edit_message_text("❌ Tham số bulk publish không hợp lệ.")
                 return
             rows = _fetch_by_status(site_id, "approved", offset, count)
-            pub = 0
-            for r in rows:
-                ok, _ = _publish_item(db, r.id, query.from_user.id)
-                if ok:
-                    pub += 1
+            pub = _bulk_apply(db, rows, "published", query.from_user.id)
             await query.edit_message_text(
                 f"📢 Đã publish {pub}/{count} mục (Approved).",
                 reply_markup=InlineKeyboardMarkup(
@@ -1029,11 +1023,7 @@ async def on_action_button(update: Update, context: ContextTypes.DEFAULT_TYPE) -
                 f"bulk_status_{query.from_user.id}", "pending"
             )
             rows = _fetch_by_status(site_id, status, offset, count)
-            ok_count = 0
-            for r in rows:
-                ok, _ = _approve_item(db, r.id, query.from_user.id)
-                if ok:
-                    ok_count += 1
+            ok_count = _bulk_apply(db, rows, "approved", query.from_user.id)
             await query.edit_message_text(
                 f"✅ Đã approve {ok_count}/{count} mục.",
                 reply_markup=InlineKeyboardMarkup(
@@ -1102,11 +1092,7 @@ async def on_action_button(update: Update, context: ContextTypes.DEFAULT_TYPE) -
                 f"bulk_status_{query.from_user.id}", "approved"
             )
             rows = _fetch_by_status(site_id, status, offset, count)
-            pub = 0
-            for r in rows:
-                ok, _ = _publish_item(db, r.id, query.from_user.id)
-                if ok:
-                    pub += 1
+            pub = _bulk_apply(db, rows, "published", query.from_user.id)
             await query.edit_message_text(
                 f"📢 Đã publish {pub}/{count} mục (Approved).",
                 reply_markup=InlineKeyboardMarkup(
@@ -1146,11 +1132,7 @@ async def on_action_button(update: Update, context: ContextTypes.DEFAULT_TYPE) -
                 f"bulk_status_{query.from_user.id}", "pending"
             )
             rows = _fetch_by_status(site_id, status, offset, count)
-            rej = 0
-            for r in rows:
-                ok, _ = _reject_item(db, r.id, query.from_user.id, reason)
-                if ok:
-                    rej += 1
+            rej = _bulk_apply(db, rows, "rejected", query.from_user.id, note=reason)
             await query.edit_message_text(
                 f"🛑 Đã reject {rej}/{count} mục. Lý do: {reason or 'n/a'}",
                 reply_markup=InlineKeyboardMarkup(
@@ -1329,20 +1311,7 @@ async def cmd_find(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     keyword = " ".join(args)
     db = SessionLocal()
     try:
-        from sqlalchemy import or_
-
-        rows = (
-            db.query(ContentQueue)
-            .filter(
-                or_(
-                    ContentQueue.title.ilike(f"%{keyword}%"),
-                    ContentQueue.body.ilike(f"%{keyword}%"),
-                )
-            )
-            .order_by(ContentQueue.id.desc())
-            .limit(10)
-            .all()
-        )
+        rows = [row for row, _ in search_content(db, keyword, limit=10)]
         if not rows:
             await update.message.reply_text("🔍 Không tìm thấy nội dung phù hợp.")
             return
@@ -1378,8 +1347,10 @@ async def cmd_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         total_counts = {"pending": 0, "approved": 0, "rejected": 0, "published": 0}
         site_lines = []
 
+        # Một truy vấn GROUP BY cho tất cả sites thay vì 4 COUNT mỗi site
+        all_counts = status_counts(db)
         for site in sites:
-            counts = _get_status_counts(site.id)
+            counts = _pick_status_counts(all_counts, site.id)
             site_total = sum(counts.values())
 
             # Update totals
@@ -1671,9 +1642,10 @@ async def cmd_sites(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         header = "🌐 <b>Danh sách Sites</b>\n\n"
 
         site_lines = []
+        all_counts = status_counts(db)
         for site in sites:
             # Get content counts
-            counts = _get_status_counts(site.id)
+            counts = _pick_status_counts(all_counts, site.id)
             total = sum(counts.values())
 
             # Status indicators
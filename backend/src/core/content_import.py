@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+from src.core.content_status import CONTENT_STATUSES
+from src.core.seo_checklist import checklist_columns
+from src.database.models import ContentQueue, Site
+
+CHUNK_ROWS = 1000
+MAX_LINE_BYTES = 1 << 20
+MAX_REPORTED_ERRORS = 100
+
+COPY_COLUMNS = (
+    "site_id",
+    "title",
+    "body",
+    "status",
+    "created_at",
+    "updated_at",
+    "checklist_hash",
+    "checklist_score",
+    "checklist_passed",
+    "checklist_report",
+)
+COPY_SQL = (
+    f"COPY content_queue ({', '.join(COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+)
+
+
+class ImportRow(BaseModel):
+    site_id: Optional[int] = None
+    title: str = Field(..., min_length=1, max_length=500)
+    body: str = ""
+    status: str = "pending"
+
+    @field_validator("body", mode="before")
+    @classmethod
+    def _empty_body(cls, value: Optional[str]) -> str:
+        # Exports write null for an empty body
+        return "" if value is None else value
+
+    @field_validator("status")
+    @classmethod
+    def _known_status(cls, value: str) -> str:
+        if value not in CONTENT_STATUSES:
+            raise ValueError(f"unknown status: {value}")
+        return value
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, bytes | None]]:
+    """Split a byte stream into ``(line_no, line)`` without buffering the body.
+
+    Lines longer than ``MAX_LINE_BYTES`` are yielded as ``None`` so memory
+    stays bounded by one line plus one network chunk.
+    """
+    buffer = b""
+    line_no = 0
+    oversized = False
+    async for chunk in chunks:
+        buffer += chunk
+        while True:
+            newline = buffer.find(b"\n")
+            if newline < 0:
+                break
+            line, buffer = buffer[:newline], buffer[newline + 1 :]
+            line_no += 1
+            yield line_no, None if oversized else line
+            oversized = False
+        if len(buffer) > MAX_LINE_BYTES:
+            buffer = b""
+            oversized = True
+    if buffer or oversized:
+        yield line_no + 1, None if oversized else buffer
+
+
+class ContentImporter:
+    """Validate NDJSON lines and write them to ``content_queue`` in chunks."""
+
+    def __init__(self, db: Session, default_site_id: Optional[int] = None) -> None:
+        self.db = db
+        self.default_site_id = default_site_id
+        self.accepted = 0
+        self.rejected = 0
+        self.errors: list[dict] = []
+        self._known_sites: set[int] = set()
+        self._pending: list[tuple[int, ImportRow]] = []
+
+    @property
+    def full(self) -> bool:
+        return len(self._pending) >= CHUNK_ROWS
+
+    def add(self, line_no: int, raw: bytes | None) -> None:
+        if raw is None:
+            self._reject(line_no, "line_too_long")
+            return
+        raw = raw.strip()
+        if not raw:
+            return
+        try:
+            row = ImportRow.model_validate(json.loads(raw))
+        except (ValueError, ValidationError) as e:
+            # ValidationError is a ValueError; keep the first message only
+            message = e.errors()[0]["msg"] if isinstance(e, ValidationError) else str(e)
+            self._reject(line_no, f"invalid: {message}")
+            return
+        if row.site_id is None:
+            row.site_id = self.default_site_id
+        if row.site_id is None:
+            self._reject(line_no, "site_id_required")
+            return
+        self._pending.append((line_no, row))
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+
+        unknown = {row.site_id for _, row in batch} - self._known_sites
+        if unknown:
+            found = self.db.execute(select(Site.id).where(Site.id.in_(unknown)))
+            self._known_sites.update(found.scalars())
+
+        now = datetime.utcnow()
+        values = []
+        lines = []
+        for line_no, row in batch:
+            if row.site_id not in self._known_sites:
+                self._reject(line_no, "site_not_found")
+                continue
+            lines.append(line_no)
+            values.append(
+                {
+                    "site_id": row.site_id,
+                    "title": row.title,
+                    "body": row.body,
+                    "status": row.status,
+                    "created_at": now,
+                    "updated_at": now,
+                    **checklist_columns(row.title, row.body),
+                }
+            )
+        if not values:
+            return
+        try:
+            if self.db.bind.dialect.name == "postgresql":
+                self._copy(values)
+            else:
+                self.db.execute(insert(ContentQueue), values)
+            self.db.commit()
+        except Exception as e:
+            # Earlier chunks are committed: report this one and carry on, so
+            # the summary says exactly which lines were not written
+            self.db.rollback()
+            message = (str(e).splitlines() or [type(e).__name__])[0][:200]
+            self.rejected += len(values)
+            if len(self.errors) < MAX_REPORTED_ERRORS:
+                self.errors.append(
+                    {
+                        "line": lines[0],
+                        "last_line": lines[-1],
+                        "error": f"write_failed: {message}",
+                    }
+                )
+            return
+        self.accepted += len(values)
+
+    def _copy(self, values: list[dict]) -> None:
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for v in values:
+            writer.writerow(
+                [
+                    v[c].isoformat() if isinstance(v[c], datetime) else v[c]
+                    for c in COPY_COLUMNS
+                ]
+            )
+        buf.seek(0)
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(COPY_SQL, buf)
+        finally:
+            cursor.close()
+
+    def _reject(self, line_no: int, error: str) -> None:
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line_no, "error": error})
+
+    def summary(self) -> dict:
+        return {
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "errors": self.errors,
+        }
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import ARRAY, Integer, any_, bindparam, insert, select, update
+from sqlalchemy.orm import Session
+from src.database.models import AuditLog, ContentQueue
+
+CONTENT_STATUSES = ("pending", "approved", "rejected", "published")
+
+# target status -> statuses it may be reached from
+ALLOWED_SOURCES: dict[str, tuple[str, ...]] = {
+    "pending": ("approved", "rejected"),
+    "approved": ("pending", "rejected"),
+    "rejected": ("pending", "approved"),
+    "published": ("approved",),
+}
+
+AUDIT_ACTIONS = {
+    "pending": "setstatus",
+    "approved": "approve",
+    "rejected": "reject",
+    "published": "publish",
+}
+
+
+def bulk_transition(
+    db: Session,
+    ids: Iterable[int],
+    target: str,
+    actor_user_id: int,
+    note: Optional[str] = None,
+) -> dict[int, str]:
+    """Move every id in ``ids`` to ``target`` in one conditional UPDATE.
+
+    Only rows currently in ``ALLOWED_SOURCES[target]`` change. Matching
+    audit log rows are inserted in the same transaction. Returns a map of
+    id -> outcome: ``"ok"``, ``"not_found"`` or ``"invalid_from:<status>"``.
+    """
+    if target not in ALLOWED_SOURCES:
+        raise ValueError(f"unknown status: {target}")
+    ids = list(dict.fromkeys(int(i) for i in ids))
+    if not ids:
+        return {}
+
+    if db.bind.dialect.name == "postgresql":
+        # One array parameter keeps the statement (and its plan) stable
+        id_match = ContentQueue.id == any_(bindparam("ids", ids, type_=ARRAY(Integer)))
+    else:
+        id_match = ContentQueue.id.in_(ids)
+    now = datetime.utcnow()
+    stmt = (
+        update(ContentQueue)
+        .where(id_match, ContentQueue.status.in_(ALLOWED_SOURCES[target]))
+        .values(status=target, updated_at=now)
+        .returning(ContentQueue.id)
+        .execution_options(synchronize_session=False)
+    )
+    updated = set(db.execute(stmt).scalars())
+
+    if updated:
+        db.execute(
+            insert(AuditLog),
+            [
+                {
+                    "actor_user_id": actor_user_id,
+                    "action": AUDIT_ACTIONS[target],
+                    "target_type": "content_queue",
+                    "target_id": content_id,
+                    "note": note,
+                    "created_at": now,
+                }
+                for content_id in ids
+                if content_id in updated
+            ],
+        )
+    db.commit()
+
+    outcomes = {content_id: "ok" for content_id in ids if content_id in updated}
+    skipped = [content_id for content_id in ids if content_id not in updated]
+    if skipped:
+        current = dict(
+            db.execute(
+                select(ContentQueue.id, ContentQueue.status).where(
+                    ContentQueue.id.in_(skipped)
+                )
+            ).all()
+        )
+        for content_id in skipped:
+            outcomes[content_id] = (
+                f"invalid_from:{current[content_id]}"
+                if content_id in current
+                else "not_found"
+            )
+    return {content_id: outcomes[content_id] for content_id in ids}
@@ -0,0 +1,134 @@
+"""Incremental local mirror of each site's WordPress posts.
+
+Only id, slug, a hash of the title and the modification time are kept, so
+publishing can check for an existing post with one indexed lookup instead
+of searching the remote site.
+"""
+
+import hashlib
+import html
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Optional
+
+from sqlalchemy.orm import Session
+from src.core.wordpress_client import WordPressClient
+from src.database.models import RemotePost, Site
+
+SYNC_PER_PAGE = 100
+# WordPress compares `modified` to the second; re-read that second so posts
+# sharing it with the last page are not skipped (upserts make this harmless)
+SYNC_OVERLAP = timedelta(seconds=1)
+
+_QUOTES = str.maketrans({"‘": "'", "’": "'", "“": '"', "”": '"'})
+
+
+def title_hash(title: str) -> str:
+    """Hash of a title as WordPress may echo it back: entities decoded,
+    typographic quotes straightened, whitespace and case folded."""
+    text = html.unescape(title or "").translate(_QUOTES)
+    text = " ".join(text.split()).casefold()
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _post_title(post: dict[str, Any]) -> str:
+    title = post.get("title") or ""
+    if isinstance(title, dict):  # {"raw": ..., "rendered": ...}
+        title = title.get("raw") or title.get("rendered") or ""
+    return title
+
+
+def _modified(post: dict[str, Any]) -> Optional[datetime]:
+    value = post.get("modified")
+    return datetime.fromisoformat(value.rstrip("Z")) if value else None
+
+
+def _upsert(db: Session, rows: list[dict]) -> None:
+    if not rows:
+        return
+    dialect = db.bind.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(RemotePost)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["site_id", "post_id"],
+            set_={
+                "slug": stmt.excluded.slug,
+                "title_hash": stmt.excluded.title_hash,
+                "modified": stmt.excluded.modified,
+            },
+        )
+        db.execute(stmt, rows)
+    else:
+        for row in rows:
+            db.merge(RemotePost(**row))
+
+
+def _mirror_row(site_id: int, post: dict[str, Any], title: str) -> dict:
+    return {
+        "site_id": site_id,
+        "post_id": post["id"],
+        "slug": (post.get("slug") or "")[:200],
+        "title_hash": title_hash(title),
+        "modified": _modified(post),
+    }
+
+
+def remember_posts(
+    db: Session, site_id: int, posts: Iterable[tuple[dict[str, Any], str]]
+) -> None:
+    """Mirror posts we just created or updated, as ``(response, title sent)``,
+    so duplicate checks see them before the next sync. Caller commits."""
+    _upsert(db, [_mirror_row(site_id, post, title) for post, title in posts])
+
+
+def find_duplicates(db: Session, site_id: int, title: str) -> list[int]:
+    """Ids of the site's mirrored posts with this title, oldest first."""
+    return [
+        post_id
+        for (post_id,) in db.query(RemotePost.post_id)
+        .filter(
+            RemotePost.site_id == site_id,
+            RemotePost.title_hash == title_hash(title),
+        )
+        .order_by(RemotePost.post_id)
+    ]
+
+
+def sync_site(
+    db: Session, site: Site, client: WordPressClient, full: bool = False
+) -> int:
+    """Pull posts modified since the site's cursor into the mirror.
+
+    Pages are keyed on ``modified`` rather than page numbers, so posts
+    edited during the sync cannot shift others past a page boundary.
+    Commits after every page; returns the number of posts read.
+    """
+    cursor = None if full else site.remote_posts_cursor
+    after = cursor - SYNC_OVERLAP if cursor else None
+    page = 1
+    synced = 0
+    while True:
+        posts, _ = client.list_posts(
+            modified_after=after.isoformat() if after else None,
+            page=page,
+            per_page=SYNC_PER_PAGE,
+        )
+        _upsert(db, [_mirror_row(site.id, p, _post_title(p)) for p in posts])
+        synced += len(posts)
+        newest = max((m for m in map(_modified, posts) if m), default=None)
+        if newest and (cursor is None or newest > cursor):
+            cursor = site.remote_posts_cursor = newest
+        if len(posts) < SYNC_PER_PAGE:
+            break
+        next_after = newest - SYNC_OVERLAP if newest else None
+        if next_after is None or (after is not None and next_after <= after):
+            page += 1  # a full page within one second: step through it
+        else:
+            after, page = next_after, 1
+        db.commit()
+    site.remote_posts_synced_at = datetime.utcnow()
+    db.commit()
+    return synced
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Sequence
+
+# Batches smaller than this are scored inline; spinning work out to other
+# processes only pays off once pickling is cheaper than the scoring itself.
+PARALLEL_THRESHOLD = 2000
+CHUNK_DOCS = 500
+
+# One pass over the body finds every marker the checklist cares about
+_MARKERS = re.compile(r"\n##? |<h[12]|<img|alt=")
+
+# Bump when the rules change so stored results are recomputed
+CHECKLIST_VERSION = 1
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def checklist(title: str, body: str) -> dict:
+    issues: list[str] = []
+    warnings: list[str] = []
+    score = 100
+    title_len = len(title.strip())
+    if title_len < 10:
+        issues.append("title_too_short(<10)")
+        score -= 20
+    if title_len > 120:
+        warnings.append("title_too_long(>120)")
+        score -= 5
+    if len(body.strip()) < 200:
+        issues.append("content_too_short(<200)")
+        score -= 30
+
+    has_heading = has_img = has_alt = False
+    for match in _MARKERS.finditer(body):
+        marker = match.group()
+        if marker == "<img":
+            has_img = True
+        elif marker == "alt=":
+            has_alt = True
+        else:
+            has_heading = True
+        if has_heading and has_img and has_alt:
+            break
+    if not has_heading:
+        warnings.append("no_headings_found")
+        score -= 10
+    # simple alt presence (for HTML img)
+    if has_img and not has_alt:
+        warnings.append("image_without_alt")
+        score -= 10
+
+    score = max(0, score)
+    passed = score >= 60 and not issues
+    return {"passed": passed, "score": score, "issues": issues, "warnings": warnings}
+
+
+def _checklist_chunk(docs: Sequence[tuple[str, str]]) -> list[dict]:
+    return [checklist(title, body) for title, body in docs]
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn: never fork a process that is running server threads
+        _pool = ProcessPoolExecutor(
+            max_workers=int(os.getenv("CHECKLIST_WORKERS", "0")) or None,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def checklist_many(
+    docs: Sequence[tuple[str, str]], parallel: Optional[bool] = None
+) -> list[dict]:
+    """Score ``(title, body)`` pairs, preserving order.
+
+    Large batches are split into chunks and spread over a shared process
+    pool; ``parallel`` forces either path.
+    """
+    if parallel is None:
+        parallel = len(docs) >= PARALLEL_THRESHOLD
+    if not parallel:
+        return _checklist_chunk(docs)
+    chunks = [docs[i : i + CHUNK_DOCS] for i in range(0, len(docs), CHUNK_DOCS)]
+    results: list[dict] = []
+    for chunk_result in _get_pool().map(_checklist_chunk, chunks):
+        results.extend(chunk_result)
+    return results
+
+
+def content_hash(title: str, body: str) -> str:
+    raw = f"{CHECKLIST_VERSION}\0{title}\0{body}".encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+def checklist_columns(title: str, body: str) -> dict:
+    """Stored checklist columns for a ``content_queue`` row."""
+    report = checklist(title, body)
+    return {
+        "checklist_hash": content_hash(title, body),
+        "checklist_score": report["score"],
+        "checklist_passed": report["passed"],
+        "checklist_report": json.dumps(
+            {"issues": report["issues"], "warnings": report["warnings"]}
+        ),
+    }
+
+
+def stored_report(row) -> dict:
+    details = json.loads(row.checklist_report or "{}")
+    return {
+        "passed": bool(row.checklist_passed),
+        "score": row.checklist_score,
+        "issues": details.get("issues", []),
+        "warnings": details.get("warnings", []),
+    }
+
+
+def current_checklist(row) -> dict:
+    """Report for a content row's current title/body, leaving the row as is:
+    the stored one while its hash matches, a fresh one otherwise."""
+    title, body = row.title or "", row.body or ""
+    digest = content_hash(title, body)
+    if row.checklist_hash == digest and row.checklist_report is not None:
+        return stored_report(row)
+    return checklist(title, body)
+
+
+def refresh_checklist(row) -> tuple[dict, bool]:
+    """Return ``(report, changed)`` for a content row, rescoring only when
+    its title/body hash differs from the stored one."""
+    title, body = row.title or "", row.body or ""
+    digest = content_hash(title, body)
+    if row.checklist_hash == digest and row.checklist_report is not None:
+        return stored_report(row), False
+    for key, value in checklist_columns(title, body).items():
+        setattr(row, key, value)
+    return stored_report(row), True
@@ -0,0 +1,260 @@
+"""Per-site circuit breaker and token bucket for WordPress calls.
+
+State lives in Redis so the API, Celery workers and the bot share one view
+of every site. If Redis is not configured or not reachable, each process
+falls back to its own in-memory state rather than blocking WordPress calls.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Iterable, Optional
+
+import redis
+import requests
+
+logger = logging.getLogger(__name__)
+
+WP_GUARD_REDIS_URL = os.getenv(
+    "WP_GUARD_REDIS_URL", os.getenv("REDIS_URL", "redis://redis:6379/2")
+)
+WP_BREAKER_FAILURES = int(os.getenv("WP_BREAKER_FAILURES", "5"))
+WP_BREAKER_COOLDOWN = float(os.getenv("WP_BREAKER_COOLDOWN", "30"))
+WP_RATE_PER_SEC = float(os.getenv("WP_RATE_PER_SEC", "2"))
+WP_RATE_BURST = int(os.getenv("WP_RATE_BURST", "10"))
+WP_RATE_MAX_WAIT = float(os.getenv("WP_RATE_MAX_WAIT", "10"))
+REDIS_RETRY_AFTER = 30.0  # seconds to stay on local state after a Redis error
+
+# An open circuit re-arms itself when it lets one probe call through, so
+# exactly one caller per cooldown tests a site that may have recovered.
+_BREAKER_ALLOW = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1e6
+local opened_until = tonumber(redis.call('HGET', KEYS[1], 'opened_until') or '0')
+if opened_until == 0 then return '0' end
+if now < opened_until then return tostring(opened_until - now) end
+redis.call('HSET', KEYS[1], 'opened_until', tostring(now + ARGV[1]), 'probing', '1')
+return '0'
+"""
+
+_BREAKER_FAILURE = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1e6
+local failures = redis.call('HINCRBY', KEYS[1], 'failures', 1)
+if failures >= tonumber(ARGV[1]) then
+    redis.call('HSET', KEYS[1], 'opened_until', tostring(now + ARGV[2]), 'probing', '0')
+end
+redis.call('EXPIRE', KEYS[1], math.ceil(ARGV[2] * 4))
+return failures
+"""
+
+# Reserves a token and returns how long to wait for it, or a wait above
+# ARGV[3] without reserving anything when the caller would give up anyway.
+_BUCKET_TAKE = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1e6
+local rate, burst, max_wait = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local b = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(b[1]) or burst
+local ts = tonumber(b[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens < 1 then wait = (1 - tokens) / rate end
+if wait > max_wait then return tostring(wait) end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens - 1), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+
+class SiteUnavailableError(requests.RequestException):
+    """Raised before any request is sent; ``retry_in`` is in seconds."""
+
+    def __init__(self, site: str, retry_in: float) -> None:
+        self.site = site
+        self.retry_in = retry_in
+        super().__init__(f"{self.reason}: {site} (retry in {retry_in:.1f}s)")
+
+
+class CircuitOpenError(SiteUnavailableError):
+    reason = "circuit_open"
+
+
+class RateLimitedError(SiteUnavailableError):
+    reason = "rate_limited"
+
+
+def site_base_url(wp_url: str) -> str:
+    """A site's stored ``wp_url`` as clients call it: trimmed, ``https://``
+    when no scheme was given, no trailing slash."""
+    url = wp_url.strip()
+    if not (url.startswith("http://") or url.startswith("https://")):
+        url = "https://" + url
+    return url.rstrip("/")
+
+
+def site_key(base_url: str) -> str:
+    """Breaker and rate-limit key: the same for a stored ``wp_url`` and the
+    credentials built from it."""
+    return site_base_url(base_url)
+
+
+class SiteGuard:
+    def __init__(self, redis_url: Optional[str] = WP_GUARD_REDIS_URL) -> None:
+        self._redis = (
+            redis.Redis.from_url(
+                redis_url, socket_timeout=0.5, socket_connect_timeout=0.5
+            )
+            if redis_url
+            else None
+        )
+        self._redis_down_until = 0.0
+        self._lock = threading.Lock()
+        self._breakers: dict[str, dict] = {}
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def _shared(self) -> Optional[redis.Redis]:
+        if self._redis is None or time.time() < self._redis_down_until:
+            return None
+        return self._redis
+
+    def _redis_failed(self, exc: Exception) -> None:
+        logger.warning("site guard falling back to local state: %s", exc)
+        self._redis_down_until = time.time() + REDIS_RETRY_AFTER
+
+    # -- circuit breaker -------------------------------------------------
+
+    def _check_breaker(self, key: str) -> float:
+        r = self._shared()
+        if r is not None:
+            try:
+                return float(
+                    r.eval(_BREAKER_ALLOW, 1, f"wp:breaker:{key}", WP_BREAKER_COOLDOWN)
+                )
+            except redis.RedisError as e:
+                self._redis_failed(e)
+        now = time.time()
+        with self._lock:
+            state = self._breakers.get(key)
+            if not state or not state.get("opened_until"):
+                return 0.0
+            if now < state["opened_until"]:
+                return state["opened_until"] - now
+            state.update(opened_until=now + WP_BREAKER_COOLDOWN, probing=True)
+            return 0.0
+
+    def record(self, base_url: str, ok: bool) -> None:
+        """Close the circuit on success; count a failure otherwise."""
+        key = site_key(base_url)
+        r = self._shared()
+        if r is not None:
+            try:
+                if ok:
+                    r.delete(f"wp:breaker:{key}")
+                else:
+                    r.eval(
+                        _BREAKER_FAILURE,
+                        1,
+                        f"wp:breaker:{key}",
+                        WP_BREAKER_FAILURES,
+                        WP_BREAKER_COOLDOWN,
+                    )
+                return
+            except redis.RedisError as e:
+                self._redis_failed(e)
+        with self._lock:
+            if ok:
+                self._breakers.pop(key, None)
+                return
+            state = self._breakers.setdefault(key, {"failures": 0})
+            state["failures"] += 1
+            if state["failures"] >= WP_BREAKER_FAILURES:
+                state.update(opened_until=time.time() + WP_BREAKER_COOLDOWN)
+                state["probing"] = False
+
+    def reset(self, base_url: str) -> None:
+        self.record(base_url, ok=True)
+
+    def breaker_states(self, base_urls: Iterable[str]) -> dict[str, dict]:
+        """``{site: {state, failures, retry_in}}``; state is closed, open or
+        half_open (a probe call is in flight)."""
+        keys = [site_key(u) for u in base_urls]
+        raw: list[dict] = []
+        r = self._shared()
+        if r is not None:
+            try:
+                pipe = r.pipeline(transaction=False)
+                for key in keys:
+                    pipe.hgetall(f"wp:breaker:{key}")
+                raw = [
+                    {k.decode(): float(v) for k, v in h.items()} for h in pipe.execute()
+                ]
+            except redis.RedisError as e:
+                self._redis_failed(e)
+                raw = []
+        if not raw:
+            with self._lock:
+                raw = [dict(self._breakers.get(key, {})) for key in keys]
+        now = time.time()
+        states = {}
+        for key, h in zip(keys, raw):
+            opened_until = float(h.get("opened_until") or 0)
+            if not opened_until:
+                state = "closed"
+            elif h.get("probing"):
+                state = "half_open"
+            else:
+                state = "open"
+            states[key] = {
+                "state": state,
+                "failures": int(h.get("failures") or 0),
+                "retry_in": round(max(0.0, opened_until - now), 1),
+            }
+        return states
+
+    # -- token bucket ----------------------------------------------------
+
+    def _take_token(self, key: str) -> float:
+        r = self._shared()
+        if r is not None:
+            try:
+                return float(
+                    r.eval(
+                        _BUCKET_TAKE,
+                        1,
+                        f"wp:bucket:{key}",
+                        WP_RATE_PER_SEC,
+                        WP_RATE_BURST,
+                        WP_RATE_MAX_WAIT,
+                    )
+                )
+            except redis.RedisError as e:
+                self._redis_failed(e)
+        now = time.time()
+        with self._lock:
+            tokens, ts = self._buckets.get(key, (float(WP_RATE_BURST), now))
+            tokens = min(WP_RATE_BURST, tokens + max(0.0, now - ts) * WP_RATE_PER_SEC)
+            wait = (1 - tokens) / WP_RATE_PER_SEC if tokens < 1 else 0.0
+            if wait <= WP_RATE_MAX_WAIT:
+                self._buckets[key] = (tokens - 1, now)
+            return wait
+
+    def acquire(self, base_url: str) -> float:
+        """Admit one call to ``base_url``; returns the seconds to wait first.
+
+        Raises ``CircuitOpenError`` while the site's circuit is open and
+        ``RateLimitedError`` if a token is further away than
+        ``WP_RATE_MAX_WAIT``.
+        """
+        key = site_key(base_url)
+        retry_in = self._check_breaker(key)
+        if retry_in > 0:
+            raise CircuitOpenError(key, retry_in)
+        wait = self._take_token(key)
+        if wait > WP_RATE_MAX_WAIT:
+            raise RateLimitedError(key, wait)
+        return wait
+
+
+guard = SiteGuard()
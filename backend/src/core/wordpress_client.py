@@ -1,9 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Hashable, Optional, Sequence
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+
+from src.core.site_limits import guard, site_base_url
+
+WP_POOL_SIZE = int(os.getenv("WP_POOL_SIZE", "10"))
+WP_MAX_RETRIES = int(os.getenv("WP_MAX_RETRIES", "3"))
+WP_RETRY_BACKOFF = float(os.getenv("WP_RETRY_BACKOFF", "0.5"))
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+WP_PUBLISH_CONCURRENCY = int(os.getenv("WP_PUBLISH_CONCURRENCY", "20"))
+WP_PUBLISH_PER_SITE = int(os.getenv("WP_PUBLISH_PER_SITE", "4"))
+WP_HEALTH_CONCURRENCY = int(os.getenv("WP_HEALTH_CONCURRENCY", "50"))
+WP_HEALTH_TIMEOUT = float(os.getenv("WP_HEALTH_TIMEOUT", "10"))
 
 
 @dataclass
@@ -13,17 +30,109 @@ class WordPressCredentials:
     password: str  # expected decrypted here
 
 
+def site_credentials(site: Any) -> WordPressCredentials:
+    """Credentials for a ``Site`` row, with its URL normalized the way the
+    circuit breaker keys it."""
+    return WordPressCredentials(
+        base_url=site_base_url(site.wp_url),
+        username=site.wp_username,
+        password=site.wp_password_enc,
+    )
+
+
+_sessions: dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _new_session() -> requests.Session:
+    adapter = HTTPAdapter(
+        # one site usually means one host (two with an http->https redirect)
+        pool_connections=2,
+        pool_maxsize=WP_POOL_SIZE,
+        # No retries below the site guard: WordPressClient._request retries
+        # itself, so every attempt takes a token and counts for the breaker
+        max_retries=0,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session(base_url: str) -> requests.Session:
+    """Return the keep-alive session for a site, creating it on first use.
+
+    Sessions live for the whole process (API worker, Celery worker or bot),
+    so repeated calls to the same WordPress host reuse pooled connections.
+    """
+    key = base_url.rstrip("/")
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = _sessions[key] = _new_session()
+    return session
+
+
+def connection_stats() -> dict[str, dict[str, int]]:
+    """Per-site request and new-connection counts for this process.
+
+    ``requests - connections`` is how many requests reused a pooled
+    connection instead of opening a new TCP/TLS connection.
+    """
+    stats: dict[str, dict[str, int]] = {}
+    for key, session in list(_sessions.items()):
+        requests_made = connections = 0
+        for adapter in set(session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for pool_key in pools.keys():
+                pool = pools.get(pool_key)
+                if pool is None:
+                    continue
+                requests_made += pool.num_requests
+                connections += pool.num_connections
+        stats[key] = {
+            "requests": requests_made,
+            "connections": connections,
+            "reused": max(0, requests_made - connections),
+        }
+    return stats
+
+
 class WordPressClient:
     def __init__(self, creds: WordPressCredentials) -> None:
         self.creds = creds
         self.api = self.creds.base_url.rstrip("/") + "/wp-json/wp/v2"
+        self.session = get_session(self.creds.base_url)
 
     def _auth(self) -> tuple[str, str]:
         return (self.creds.username, self.creds.password)
 
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        # Open circuits fail fast instead of waiting out the timeout; only
+        # errors that say the host is unhealthy (no response, 5xx) count.
+        # Retry 429 for any method, other 5xx only when it cannot create a
+        # second post (not POST); connection errors are left to the caller
+        for attempt in range(WP_MAX_RETRIES + 1):
+            time.sleep(guard.acquire(self.creds.base_url))
+            try:
+                r = self.session.request(method, url, auth=self._auth(), **kwargs)
+            except requests.RequestException:
+                guard.record(self.creds.base_url, ok=False)
+                raise
+            guard.record(self.creds.base_url, ok=r.status_code < 500)
+            retryable = r.status_code == 429 or (
+                method != "POST" and r.status_code in RETRY_STATUSES
+            )
+            if not retryable or attempt == WP_MAX_RETRIES:
+                return r
+            time.sleep(_retry_after(r, attempt))
+        return r
+
     def test_connection(self) -> bool:
         url = self.api + "/posts?per_page=1"
-        r = requests.get(url, auth=self._auth(), timeout=15)
+        r = self._request("GET", url, timeout=15)
         if r.status_code in (200, 401):  # 401 means auth required but host reachable
             return True
         r.raise_for_status()
@@ -34,12 +143,215 @@ class WordPressClient:
     ) -> dict[str, Any]:
         url = self.api + "/posts"
         payload = {"title": title, "content": content, "status": status}
-        r = requests.post(url, json=payload, auth=self._auth(), timeout=30)
+        r = self._request("POST", url, json=payload, timeout=30)
         r.raise_for_status()
         return r.json()
 
     def update_post(self, post_id: int, **fields: Any) -> dict[str, Any]:
         url = self.api + f"/posts/{post_id}"
-        r = requests.post(url, json=fields, auth=self._auth(), timeout=30)
+        r = self._request("POST", url, json=fields, timeout=30)
         r.raise_for_status()
         return r.json()
+
+    def list_posts(
+        self,
+        modified_after: Optional[str] = None,
+        page: int = 1,
+        per_page: int = 100,
+        fields: Sequence[str] = ("id", "slug", "title", "modified"),
+    ) -> tuple[list[dict[str, Any]], int]:
+        """One page of posts in any editable status, least recently modified
+        first. Returns ``(posts, total_pages)``."""
+        params = {
+            "page": page,
+            "per_page": per_page,
+            "orderby": "modified",
+            "order": "asc",
+            "status": "publish,future,draft,pending,private",
+            "context": "edit",  # raw titles, as we sent them
+            "_fields": ",".join(fields),
+        }
+        if modified_after:
+            params["modified_after"] = modified_after
+        r = self._request("GET", self.api + "/posts", params=params, timeout=30)
+        r.raise_for_status()
+        return r.json(), int(r.headers.get("X-WP-TotalPages", "1"))
+
+
+def _retry_after(response: httpx.Response | requests.Response, attempt: int) -> float:
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return WP_RETRY_BACKOFF * (2**attempt)
+
+
+class AsyncWordPressClient:
+    """httpx-based client; share one ``httpx.AsyncClient`` across sites so
+    connections are pooled for the whole batch."""
+
+    def __init__(
+        self, creds: WordPressCredentials, client: httpx.AsyncClient
+    ) -> None:
+        self.creds = creds
+        self.api = self.creds.base_url.rstrip("/") + "/wp-json/wp/v2"
+        self.client = client
+
+    def _auth(self) -> tuple[str, str]:
+        return (self.creds.username, self.creds.password)
+
+    async def _request(
+        self, method: str, url: str, max_retries: Optional[int] = None, **kwargs: Any
+    ) -> httpx.Response:
+        # Same policy as the sync client: 429 is safe to replay for any
+        # method, other 5xx only when the request cannot create anything
+        max_retries = WP_MAX_RETRIES if max_retries is None else max_retries
+        # The guard makes blocking Redis calls (up to its socket timeout when
+        # Redis is slow): run them off the event loop
+        base_url = self.creds.base_url
+        for attempt in range(max_retries + 1):
+            await asyncio.sleep(await asyncio.to_thread(guard.acquire, base_url))
+            try:
+                r = await self.client.request(method, url, auth=self._auth(), **kwargs)
+            except httpx.TransportError:
+                await asyncio.to_thread(guard.record, base_url, False)
+                raise
+            await asyncio.to_thread(guard.record, base_url, r.status_code < 500)
+            retryable = r.status_code == 429 or (
+                method == "GET" and r.status_code in RETRY_STATUSES
+            )
+            if not retryable or attempt == max_retries:
+                return r
+            await asyncio.sleep(_retry_after(r, attempt))
+        return r
+
+    async def test_connection(self) -> bool:
+        r = await self._request("GET", self.api + "/posts?per_page=1", timeout=15)
+        if r.status_code in (200, 401):  # 401 means auth required but host reachable
+            return True
+        r.raise_for_status()
+        return True
+
+    async def create_post(
+        self, title: str, content: str, status: str = "draft"
+    ) -> dict[str, Any]:
+        payload = {"title": title, "content": content, "status": status}
+        r = await self._request("POST", self.api + "/posts", json=payload, timeout=30)
+        r.raise_for_status()
+        return r.json()
+
+    async def update_post(self, post_id: int, **fields: Any) -> dict[str, Any]:
+        r = await self._request(
+            "POST", self.api + f"/posts/{post_id}", json=fields, timeout=30
+        )
+        r.raise_for_status()
+        return r.json()
+
+
+@dataclass
+class PublishJob:
+    key: Hashable  # caller's id for the item, echoed in the result
+    creds: WordPressCredentials
+    title: str
+    content: str
+    status: str = "publish"
+
+
+@dataclass
+class PublishResult:
+    key: Hashable
+    ok: bool
+    post: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+async def publish_many(
+    jobs: Sequence[PublishJob],
+    max_concurrency: Optional[int] = None,
+    per_site_concurrency: Optional[int] = None,
+) -> list[PublishResult]:
+    """Create posts for ``jobs`` concurrently, in input order.
+
+    At most ``max_concurrency`` requests are in flight overall and at most
+    ``per_site_concurrency`` against any one site, so a large batch cannot
+    overwhelm a single WordPress host.
+    """
+    max_concurrency = max_concurrency or WP_PUBLISH_CONCURRENCY
+    per_site_concurrency = per_site_concurrency or WP_PUBLISH_PER_SITE
+    overall = asyncio.Semaphore(max_concurrency)
+    per_site: dict[str, asyncio.Semaphore] = {}
+    limits = httpx.Limits(
+        max_connections=max_concurrency, max_keepalive_connections=max_concurrency
+    )
+
+    async with httpx.AsyncClient(limits=limits) as http:
+
+        async def _publish(job: PublishJob) -> PublishResult:
+            site_key = site_base_url(job.creds.base_url)
+            site_limit = per_site.setdefault(
+                site_key, asyncio.Semaphore(per_site_concurrency)
+            )
+            async with site_limit, overall:
+                try:
+                    post = await AsyncWordPressClient(job.creds, http).create_post(
+                        title=job.title, content=job.content, status=job.status
+                    )
+                    return PublishResult(key=job.key, ok=True, post=post)
+                except Exception as e:
+                    return PublishResult(key=job.key, ok=False, error=str(e))
+
+        return list(await asyncio.gather(*(_publish(job) for job in jobs)))
+
+
+@dataclass
+class HealthResult:
+    key: Hashable
+    ok: bool
+    status_code: Optional[int] = None
+    latency_ms: Optional[int] = None
+    error: Optional[str] = None
+
+
+async def check_many(
+    sites: Sequence[tuple[Hashable, WordPressCredentials]],
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> list[HealthResult]:
+    """Probe each site's REST API once, concurrently, in input order.
+
+    A sweep costs roughly ``len(sites) / max_concurrency`` round trips, with
+    no retries so one slow host cannot stretch it past ``timeout``.
+    """
+    max_concurrency = max_concurrency or WP_HEALTH_CONCURRENCY
+    timeout = timeout or WP_HEALTH_TIMEOUT
+    overall = asyncio.Semaphore(max_concurrency)
+    limits = httpx.Limits(
+        max_connections=max_concurrency, max_keepalive_connections=max_concurrency
+    )
+
+    async with httpx.AsyncClient(limits=limits) as http:
+
+        async def _check(key: Hashable, creds: WordPressCredentials) -> HealthResult:
+            client = AsyncWordPressClient(creds, http)
+            async with overall:
+                started = time.perf_counter()
+                try:
+                    r = await client._request(
+                        "GET",
+                        client.api + "/posts?per_page=1",
+                        max_retries=0,
+                        timeout=timeout,
+                    )
+                except Exception as e:
+                    return HealthResult(key=key, ok=False, error=str(e) or repr(e))
+                latency_ms = int((time.perf_counter() - started) * 1000)
+            # 401 means auth required but host reachable
+            ok = r.status_code in (200, 401)
+            return HealthResult(
+                key=key,
+                ok=ok,
+                status_code=r.status_code,
+                latency_ms=latency_ms,
+                error=None if ok else f"http_{r.status_code}",
+            )
+
+        return list(await asyncio.gather(*(_check(k, c) for k, c in sites)))
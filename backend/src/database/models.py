@@ -1,11 +1,30 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import List
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    inspect,
+    insert,
+    text,
+    update,
+)
 from sqlalchemy.orm import Mapped, declarative_base, relationship
+from src.core.seo_checklist import refresh_checklist
 
 Base = declarative_base()
 
+KEYWORD_NEVER_USED = datetime(1970, 1, 1)
+
 
 class Role(Base):
     __tablename__ = "roles"
@@ -68,6 +87,10 @@ class RoleApplication(Base):
 
 class Site(Base):
     __tablename__ = "sites"
+    __table_args__ = (
+        # The dispatcher reloads only sites edited since its last tick
+        Index("ix_sites_schedule_version", "schedule_version"),
+    )
 
     id: int = Column(Integer, primary_key=True)
     name: str = Column(String(255), nullable=False)
@@ -80,15 +103,40 @@ class Site(Base):
     active_start_hour: int = Column(Integer, default=9)
     active_end_hour: int = Column(Integer, default=18)
     created_at: datetime = Column(DateTime, default=datetime.utcnow)
+    # Result of the last connectivity check, served without calling WordPress
+    health_ok: bool = Column(Boolean)
+    health_status_code: int = Column(Integer)
+    health_latency_ms: int = Column(Integer)
+    health_error: str = Column(String(500))
+    health_checked_at: datetime = Column(DateTime)
+    # Incremental remote post sync: newest WordPress `modified` seen so far
+    remote_posts_cursor: datetime = Column(DateTime)
+    remote_posts_synced_at: datetime = Column(DateTime)
+    # SchedulerState.schedule_version at the last schedule edit; set by the
+    # listeners below whenever SCHEDULE_FIELDS are written
+    schedule_version: int = Column(Integer, nullable=False, default=0)
 
 
 class Keyword(Base):
     __tablename__ = "keywords"
+    __table_args__ = (
+        # Draft generation claims a site's least recently used keywords with
+        # one index range scan; never-used keywords sort first
+        Index("ix_keywords_site_last_used_id", "site_id", "last_used_at", "id"),
+    )
 
     id: int = Column(Integer, primary_key=True)
     keyword: str = Column(String(255), nullable=False)
     site_id: int = Column(Integer, ForeignKey("sites.id"))
     created_at: datetime = Column(DateTime, default=datetime.utcnow)
+    # KEYWORD_NEVER_USED until a draft uses it (NOT NULL keeps the index
+    # order the same on PostgreSQL and SQLite)
+    last_used_at: datetime = Column(
+        DateTime,
+        nullable=False,
+        default=KEYWORD_NEVER_USED,
+        server_default=text("'1970-01-01 00:00:00'"),
+    )
 
     # Relationships
     site: Mapped["Site"] = relationship("Site")
@@ -96,6 +144,19 @@ class Keyword(Base):
 
 class ContentQueue(Base):
     __tablename__ = "content_queue"
+    __table_args__ = (
+        # Keyset pagination: status views seek on (site_id, status, id),
+        # the unfiltered list seeks on (created_at, id), score sorts on
+        # (checklist_score, id) with unscored rows lowest
+        Index("ix_content_queue_site_status_id", "site_id", "status", "id"),
+        Index("ix_content_queue_created_at_id", "created_at", "id"),
+        Index(
+            "ix_content_queue_checklist_score_id",
+            "checklist_score",
+            "id",
+            postgresql_ops={"checklist_score": "NULLS FIRST"},
+        ),
+    )
 
     id: int = Column(Integer, primary_key=True)
     site_id: int = Column(Integer, ForeignKey("sites.id"))
@@ -106,11 +167,138 @@ class ContentQueue(Base):
     updated_at: datetime = Column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
+    # SEO checklist result, valid while checklist_hash matches title/body
+    checklist_hash: str = Column(String(64))
+    checklist_score: int = Column(Integer)
+    checklist_passed: bool = Column(Boolean)
+    checklist_report: str = Column(Text)  # JSON: issues, warnings
+    # WordPress post created for this row; re-publishing updates it in place
+    wp_post_id: int = Column(Integer)
+    wp_link: str = Column(String(1000))
 
     # Relationships
     site: Mapped["Site"] = relationship("Site")
 
 
+@event.listens_for(ContentQueue, "before_insert")
+def _score_new_content(mapper, connection, target: ContentQueue) -> None:
+    refresh_checklist(target)
+
+
+@event.listens_for(ContentQueue, "before_update")
+def _rescore_edited_content(mapper, connection, target: ContentQueue) -> None:
+    attrs = inspect(target).attrs
+    if attrs.title.history.has_changes() or attrs.body.history.has_changes():
+        refresh_checklist(target)
+
+
+class RemotePost(Base):
+    """Compact local mirror of a site's WordPress posts, for duplicate checks."""
+
+    __tablename__ = "remote_posts"
+    __table_args__ = (
+        Index("ix_remote_posts_site_title_hash", "site_id", "title_hash"),
+    )
+
+    site_id: int = Column(Integer, ForeignKey("sites.id"), primary_key=True)
+    post_id: int = Column(Integer, primary_key=True)
+    slug: str = Column(String(200))
+    title_hash: str = Column(String(64), nullable=False)
+    modified: datetime = Column(DateTime)
+
+
+class ContentStatusCount(Base):
+    """Per-site status counters, kept current by a PostgreSQL trigger (0009)."""
+
+    __tablename__ = "content_status_counts"
+
+    site_id: int = Column(Integer, primary_key=True)
+    status: str = Column(String(50), primary_key=True)
+    count: int = Column(BigInteger, nullable=False, default=0)
+
+
+class PublishRequest(Base):
+    """A publish job run by ``publish_content_task``, one per idempotency key."""
+
+    __tablename__ = "publish_requests"
+
+    id: int = Column(Integer, primary_key=True)
+    idempotency_key: str = Column(String(128), unique=True, nullable=False)
+    content_id: int = Column(Integer, ForeignKey("content_queue.id"), nullable=True)
+    site_id: int = Column(Integer, ForeignKey("sites.id"), nullable=False)
+    # Direct publishes carry their own title/body; queue items are read at run time
+    title: str = Column(String(500))
+    body: str = Column(Text)
+    wp_status: str = Column(String(20), default="publish")
+    status: str = Column(String(20), default="queued")  # queued|running|succeeded|failed
+    task_id: str = Column(String(64))
+    attempts: int = Column(Integer, default=0)
+    post_id: int = Column(Integer)
+    link: str = Column(String(1000))
+    error: str = Column(Text)
+    requested_by: int = Column(Integer)
+    created_at: datetime = Column(DateTime, default=datetime.utcnow)
+    updated_at: datetime = Column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+
+class SchedulerState(Base):
+    """Draft dispatcher bookkeeping shared by all worker processes (one row)."""
+
+    __tablename__ = "scheduler_state"
+
+    id: int = Column(Integer, primary_key=True)
+    last_tick: datetime = Column(DateTime)  # UTC
+    # Bumped on every site schedule edit; see _next_schedule_version
+    schedule_version: int = Column(Integer, nullable=False, default=0)
+
+
+# Edits to these reach the draft dispatcher on its next tick, however the
+# site is written (API, bot, scripts); active hours and quota are read when
+# each draft is generated
+SCHEDULE_FIELDS = ("is_auto_enabled", "schedule_cron")
+
+
+def _next_schedule_version(connection) -> int:
+    """Bump the shared schedule version in the flushing transaction, so the
+    edit and the version become visible to the dispatcher together."""
+    state = SchedulerState.__table__
+    version = connection.execute(
+        update(state)
+        .where(state.c.id == 1)
+        .values(schedule_version=state.c.schedule_version + 1)
+        .returning(state.c.schedule_version)
+    ).scalar()
+    if version is None:  # nothing has ticked yet
+        version = 1
+        connection.execute(insert(state).values(id=1, schedule_version=version))
+    return version
+
+
+@event.listens_for(Site, "before_insert")
+def _schedule_new_site(mapper, connection, target: Site) -> None:
+    if target.is_auto_enabled:
+        target.schedule_version = _next_schedule_version(connection)
+
+
+@event.listens_for(Site, "before_update")
+def _reschedule_edited_site(mapper, connection, target: Site) -> None:
+    attrs = inspect(target).attrs
+    if any(getattr(attrs, field).history.has_changes() for field in SCHEDULE_FIELDS):
+        target.schedule_version = _next_schedule_version(connection)
+
+
+class SiteDailyCounter(Base):
+    """Drafts generated per site and UTC day; see reserve_daily_slots."""
+
+    __tablename__ = "site_daily_counters"
+
+    site_id: int = Column(Integer, ForeignKey("sites.id"), primary_key=True)
+    day: date = Column(Date, primary_key=True)
+    generated: int = Column(Integer, nullable=False, default=0)
+
+
 class TelegramAdmin(Base):
     __tablename__ = "telegram_admins"
 
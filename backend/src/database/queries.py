@@ -0,0 +1,33 @@
+"""Shared list queries with their relationships loaded up front.
+
+List endpoints render a related column per row (``site.name``,
+``role.name``, ``user.email``); loading it lazily costs one SELECT per row.
+These builders join the relationship in the same statement and project
+only the columns the endpoints read.
+"""
+
+from sqlalchemy.orm import Query, Session, contains_eager, joinedload
+from src.database.models import ContentQueue, Keyword, RoleApplication, Role, Site, User
+
+
+def content_list_query(db: Session) -> Query:
+    return db.query(ContentQueue).join(ContentQueue.site).options(
+        contains_eager(ContentQueue.site).load_only(Site.id, Site.name)
+    )
+
+
+def keyword_list_query(db: Session) -> Query:
+    return db.query(Keyword).join(Keyword.site).options(
+        contains_eager(Keyword.site).load_only(Site.id, Site.name)
+    )
+
+
+def user_list_query(db: Session) -> Query:
+    return db.query(User).options(joinedload(User.role).load_only(Role.id, Role.name))
+
+
+def role_application_list_query(db: Session) -> Query:
+    return db.query(RoleApplication).options(
+        joinedload(RoleApplication.user).load_only(User.id, User.email),
+        joinedload(RoleApplication.reviewer).load_only(User.id, User.email),
+    )
@@ -0,0 +1,51 @@
+from typing import Optional
+
+from sqlalchemy import case, func, literal, literal_column, or_
+from sqlalchemy.orm import Session
+from src.database.models import ContentQueue
+from src.database.queries import content_list_query
+
+# 'simple' keeps Vietnamese tokens intact (no stemming / stop words)
+TS_CONFIG = "simple"
+
+# Created by alembic revision 0008 on PostgreSQL only, so it is not mapped
+# on the model (SQLite test databases are built from metadata).
+search_vector = literal_column("content_queue.search_vector")
+
+
+def search_content(
+    db: Session,
+    q: str,
+    site_id: Optional[int] = None,
+    status: Optional[str] = None,
+    limit: int = 20,
+) -> list[tuple[ContentQueue, float]]:
+    """Return (row, rank) pairs for ``q``, best match first.
+
+    PostgreSQL ranks the generated ``search_vector`` (GIN) and matches
+    substrings in the title through the trigram index. Other dialects fall
+    back to LIKE scans with a title-over-body rank so tests still run.
+    """
+    q = q.strip()
+    if not q:
+        return []
+    pattern = f"%{q}%"
+
+    if db.bind.dialect.name == "postgresql":
+        tsquery = func.websearch_to_tsquery(TS_CONFIG, q)
+        rank = func.ts_rank_cd(search_vector, tsquery)
+        match = or_(search_vector.op("@@")(tsquery), ContentQueue.title.ilike(pattern))
+    else:
+        rank = case(
+            (ContentQueue.title.ilike(pattern), literal(1.0)),
+            else_=literal(0.5),
+        )
+        match = or_(ContentQueue.title.ilike(pattern), ContentQueue.body.ilike(pattern))
+
+    query = content_list_query(db).add_columns(rank.label("rank")).filter(match)
+    if site_id is not None:
+        query = query.filter(ContentQueue.site_id == site_id)
+    if status:
+        query = query.filter(ContentQueue.status == status)
+    rows = query.order_by(rank.desc(), ContentQueue.id.desc()).limit(limit).all()
+    return [(row, float(score or 0)) for row, score in rows]
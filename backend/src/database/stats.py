@@ -0,0 +1,38 @@
+import os
+from typing import Iterable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from src.core.content_status import CONTENT_STATUSES
+from src.database.models import ContentQueue, ContentStatusCount
+
+# Read the trigger-maintained counter table (PostgreSQL, revision 0009)
+# instead of aggregating content_queue on every call.
+STATS_FROM_COUNTERS = os.getenv("CONTENT_STATS_FROM_COUNTERS", "false").lower() == "true"
+
+
+def status_counts(
+    db: Session, site_ids: Optional[Iterable[int]] = None
+) -> dict[int, dict[str, int]]:
+    """Return ``{site_id: {status: count}}`` from a single query.
+
+    Every known status is present (zero when empty) for each returned site.
+    """
+    if STATS_FROM_COUNTERS:
+        site_col = ContentStatusCount.site_id
+        stmt = select(site_col, ContentStatusCount.status, ContentStatusCount.count)
+    else:
+        site_col = ContentQueue.site_id
+        stmt = select(site_col, ContentQueue.status, func.count()).group_by(
+            ContentQueue.site_id, ContentQueue.status
+        )
+    if site_ids is not None:
+        stmt = stmt.where(site_col.in_(list(site_ids)))
+
+    counts: dict[int, dict[str, int]] = {}
+    for site_id, status, count in db.execute(stmt):
+        if site_id is None or not count:
+            continue
+        per_site = counts.setdefault(site_id, dict.fromkeys(CONTENT_STATUSES, 0))
+        per_site[status] = count
+    return counts
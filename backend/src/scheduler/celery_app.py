@@ -1,10 +1,121 @@
 import os
+import time
+from datetime import datetime
 
 from celery import Celery
+from celery.signals import beat_init, before_task_publish, task_postrun, task_prerun
+from kombu import Queue
+
+from .metrics import metrics
 
 broker_url = os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0")
 result_backend = os.getenv("CELERY_RESULT_BACKEND", "redis://redis:6379/1")
+PRIORITY_STEPS = [0, 3, 6, 9]
+PRIORITY_SEP = ":"
 
-app = Celery("autoseo", broker=broker_url, backend=result_backend)
+app = Celery(
+    "autoseo",
+    broker=broker_url,
+    backend=result_backend,
+    include=["src.scheduler.tasks"],
+)
 app.conf.timezone = "Asia/Ho_Chi_Minh"
-app.conf.beat_schedule = {}
+# One queue per kind of work, each with its own worker pool (docker-compose),
+# so a flood of bulk generation never delays a publish. Within a queue the
+# Redis transport serves lower priority numbers first (0 = most urgent).
+app.conf.task_default_queue = "celery"
+app.conf.task_queues = [
+    Queue("celery"),
+    Queue("generation"),
+    Queue("publish"),
+    Queue("maintenance"),
+    Queue("dispatch"),
+]
+app.conf.broker_transport_options = {
+    "priority_steps": PRIORITY_STEPS,
+    "sep": PRIORITY_SEP,
+    "queue_order_strategy": "priority",
+}
+app.conf.task_routes = {
+    f"src.scheduler.tasks.{name}": {"queue": queue, "priority": priority}
+    for name, queue, priority in [
+        # A user waiting on "run now" goes ahead of dispatcher batches
+        ("generate_draft_for_site", "generation", 0),
+        ("generate_drafts", "generation", 0),
+        ("generate_drafts_for_sites", "generation", 6),
+        ("publish_content_task", "publish", 0),
+        # Served by one solo process, so its schedule heap lives across ticks
+        ("dispatch_due_sites", "dispatch", 0),
+        ("reconcile_quota_counters", "maintenance", 0),
+        ("score_unscored_content", "maintenance", 6),
+        ("sync_remote_posts", "maintenance", 6),
+        ("sync_all_remote_posts", "maintenance", 6),
+    ]
+}
+app.conf.beat_schedule = {
+    # One entry however many sites: the dispatcher enqueues the due ones
+    "dispatch-due-sites": {
+        "task": "src.scheduler.tasks.dispatch_due_sites",
+        "schedule": float(os.getenv("DISPATCH_TICK_SECONDS", "60")),
+    },
+    "sync-remote-posts": {
+        "task": "src.scheduler.tasks.sync_all_remote_posts",
+        "schedule": float(os.getenv("REMOTE_POSTS_SYNC_SECONDS", "900")),
+    },
+}
+
+
+@beat_init.connect
+def _prime_dispatcher(**kwargs) -> None:
+    """Tick once as beat starts instead of a full interval later. Nothing
+    reads the sites table at import: the worker that takes this tick loads
+    the schedule, then keeps it current through schedule versions. Quota
+    counters are reconciled here too, once per beat start rather than in
+    every worker that boots, and rows left without a checklist score are
+    scored."""
+    app.send_task("src.scheduler.tasks.reconcile_quota_counters")
+    app.send_task("src.scheduler.tasks.score_unscored_content")
+    app.send_task("src.scheduler.tasks.dispatch_due_sites")
+
+
+def queue_names() -> list[str]:
+    """Every queue tasks can be routed to, for queue-depth reporting."""
+    return sorted(queue.name for queue in app.conf.task_queues)
+
+
+# -- instrumentation ------------------------------------------------------
+# Producers stamp when a message becomes runnable (its eta, if any); the
+# worker turns that into queue wait at prerun and runtime at postrun.
+
+_started: dict[str, tuple[float, float]] = {}  # task id -> (wall, monotonic)
+_OUTCOMES = {"SUCCESS": "succeeded", "FAILURE": "failed", "RETRY": "retried"}
+
+
+@before_task_publish.connect
+def _stamp_ready_at(headers=None, **kwargs) -> None:
+    if headers is None:
+        return
+    ready_at = time.time()
+    if headers.get("eta"):
+        ready_at = max(ready_at, datetime.fromisoformat(headers["eta"]).timestamp())
+    headers["ready_at"] = ready_at
+
+
+@task_prerun.connect
+def _start_timer(task_id=None, **kwargs) -> None:
+    _started[task_id] = (time.time(), time.monotonic())
+
+
+@task_postrun.connect
+def _record_run(task_id=None, task=None, state=None, **kwargs) -> None:
+    started = _started.pop(task_id, None)
+    if started is None or task is None or task.request.is_eager:
+        return
+    wall, mono = started
+    ready_at = getattr(task.request, "ready_at", None)
+    metrics.observe(
+        task.name,
+        wait=wall - float(ready_at) if ready_at else None,
+        runtime=time.monotonic() - mono,
+        outcome=_OUTCOMES.get(state, "failed"),
+    )
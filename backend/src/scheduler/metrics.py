@@ -0,0 +1,174 @@
+"""Per-task Celery metrics: queue wait, runtime and outcome counts.
+
+Workers record into Redis hashes so the API can report on every worker
+process at once; without Redis each process keeps its own counters, as
+the site guard does. Histograms use fixed buckets, so recording is a
+handful of HINCRBY calls in one pipeline.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Iterable, Optional
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+CELERY_METRICS_REDIS_URL = os.getenv(
+    "CELERY_METRICS_REDIS_URL", os.getenv("REDIS_URL", "redis://redis:6379/2")
+)
+# Upper bounds in seconds; a final +Inf bucket catches the rest
+BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900)
+OUTCOMES = ("succeeded", "failed", "retried")
+REDIS_RETRY_AFTER = 30.0  # seconds to stay on local state after a Redis error
+
+_KEY = "celery:metrics:{}"
+_TASKS_KEY = "celery:metrics:tasks"
+
+
+def _bucket(seconds: float) -> str:
+    for bound in BUCKETS:
+        if seconds <= bound:
+            return str(bound)
+    return "+Inf"
+
+
+def _histogram(fields: dict[str, float], name: str) -> dict:
+    """Cumulative ``le`` buckets, count and sum for one observed series."""
+    running = 0
+    buckets = {}
+    for bound in [*map(str, BUCKETS), "+Inf"]:
+        running += int(fields.get(f"{name}:{bound}", 0))
+        buckets[bound] = running
+    return {
+        "count": running,
+        "sum": round(float(fields.get(f"{name}:sum", 0)), 3),
+        "buckets": buckets,
+    }
+
+
+class TaskMetrics:
+    def __init__(self, redis_url: Optional[str] = CELERY_METRICS_REDIS_URL) -> None:
+        self._redis = (
+            redis.Redis.from_url(
+                redis_url, socket_timeout=0.5, socket_connect_timeout=0.5
+            )
+            if redis_url
+            else None
+        )
+        self._redis_down_until = 0.0
+        self._lock = threading.Lock()
+        self._local: dict[str, dict[str, float]] = {}
+
+    def _shared(self) -> Optional[redis.Redis]:
+        if self._redis is None or time.time() < self._redis_down_until:
+            return None
+        return self._redis
+
+    def _redis_failed(self, exc: Exception) -> None:
+        logger.warning("task metrics falling back to local state: %s", exc)
+        self._redis_down_until = time.time() + REDIS_RETRY_AFTER
+
+    def _add(self, task: str, increments: dict[str, float]) -> None:
+        r = self._shared()
+        if r is not None:
+            try:
+                pipe = r.pipeline(transaction=False)
+                pipe.sadd(_TASKS_KEY, task)
+                for field, amount in increments.items():
+                    if isinstance(amount, float):
+                        pipe.hincrbyfloat(_KEY.format(task), field, amount)
+                    else:
+                        pipe.hincrby(_KEY.format(task), field, amount)
+                pipe.execute()
+                return
+            except redis.RedisError as e:
+                self._redis_failed(e)
+        with self._lock:
+            fields = self._local.setdefault(task, {})
+            for field, amount in increments.items():
+                fields[field] = fields.get(field, 0) + amount
+
+    def observe(
+        self, task: str, wait: Optional[float], runtime: float, outcome: str
+    ) -> None:
+        """Record one finished run; ``wait`` is None when the queue time is
+        unknown (eager calls, messages from an older producer)."""
+        increments: dict[str, float] = {
+            outcome: 1,
+            f"runtime:{_bucket(runtime)}": 1,
+            "runtime:sum": float(runtime),
+        }
+        if wait is not None:
+            wait = max(0.0, wait)
+            increments[f"wait:{_bucket(wait)}"] = 1
+            increments["wait:sum"] = float(wait)
+        self._add(task, increments)
+
+    def snapshot(self) -> dict[str, dict]:
+        """``{task: {succeeded, failed, retried, wait, runtime}}``."""
+        raw: dict[str, dict[str, float]] = {}
+        r = self._shared()
+        if r is not None:
+            try:
+                tasks = sorted(t.decode() for t in r.smembers(_TASKS_KEY))
+                pipe = r.pipeline(transaction=False)
+                for task in tasks:
+                    pipe.hgetall(_KEY.format(task))
+                for task, fields in zip(tasks, pipe.execute()):
+                    raw[task] = {k.decode(): float(v) for k, v in fields.items()}
+            except redis.RedisError as e:
+                self._redis_failed(e)
+                raw = {}
+        if not raw:
+            with self._lock:
+                raw = {task: dict(fields) for task, fields in self._local.items()}
+        return {
+            task: {
+                **{outcome: int(fields.get(outcome, 0)) for outcome in OUTCOMES},
+                "wait": _histogram(fields, "wait"),
+                "runtime": _histogram(fields, "runtime"),
+            }
+            for task, fields in sorted(raw.items())
+        }
+
+    def reset(self) -> None:
+        r = self._shared()
+        if r is not None:
+            try:
+                tasks = [t.decode() for t in r.smembers(_TASKS_KEY)]
+                r.delete(_TASKS_KEY, *(_KEY.format(t) for t in tasks))
+            except redis.RedisError as e:
+                self._redis_failed(e)
+        with self._lock:
+            self._local.clear()
+
+
+def queue_lengths(
+    broker_url: str,
+    queues: Iterable[str],
+    priority_steps: Iterable[int] = (),
+    sep: str = ":",
+) -> dict[str, Optional[int]]:
+    """Messages waiting in each Redis-broker queue, summed over its priority
+    lists (``name``, ``name:3``, ...); None if the broker is unreachable."""
+    names = sorted(set(queues))
+    lists = [f"{sep}{step}" for step in priority_steps if step]
+    try:
+        r = redis.Redis.from_url(
+            broker_url, socket_timeout=0.5, socket_connect_timeout=0.5
+        )
+        pipe = r.pipeline(transaction=False)
+        for name in names:
+            for suffix in ["", *lists]:
+                pipe.llen(name + suffix)
+        counts = iter(pipe.execute())
+        return {name: sum(next(counts) for _ in range(1 + len(lists))) for name in names}
+    except (redis.RedisError, ValueError) as e:  # ValueError: not a Redis URL
+        logger.warning("could not read queue lengths: %s", e)
+        return {name: None for name in names}
+
+
+metrics = TaskMetrics()
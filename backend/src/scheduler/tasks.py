@@ -1,75 +1,351 @@
+import os
 from datetime import datetime, timezone
 
-from celery.schedules import crontab
-from sqlalchemy.exc import OperationalError
-from src.database.models import ContentQueue, Site
+import requests
+from celery.exceptions import Retry
+from sqlalchemy import insert
+from src.core.remote_posts import find_duplicates, remember_posts, sync_site
+from src.core.seo_checklist import checklist_columns
+from src.core.wordpress_client import WordPressClient, site_credentials
+from src.database.models import (
+    ContentQueue,
+    PublishRequest,
+    RemotePost,
+    SchedulerState,
+    Site,
+)
 from src.database.session import SessionLocal
 
 from .celery_app import app
-from .utils import count_today_generated, is_within_active_hours
+from .dispatcher import SiteDispatcher
+from .utils import (
+    claim_keywords,
+    is_within_active_hours,
+    reconcile_daily_counters,
+    reserve_daily_slots,
+    score_unscored,
+)
 
 
 """Scheduler helpers moved to utils module."""
 
+PUBLISH_MAX_RETRIES = int(os.getenv("PUBLISH_MAX_RETRIES", "5"))
+PUBLISH_RETRY_BACKOFF = int(os.getenv("PUBLISH_RETRY_BACKOFF", "30"))  # seconds
+
+
+def _draft_values(
+    site: Site, now: datetime, n: int, keywords: list[str]
+) -> list[dict]:
+    stamp = now.isoformat()
+    values = []
+    for i in range(n):
+        # Fewer keywords than drafts: reuse the claimed ones in turn
+        keyword = keywords[i % len(keywords)] if keywords else None
+        title = f"{keyword} - Auto Draft {stamp}" if keyword else f"Auto Draft {stamp}"
+        if n > max(len(keywords), 1):
+            title += f" ({i + 1}/{n})"
+        topic = f" about {keyword}" if keyword else ""
+        body = f"Auto-generated content{topic} for site {site.name} at {stamp}"
+        values.append(
+            {
+                "site_id": site.id,
+                "title": title,
+                "body": body,
+                "status": "pending",
+                "created_at": now,
+                "updated_at": now,
+                **checklist_columns(title, body),
+            }
+        )
+    return values
+
+
+def _generate_drafts(db, site_ids: list[int], n: int) -> dict[int, list[int]]:
+    """Reserve quota and keywords for up to ``n`` drafts per site and insert
+    them all in one statement and one transaction; returns the new ids per
+    site."""
+    now = datetime.utcnow()
+    # Lock counters in site id order so concurrent batches cannot deadlock
+    sites = db.query(Site).filter(Site.id.in_(site_ids)).order_by(Site.id).all()
+    values = []
+    for site in sites:
+        if not is_within_active_hours(
+            now.replace(tzinfo=timezone.utc),
+            site.active_start_hour or 0,
+            site.active_end_hour or 0,
+        ):
+            continue
+        granted = n
+        if site.daily_quota is not None:
+            granted = reserve_daily_slots(db, site.id, site.daily_quota, n)
+        if granted:
+            keywords = claim_keywords(db, site.id, granted, now)
+            values.extend(_draft_values(site, now, granted, keywords))
+    if not values:
+        db.rollback()
+        return {}
+    rows = db.execute(
+        insert(ContentQueue).returning(ContentQueue.site_id, ContentQueue.id), values
+    ).all()
+    db.commit()
+    created: dict[int, list[int]] = {}
+    for site_id, new_id in sorted(rows):
+        created.setdefault(site_id, []).append(new_id)
+    return created
+
 
 @app.task
 def generate_draft_for_site(site_id: int) -> int:
+    db = SessionLocal()
+    try:
+        ids = _generate_drafts(db, [site_id], 1).get(site_id)
+        return ids[0] if ids else 0
+    finally:
+        db.close()
+
+
+@app.task
+def generate_drafts(site_id: int, n: int) -> list[int]:
+    """Up to ``n`` drafts for one site, as far as its quota allows."""
+    db = SessionLocal()
+    try:
+        return _generate_drafts(db, [site_id], n).get(site_id, [])
+    finally:
+        db.close()
+
+
+@app.task
+def generate_drafts_for_sites(site_ids: list[int], n: int = 1) -> dict[int, list[int]]:
+    """Up to ``n`` drafts for each site, in one transaction; sites outside
+    their active hours or quota are left out of the result."""
+    db = SessionLocal()
+    try:
+        return _generate_drafts(db, site_ids, n)
+    finally:
+        db.close()
+
+
+@app.task
+def reconcile_quota_counters() -> int:
+    """Counters drift when drafts are deleted or added by hand; beat sends
+    this once as it starts, so one process re-derives today's counters
+    instead of every worker that boots."""
+    db = SessionLocal()
+    try:
+        return reconcile_daily_counters(db)
+    finally:
+        db.close()
+
+
+@app.task
+def score_unscored_content() -> int:
+    """Persist checklist scores for rows that have none; beat sends this as
+    it starts, so reads only ever compute a missing score, never store it."""
+    db = SessionLocal()
+    try:
+        return score_unscored(db)
+    finally:
+        db.close()
+
+
+def _is_transient(exc: requests.RequestException) -> bool:
+    response = getattr(exc, "response", None)
+    if response is None:  # connection error or timeout
+        return True
+    return response.status_code == 429 or response.status_code >= 500
+
+
+def _site_client(site: Site) -> WordPressClient:
+    return WordPressClient(site_credentials(site))
+
+
+def _publish(task, db, req: PublishRequest, site: Site, content) -> dict:
+    """One attempt at ``req``'s WordPress call; see publish_content_task."""
+    client = _site_client(site)
+    source = content if content is not None else req
+    fields = {
+        "title": source.title,
+        "content": source.body or "",
+        "status": req.wp_status or "publish",
+    }
+    post_id = content.wp_post_id if content is not None else req.post_id
+    try:
+        if not post_id:
+            known = find_duplicates(db, site.id, fields["title"])
+            if req.attempts > 1:
+                # The last attempt may have created the post and then
+                # timed out: a match that only this sync brings in is ours
+                sync_site(db, site, client)
+                found = find_duplicates(db, site.id, fields["title"])
+                post_id = next((p for p in found if p not in known), None)
+            if not post_id and known:
+                # Someone else's post: never overwrite it, as publish-batch
+                req.status = "failed"
+                req.error = f"duplicate_remote_post:{known[0]}"
+                db.commit()
+                return {"id": req.id, "status": req.status}
+        try:
+            if post_id:
+                result = client.update_post(post_id, **fields)
+            else:
+                result = client.create_post(**fields)
+        except requests.HTTPError as e:
+            # Post deleted on the WordPress side: publish it afresh
+            if not post_id or e.response is None or e.response.status_code != 404:
+                raise
+            db.query(RemotePost).filter(
+                RemotePost.site_id == site.id, RemotePost.post_id == post_id
+            ).delete()
+            result = client.create_post(**fields)
+    except requests.RequestException as e:
+        req.error = str(e)
+        if _is_transient(e) and task.request.retries < task.max_retries:
+            req.status = "queued"
+            db.commit()
+            countdown = PUBLISH_RETRY_BACKOFF * 2**task.request.retries
+            # An open circuit says when the site is worth trying again
+            countdown = max(countdown, getattr(e, "retry_in", 0))
+            raise task.retry(exc=e, countdown=countdown)
+        req.status = "failed"
+        db.commit()
+        return {"id": req.id, "status": req.status}
+
+    req.post_id = result.get("id")
+    req.link = result.get("link")
+    req.status = "succeeded"
+    req.error = None
+    if content is not None:
+        content.wp_post_id = req.post_id
+        content.wp_link = req.link
+        content.status = "published"
+    remember_posts(db, site.id, [(result, fields["title"])])
+    db.commit()
+    return {"id": req.id, "status": req.status, "post_id": req.post_id}
+
+
+@app.task(bind=True, max_retries=PUBLISH_MAX_RETRIES, acks_late=True)
+def publish_content_task(self, request_id: int) -> dict:
+    """Publish one PublishRequest to WordPress.
+
+    The post id is stored as soon as WordPress returns it, so a retry or a
+    later re-publish of the same item updates that post instead of creating
+    a second one. A post with the same title already in the site's mirror
+    fails the request with ``duplicate_remote_post``, as publish-batch does.
+    Finished requests are left untouched.
+    """
+    db = SessionLocal()
+    try:
+        req = db.get(PublishRequest, request_id)
+        if req is None or req.status == "succeeded":
+            return {"id": request_id, "status": req.status if req else "not_found"}
+        site = db.get(Site, req.site_id)
+        content = db.get(ContentQueue, req.content_id) if req.content_id else None
+        if site is None or (req.content_id and content is None):
+            req.status = "failed"
+            req.error = "site_not_found" if site is None else "content_not_found"
+            db.commit()
+            return {"id": req.id, "status": req.status}
+        req.status = "running"
+        req.attempts = (req.attempts or 0) + 1
+        db.commit()
+
+        try:
+            return _publish(self, db, req, site, content)
+        except Retry:
+            raise
+        except Exception as e:
+            # Anything but a WordPress error (database, bad data): never leave
+            # the job "running", since nothing would ever move it on
+            db.rollback()
+            req.status = "failed"
+            req.error = f"{type(e).__name__}: {e}"
+            db.commit()
+            raise
+    finally:
+        db.close()
+
+
+@app.task
+def sync_remote_posts(site_id: int, full: bool = False) -> int:
+    """Refresh one site's remote post mirror; returns posts read."""
     db = SessionLocal()
     try:
         site = db.get(Site, site_id)
         if not site:
             return 0
-        # Enforce active hours
-        now_utc = datetime.utcnow().replace(tzinfo=timezone.utc)
-        if not is_within_active_hours(
-            now_utc, site.active_start_hour or 0, site.active_end_hour or 0
-        ):
-            return 0
-        # Enforce daily quota
-        generated_today = count_today_generated(db, site.id)
-        if site.daily_quota is not None and generated_today >= (site.daily_quota or 0):
-            return 0
-        title = f"Auto Draft {datetime.utcnow().isoformat()}"
-        body = f"Auto-generated content for site {site.name} at {datetime.utcnow().isoformat()}"
-        row = ContentQueue(site_id=site.id, title=title, body=body, status="pending")
-        db.add(row)
-        db.commit()
-        return row.id
+        return sync_site(db, site, _site_client(site), full=full)
     finally:
         db.close()
 
 
-def register_default_schedule():
-    # Build schedule dynamically from sites table where is_auto_enabled
+@app.task
+def sync_all_remote_posts() -> int:
+    """Fan out one incremental mirror sync per site."""
     db = SessionLocal()
     try:
-        sites = db.query(Site).filter(Site.is_auto_enabled == True).all()  # noqa: E712
-        schedule = {}
-        for s in sites:
-            try:
-                minute, hour, dom, month, dow = (s.schedule_cron or "0 * * * *").split()
-            except ValueError:
-                minute, hour, dom, month, dow = ("0", "*", "*", "*", "*")
-            schedule[f"auto-generate-site-{s.id}"] = {
-                "task": "src.scheduler.tasks.generate_draft_for_site",
-                "schedule": crontab(
-                    minute=minute,
-                    hour=hour,
-                    day_of_month=dom,
-                    month_of_year=month,
-                    day_of_week=dow,
-                ),
-                "args": (s.id,),
-            }
-        app.conf.beat_schedule.update(schedule)
-    except OperationalError:
-        pass
+        site_ids = [row.id for row in db.query(Site.id).order_by(Site.id)]
     finally:
         db.close()
+    for site_id in site_ids:
+        sync_remote_posts.delay(site_id)
+    return len(site_ids)
+
+
+DISPATCH_BATCH_SIZE = int(os.getenv("DISPATCH_BATCH_SIZE", "500"))
+
+_dispatcher = SiteDispatcher()
 
 
-try:
-    register_default_schedule()
-except Exception:
-    # Avoid import-time failures in environments where DB isn't ready (e.g. CI)
-    pass
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@app.task
+def dispatch_due_sites() -> int:
+    """Beat's single scheduling entry: enqueue drafts for the sites whose
+    cron fired since the previous tick.
+
+    Ticks go to the ``dispatch`` queue, which a single solo-pool worker
+    serves, so the heap in this module stays warm from tick to tick. The
+    tick window is shared through ``scheduler_state`` (locked for the tick):
+    a process rebuilds its heap only when another one ticked in between,
+    e.g. after a restart. Otherwise only the sites whose ``schedule_version``
+    moved past the one already applied are re-read, so edited schedules
+    take effect on the next tick.
+    """
+    db = SessionLocal()
+    try:
+        state = db.get(SchedulerState, 1, with_for_update=True)
+        if state is None:
+            state = SchedulerState(id=1, schedule_version=0)
+            db.add(state)
+        now = _utcnow()
+        last_tick = (
+            state.last_tick.replace(tzinfo=timezone.utc) if state.last_tick else now
+        )
+        if _dispatcher.base != last_tick:
+            sites = db.query(Site).filter(Site.is_auto_enabled == True)  # noqa: E712
+            _dispatcher.load(sites, after=last_tick, version=state.schedule_version)
+        elif state.schedule_version != _dispatcher.version:
+            edited = db.query(Site).filter(Site.schedule_version > _dispatcher.version)
+            _dispatcher.update(edited, version=state.schedule_version)
+        due = _dispatcher.due(now)
+        if due:
+            # Deleted sites never bump a version; drop them as they come due
+            existing = {
+                site_id for (site_id,) in db.query(Site.id).filter(Site.id.in_(due))
+            }
+            for site_id in set(due) - existing:
+                _dispatcher.discard(site_id)
+            due = [site_id for site_id in due if site_id in existing]
+        # One message and one transaction per DISPATCH_BATCH_SIZE sites
+        for start in range(0, len(due), DISPATCH_BATCH_SIZE):
+            generate_drafts_for_sites.delay(due[start : start + DISPATCH_BATCH_SIZE])
+        state.last_tick = now.replace(tzinfo=None)
+        db.commit()
+        return len(due)
+    except Exception:
+        _dispatcher.base = None  # tick not recorded: rebuild next time
+        raise
+    finally:
+        db.close()
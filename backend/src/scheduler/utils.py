@@ -1,6 +1,11 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from typing import Optional
 
-from src.database.models import ContentQueue
+from sqlalchemy import func, select, update
+from src.core.seo_checklist import checklist_columns
+from src.database.models import ContentQueue, Keyword, SiteDailyCounter
+
+SCORE_BATCH = 1000
 
 
 def is_within_active_hours(now_utc: datetime, start_hour: int, end_hour: int) -> bool:
@@ -12,15 +17,170 @@ def is_within_active_hours(now_utc: datetime, start_hour: int, end_hour: int) ->
     return current_hour >= start_hour or current_hour < end_hour
 
 
-def count_today_generated(db, site_id: int) -> int:
-    start_of_day = datetime.now(timezone.utc).replace(
-        hour=0, minute=0, second=0, microsecond=0
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def _generated_on(db, day: date, site_id: Optional[int] = None):
+    start = datetime.combine(day, datetime.min.time())
+    query = db.query(ContentQueue.site_id, func.count(ContentQueue.id)).filter(
+        ContentQueue.site_id.isnot(None), ContentQueue.created_at >= start
     )
-    return (
-        db.query(ContentQueue)
-        .filter(ContentQueue.site_id == site_id)
-        .filter(ContentQueue.created_at >= start_of_day.replace(tzinfo=None))
-        .count()
+    if site_id is not None:
+        query = query.filter(ContentQueue.site_id == site_id)
+    return query.group_by(ContentQueue.site_id)
+
+
+def count_today_generated(db, site_id: int) -> int:
+    row = _generated_on(db, _today(), site_id).first()
+    return row[1] if row else 0
+
+
+def _seed_counters(db, rows: list[dict]) -> None:
+    """Insert counters that do not exist yet; existing ones are kept."""
+    dialect = db.bind.dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(SiteDailyCounter).on_conflict_do_nothing(
+            index_elements=["site_id", "day"]
+        )
+        db.execute(stmt, rows)
+        return
+    for row in rows:
+        if db.get(SiteDailyCounter, (row["site_id"], row["day"])) is None:
+            db.add(SiteDailyCounter(**row))
+    db.flush()
+
+
+def reserve_daily_slots(db, site_id: int, quota: int, n: int = 1) -> int:
+    """Take up to ``n`` of today's (UTC) ``quota`` drafts for ``site_id``;
+    returns how many were granted.
+
+    Each attempt checks and increments in one ``UPDATE ... RETURNING``, so
+    concurrent workers cannot overshoot the quota; when ``n`` does not fit
+    it is shrunk to what is left and retried. The counter row stays locked
+    until the caller commits, and a rollback returns the slots.
+    """
+    day = _today()
+    while n > 0:
+        reserve = (
+            update(SiteDailyCounter)
+            .where(
+                SiteDailyCounter.site_id == site_id,
+                SiteDailyCounter.day == day,
+                SiteDailyCounter.generated + n <= quota,
+            )
+            .values(generated=SiteDailyCounter.generated + n)
+            .returning(SiteDailyCounter.generated)
+        )
+        if db.execute(reserve).first() is not None:
+            return n
+        generated = (
+            db.query(SiteDailyCounter.generated)
+            .filter(SiteDailyCounter.site_id == site_id, SiteDailyCounter.day == day)
+            .scalar()
+        )
+        if generated is None:
+            # First draft of the day: seed the counter from the table (a
+            # worker that seeds it concurrently wins; ours is then a no-op)
+            generated = count_today_generated(db, site_id)
+            seed = [{"site_id": site_id, "day": day, "generated": generated}]
+            _seed_counters(db, seed)
+        n = min(n, quota - generated)
+    return 0
+
+
+def reconcile_daily_counters(db) -> int:
+    """Reset today's counters to the drafts actually in ``content_queue``
+    (0 for sites with none left) and drop earlier days; returns the number
+    of counters corrected or seeded.
+
+    Today's counters are locked first, in site id order like reservations,
+    so the count is taken only after in-flight reservations have committed
+    their drafts. Counters that do not exist yet are only seeded, never
+    overwritten, in case a reservation seeds one meanwhile.
+    """
+    day = _today()
+    db.query(SiteDailyCounter).filter(SiteDailyCounter.day < day).delete(
+        synchronize_session=False
     )
+    counters = {
+        site_id: generated
+        for site_id, generated in db.query(
+            SiteDailyCounter.site_id, SiteDailyCounter.generated
+        )
+        .filter(SiteDailyCounter.day == day)
+        .order_by(SiteDailyCounter.site_id)
+        .with_for_update()
+    }
+    counts = dict(_generated_on(db, day).all())
+    stale = [
+        {"site_id": site_id, "day": day, "generated": counts.get(site_id, 0)}
+        for site_id, generated in counters.items()
+        if generated != counts.get(site_id, 0)
+    ]
+    if stale:
+        db.execute(update(SiteDailyCounter), stale)
+    missing = [
+        {"site_id": site_id, "day": day, "generated": count}
+        for site_id, count in counts.items()
+        if site_id not in counters
+    ]
+    if missing:
+        _seed_counters(db, missing)
+    db.commit()
+    return len(stale) + len(missing)
 
 
+def score_unscored(db) -> int:
+    """Store checklist scores on rows that have none (written by raw SQL or
+    before scores were stored), ``SCORE_BATCH`` rows per commit; returns how
+    many were scored."""
+    scored = last_id = 0
+    while True:
+        rows = db.execute(
+            select(ContentQueue.id, ContentQueue.title, ContentQueue.body)
+            .where(ContentQueue.checklist_hash.is_(None), ContentQueue.id > last_id)
+            .order_by(ContentQueue.id)
+            .limit(SCORE_BATCH)
+        ).all()
+        if not rows:
+            return scored
+        db.execute(
+            update(ContentQueue),
+            [
+                dict(checklist_columns(r.title or "", r.body or ""), id=r.id)
+                for r in rows
+            ],
+        )
+        db.commit()
+        scored += len(rows)
+        last_id = rows[-1].id
+
+
+def claim_keywords(db, site_id: int, n: int, now: datetime) -> list[str]:
+    """Take ``site_id``'s ``n`` least recently used keywords and mark them
+    used at ``now``, in one ``UPDATE ... RETURNING``.
+
+    The candidates come from a range scan of ``ix_keywords_site_last_used_id``
+    however many keywords the site has. On PostgreSQL rows locked by another
+    transaction are skipped, so parallel batches never claim the same one.
+    """
+    lru = (
+        select(Keyword.id)
+        .where(Keyword.site_id == site_id)
+        .order_by(Keyword.last_used_at, Keyword.id)
+        .limit(n)
+        .with_for_update(skip_locked=True)
+    )
+    claimed = db.execute(
+        update(Keyword)
+        .where(Keyword.id.in_(lru.scalar_subquery()))
+        .values(last_used_at=now)
+        .returning(Keyword.id, Keyword.keyword)
+        .execution_options(synchronize_session=False)
+    ).all()
+    return [keyword for _, keyword in sorted(claimed)]
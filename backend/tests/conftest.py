@@ -1,9 +1,11 @@
 import os
 import sys
 import tempfile
+from contextlib import contextmanager
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
 sys.path.insert(0, str(__file__).rsplit("/tests/", 1)[0])
 
@@ -12,6 +14,8 @@ os.environ.setdefault(
 )
 os.environ.setdefault("BACKEND_CORS_ORIGINS", "http://localhost:3000")
 os.environ.setdefault("JWT_SECRET", "test-secret")
+os.environ.setdefault("WP_GUARD_REDIS_URL", "")  # in-process breaker state
+os.environ.setdefault("CELERY_METRICS_REDIS_URL", "")
 
 from src.api.main import app  # noqa: E402
 from src.database.models import Base  # noqa: E402
@@ -36,3 +40,42 @@ def sqlite_db():
         db.close()
         # Clean up after test
         Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture()
+def auth_headers(client, sqlite_db):
+    client.post(
+        "/api/auth/register",
+        data={"email": "tester@example.com", "password": "123456"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    r = client.post(
+        "/api/auth/login",
+        data={"username": "tester@example.com", "password": "123456"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+@pytest.fixture()
+def max_queries():
+    """Fail the ``with`` block if it issues more than ``limit`` SQL statements."""
+
+    @contextmanager
+    def _cap(limit):
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+        assert len(statements) <= limit, (
+            f"{len(statements)} statements issued (limit {limit}):\n"
+            + "\n".join(statements)
+        )
+
+    return _cap
@@ -0,0 +1,49 @@
+from src.database.models import AuditLog, ContentQueue, Site
+
+
+def test_bulk_status_reports_per_id_outcomes(client, sqlite_db, auth_headers):
+    db = sqlite_db
+    site = Site(name="S", wp_url="https://example.com", wp_username="u", wp_password_enc="p")
+    db.add(site)
+    db.commit()
+    rows = [
+        ContentQueue(site_id=site.id, title="a", body="b", status="pending"),
+        ContentQueue(site_id=site.id, title="c", body="d", status="pending"),
+        ContentQueue(site_id=site.id, title="e", body="f", status="published"),
+    ]
+    db.add_all(rows)
+    db.commit()
+    ids = [r.id for r in rows]
+
+    r = client.post(
+        "/api/content-queue/bulk-status",
+        json={"ids": ids + [9999], "status": "approved"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert data["updated"] == 2
+    assert {item["id"]: item["error"] for item in data["results"]} == {
+        ids[0]: None,
+        ids[1]: None,
+        ids[2]: "invalid_from:published",
+        9999: "not_found",
+    }
+
+    db.expire_all()
+    assert [db.get(ContentQueue, i).status for i in ids] == [
+        "approved",
+        "approved",
+        "published",
+    ]
+    logged = {a.target_id for a in db.query(AuditLog).filter(AuditLog.action == "approve")}
+    assert logged == set(ids[:2])
+
+
+def test_bulk_status_rejects_unknown_status(client, sqlite_db, auth_headers):
+    r = client.post(
+        "/api/content-queue/bulk-status",
+        json={"ids": [1], "status": "archived"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 400
@@ -0,0 +1,106 @@
+import json
+
+from src.database.models import ContentQueue, Site
+
+
+def test_import_streams_ndjson_in_chunks(client, sqlite_db, auth_headers, monkeypatch):
+    from src.core import content_import
+
+    monkeypatch.setattr(content_import, "CHUNK_ROWS", 3)
+    db = sqlite_db
+    site = Site(name="S", wp_url="https://example.com", wp_username="u", wp_password_enc="p")
+    db.add(site)
+    db.commit()
+
+    lines = [
+        json.dumps({"request_id": f"r-{i}", "title": f"T{i}", "body": "b"})
+        for i in range(7)
+    ]
+    lines.insert(2, "{not json")
+    lines.append(json.dumps({"title": "x", "site_id": 999}))
+    lines.append(json.dumps({"title": "", "body": "missing title"}))
+    lines.append("")
+
+    r = client.post(
+        "/api/content-queue/import",
+        params={"site_id": site.id},
+        content="\n".join(lines).encode(),
+        headers=dict(auth_headers, **{"Content-Type": "application/x-ndjson"}),
+    )
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert data["accepted"] == 7
+    assert data["rejected"] == 3
+    assert sorted(e["line"] for e in data["errors"]) == [3, 9, 10]
+    assert db.query(ContentQueue).filter(ContentQueue.site_id == site.id).count() == 7
+
+
+def test_export_streams_ndjson_and_csv(client, sqlite_db, auth_headers, monkeypatch):
+    from src.api.routes import content
+
+    monkeypatch.setattr(content, "EXPORT_BATCH_ROWS", 2)
+    db = sqlite_db
+    site = Site(name="S", wp_url="https://example.com", wp_username="u", wp_password_enc="p")
+    db.add(site)
+    db.commit()
+    db.add_all(
+        [ContentQueue(site_id=site.id, title=f"Bài {i}", body="a,\"b\"") for i in range(5)]
+    )
+    db.commit()
+
+    r = client.get("/api/content-queue/export", headers=auth_headers)
+    assert r.status_code == 200
+    rows = [json.loads(line) for line in r.text.splitlines()]
+    assert [row["title"] for row in rows] == [f"Bài {i}" for i in range(5)]
+
+    r = client.get(
+        "/api/content-queue/export", params={"format": "csv"}, headers=auth_headers
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/csv")
+    lines = r.text.splitlines()
+    assert lines[0] == "id,site_id,title,body,status,created_at,updated_at"
+    assert len(lines) == 6
+
+
+def test_import_reports_a_failed_chunk_and_keeps_going(
+    client, sqlite_db, auth_headers, monkeypatch
+):
+    from src.core import content_import
+
+    monkeypatch.setattr(content_import, "CHUNK_ROWS", 2)
+    db = sqlite_db
+    site = Site(name="S", wp_url="https://example.com", wp_username="u", wp_password_enc="p")
+    db.add(site)
+    db.commit()
+
+    chunks = []
+    real_insert = content_import.insert
+
+    def _insert(table):
+        chunks.append(table)
+        if len(chunks) == 2:
+            raise RuntimeError("deadlock detected")
+        return real_insert(table)
+
+    monkeypatch.setattr(content_import, "insert", _insert)
+    lines = [json.dumps({"title": f"T{i}", "body": None}) for i in range(5)]
+
+    r = client.post(
+        "/api/content-queue/import",
+        params={"site_id": site.id},
+        content="\n".join(lines).encode(),
+        headers=dict(auth_headers, **{"Content-Type": "application/x-ndjson"}),
+    )
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert data["accepted"] == 3
+    assert data["rejected"] == 2
+    assert data["errors"] == [
+        {"line": 3, "last_line": 4, "error": "write_failed: deadlock detected"}
+    ]
+    titles = [
+        t for (t,) in db.query(ContentQueue.title).filter(ContentQueue.site_id == site.id)
+    ]
+    assert sorted(titles) == ["T0", "T1", "T4"]
+    assert db.query(ContentQueue).filter(ContentQueue.body != "").count() == 0
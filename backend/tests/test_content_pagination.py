@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta
+
+from src.database.models import ContentQueue, Site
+
+
+def seed_content(db, count, status="pending"):
+    site = Site(name="S", wp_url="https://example.com", wp_username="u", wp_password_enc="p")
+    db.add(site)
+    db.commit()
+    base = datetime(2025, 10, 1)
+    db.add_all(
+        [
+            ContentQueue(
+                site_id=site.id,
+                title=f"Post {i}",
+                body="body",
+                status=status,
+                # Pairs of rows share a timestamp so the id tie-breaker matters
+                created_at=base + timedelta(minutes=i // 2),
+            )
+            for i in range(count)
+        ]
+    )
+    db.commit()
+    return site
+
+
+def walk(client, headers, params):
+    seen, cursor = [], None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        r = client.get("/api/content-queue/", params=query, headers=headers)
+        assert r.status_code == 200, r.text
+        seen.extend(item["id"] for item in r.json())
+        cursor = r.headers.get("x-next-cursor")
+        if not cursor:
+            return seen
+
+
+def test_cursor_walks_every_row_once(client, sqlite_db, auth_headers):
+    seed_content(sqlite_db, 25)
+    ids = walk(client, auth_headers, {"limit": 4})
+    assert len(ids) == 25
+    assert len(set(ids)) == 25
+
+
+def test_cursor_matches_page_order_for_status_view(client, sqlite_db, auth_headers):
+    site = seed_content(sqlite_db, 9)
+    params = {"limit": 3, "status": "pending", "site_id": site.id}
+    ids = walk(client, auth_headers, params)
+    paged = []
+    for page in (1, 2, 3):
+        r = client.get(
+            "/api/content-queue/", params=dict(params, page=page), headers=auth_headers
+        )
+        paged.extend(item["id"] for item in r.json())
+    assert ids == paged == sorted(ids, reverse=True)
+
+
+def test_invalid_cursor_rejected(client, sqlite_db, auth_headers):
+    r = client.get(
+        "/api/content-queue/", params={"cursor": "not-a-cursor"}, headers=auth_headers
+    )
+    assert r.status_code == 400
+
+
+def test_summary_view_defers_body(client, sqlite_db, auth_headers, max_queries):
+    site = seed_content(sqlite_db, 3)
+    row = sqlite_db.query(ContentQueue).filter(ContentQueue.site_id == site.id).first()
+    row.body = "x" * 5000
+    sqlite_db.commit()
+
+    with max_queries(2) as statements:
+        r = client.get(
+            "/api/content-queue/",
+            params={"view": "summary", "status": "pending"},
+            headers=auth_headers,
+        )
+    assert r.status_code == 200, r.text
+    items = r.json()
+    assert all("content" not in item for item in items)
+    long_item = next(item for item in items if item["id"] == row.id)
+    assert long_item["excerpt"] == "x" * 200 + "…"
+    # the list query slices the body instead of selecting the column
+    assert "AS content_queue_body" not in statements[-1]
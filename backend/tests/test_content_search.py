@@ -0,0 +1,24 @@
+from src.database.models import ContentQueue, Site
+
+
+def test_search_ranks_title_matches_first(client, sqlite_db, auth_headers):
+    db = sqlite_db
+    site = Site(name="S", wp_url="https://example.com", wp_username="u", wp_password_enc="p")
+    db.add(site)
+    db.commit()
+    db.add_all(
+        [
+            ContentQueue(site_id=site.id, title="Hướng dẫn SEO", body="nội dung"),
+            ContentQueue(site_id=site.id, title="Khác", body="bài về seo onpage"),
+            ContentQueue(site_id=site.id, title="Không liên quan", body="gì đó"),
+        ]
+    )
+    db.commit()
+
+    r = client.get(
+        "/api/content-queue/search", params={"q": "seo"}, headers=auth_headers
+    )
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert [item["title"] for item in data] == ["Hướng dẫn SEO", "Khác"]
+    assert data[0]["rank"] > data[1]["rank"]
@@ -0,0 +1,27 @@
+from src.database.models import ContentQueue, Site
+
+
+def test_stats_groups_by_site_and_status(client, sqlite_db, auth_headers, max_queries):
+    db = sqlite_db
+    sites = [
+        Site(name=f"S{i}", wp_url="https://example.com", wp_username="u", wp_password_enc="p")
+        for i in range(3)
+    ]
+    db.add_all(sites)
+    db.commit()
+    for i, status in enumerate(["pending", "pending", "approved", "published"]):
+        db.add(ContentQueue(site_id=sites[0].id, title=f"a{i}", body="b", status=status))
+    db.add(ContentQueue(site_id=sites[1].id, title="c", body="d", status="rejected"))
+    db.commit()
+
+    # auth lookup + one GROUP BY, whatever the number of sites
+    with max_queries(2):
+        r = client.get("/api/content-queue/stats", headers=auth_headers)
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert data["total"] == 5
+    assert data["totals"] == {"pending": 2, "approved": 1, "rejected": 1, "published": 1}
+    by_site = {s["site_id"]: s for s in data["sites"]}
+    assert set(by_site) == {sites[0].id, sites[1].id}
+    assert by_site[sites[0].id]["counts"]["pending"] == 2
+    assert by_site[sites[1].id]["total"] == 1
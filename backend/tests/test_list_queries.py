@@ -0,0 +1,51 @@
+from src.database.models import (
+    ContentQueue,
+    Keyword,
+    Role,
+    RoleApplication,
+    Site,
+    User,
+)
+
+# get_current_user + role lookup + the list query itself
+REQUEST_STATEMENT_CAP = 4
+
+
+def seed(db, sites=5, per_site=10):
+    admin = db.query(User).filter(User.email == "tester@example.com").first()
+    admin.role_id = db.query(Role).filter(Role.name == "admin").first().id
+    for s in range(sites):
+        site = Site(
+            name=f"S{s}", wp_url="https://example.com", wp_username="u", wp_password_enc="p"
+        )
+        db.add(site)
+        db.flush()
+        for i in range(per_site):
+            db.add(ContentQueue(site_id=site.id, title=f"T{s}-{i}", body="b"))
+            db.add(Keyword(site_id=site.id, keyword=f"k{s}-{i}"))
+        user = User(email=f"u{s}@example.com", password_hash="x", role_id=admin.role_id)
+        db.add(user)
+        db.flush()
+        db.add(
+            RoleApplication(
+                user_id=user.id,
+                requested_role="manager",
+                status="approved",
+                reviewed_by=admin.id,
+            )
+        )
+    db.commit()
+
+
+def test_list_endpoints_do_not_query_per_row(client, sqlite_db, auth_headers, max_queries):
+    seed(sqlite_db)
+    for path in (
+        "/api/content-queue/?limit=50",
+        "/api/keywords/?limit=50",
+        "/api/users/",
+        "/api/role-applications/",
+    ):
+        with max_queries(REQUEST_STATEMENT_CAP):
+            r = client.get(path, headers=auth_headers)
+        assert r.status_code == 200, (path, r.text)
+        assert len(r.json()) >= 5
@@ -0,0 +1,120 @@
+import itertools
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+import fake_wordpress  # noqa: E402
+from src.core import remote_posts, site_limits, wordpress_client  # noqa: E402
+from src.core.remote_posts import sync_site, title_hash  # noqa: E402
+from src.core.wordpress_client import (  # noqa: E402
+    WordPressClient,
+    WordPressCredentials,
+)
+from src.database.models import ContentQueue, PublishRequest, RemotePost, Site  # noqa: E402
+
+
+@pytest.fixture()
+def fake_wp(monkeypatch):
+    monkeypatch.setattr(wordpress_client, "_sessions", {})
+    monkeypatch.setattr(site_limits, "WP_RATE_PER_SEC", 10000.0)
+    monkeypatch.setattr(site_limits, "WP_RATE_BURST", 10000)
+    # One "second" per write so incremental syncs have something to skip
+    clock = (datetime(2025, 1, 1) + timedelta(seconds=i) for i in itertools.count())
+    monkeypatch.setattr(fake_wordpress, "_now", lambda: next(clock).isoformat())
+    server = fake_wordpress.FakeWordPress(
+        ("127.0.0.1", 0), fake_wordpress.FakeWordPressConfig(latency_ms=0, jitter_ms=0)
+    ).start()
+    yield server
+    server.stop()
+
+
+def _site(db, url):
+    site = Site(name="S", wp_url=url, wp_username="u", wp_password_enc="p")
+    db.add(site)
+    db.commit()
+    return site
+
+
+def test_sync_is_incremental(sqlite_db, fake_wp, monkeypatch):
+    monkeypatch.setattr(remote_posts, "SYNC_PER_PAGE", 10)
+    site = _site(sqlite_db, f"{fake_wp.url}/blog")
+    wp = WordPressClient(
+        WordPressCredentials(base_url=site.wp_url, username="u", password="p")
+    )
+    for i in range(25):
+        wp.create_post(title=f"Post {i}", content="c")
+
+    sync_site(sqlite_db, site, wp)
+    assert sqlite_db.query(RemotePost).count() == 25
+    mirrored = sqlite_db.get(RemotePost, (site.id, 7))
+    assert mirrored.title_hash == title_hash("Post 6")
+    requests_after_full_sync = fake_wp.stats["requests"]
+
+    # Only the overlap second is re-read when nothing changed
+    assert sync_site(sqlite_db, site, wp) == 1
+    wp.update_post(7, title="Renamed &amp; “quoted”")
+    assert sync_site(sqlite_db, site, wp) == 2
+    assert fake_wp.stats["requests"] - requests_after_full_sync == 3
+    sqlite_db.expire_all()
+    assert sqlite_db.get(RemotePost, (site.id, 7)).title_hash == title_hash(
+        'renamed & "quoted"'
+    )
+
+
+def test_publish_never_overwrites_a_post_it_did_not_create(
+    client, sqlite_db, auth_headers, fake_wp, monkeypatch
+):
+    from src.scheduler.celery_app import app as celery_app
+
+    monkeypatch.setattr(celery_app.conf, "task_always_eager", True)
+    site = _site(sqlite_db, f"{fake_wp.url}/blog")
+    wp = WordPressClient(
+        WordPressCredentials(base_url=site.wp_url, username="u", password="p")
+    )
+    title = "A publishable title"
+    existing = wp.create_post(title=title, content="old")
+    sync_site(sqlite_db, site, wp)
+    body = "\n## Heading\n" + "x" * 250
+    rows = [
+        ContentQueue(site_id=site.id, title=title, body=body, status="approved")
+        for _ in range(2)
+    ]
+    sqlite_db.add_all(rows)
+    sqlite_db.commit()
+
+    r = client.post(
+        "/api/content-queue/publish-batch", json={"ids": [rows[0].id]}, headers=auth_headers
+    )
+    assert r.json()["results"][0]["error"] == f"duplicate_remote_post:{existing['id']}"
+
+    job = client.post(f"/api/content-queue/{rows[1].id}/publish", headers=auth_headers)
+    assert job.json()["status"] == "failed"
+    assert job.json()["error"] == f"duplicate_remote_post:{existing['id']}"
+    assert (fake_wp.stats["created"], fake_wp.stats["updated"]) == (1, 0)
+
+
+def test_publish_retry_takes_over_the_post_its_last_attempt_created(
+    sqlite_db, fake_wp
+):
+    from src.scheduler.tasks import publish_content_task
+
+    site = _site(sqlite_db, f"{fake_wp.url}/blog")
+    wp = WordPressClient(
+        WordPressCredentials(base_url=site.wp_url, username="u", password="p")
+    )
+    sync_site(sqlite_db, site, wp)
+    # The first attempt created the post, then timed out before saving its id
+    req = PublishRequest(
+        idempotency_key="k", site_id=site.id, title="Retried", body="b", attempts=1
+    )
+    sqlite_db.add(req)
+    sqlite_db.commit()
+    created = wp.create_post(title="Retried", content="b")
+
+    result = publish_content_task.apply(args=(req.id,)).get()
+    assert result == {"id": req.id, "status": "succeeded", "post_id": created["id"]}
+    assert (fake_wp.stats["created"], fake_wp.stats["updated"]) == (1, 1)
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta, timezone
+
+from src.database.models import Role, Site, User
+from src.scheduler import tasks
+from src.scheduler.dispatcher import SiteDispatcher, next_fire, parse_cron
+
+UTC = timezone.utc
+
+
+def _site(db, cron, enabled=True):
+    site = Site(
+        name="s",
+        wp_url="http://example.com",
+        wp_username="u",
+        wp_password_enc="p",
+        is_auto_enabled=enabled,
+        schedule_cron=cron,
+    )
+    db.add(site)
+    db.commit()
+    return site
+
+
+def test_next_fire_reads_cron_in_celery_timezone():
+    # 09:00 in Asia/Ho_Chi_Minh (UTC+7) is 02:00 UTC
+    fire_at = next_fire(parse_cron("0 9 * * *"), datetime(2025, 1, 1, 3, tzinfo=UTC))
+    assert fire_at == datetime(2025, 1, 2, 2, tzinfo=UTC)
+    every_minute = next_fire(parse_cron("* * * * *"), datetime(2025, 1, 1, 3, 7, 30, tzinfo=UTC))
+    assert every_minute == datetime(2025, 1, 1, 3, 8, tzinfo=UTC)
+    assert next_fire(parse_cron("0 0 31 2 *"), fire_at) is None
+
+
+def test_dispatcher_collapses_missed_fires():
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    hourly = Site(id=1, is_auto_enabled=True, schedule_cron="0 * * * *")
+    daily = Site(id=2, is_auto_enabled=True, schedule_cron="30 8 * * *")
+    off = Site(id=3, is_auto_enabled=False, schedule_cron="* * * * *")
+    dispatcher = SiteDispatcher()
+    dispatcher.load([hourly, daily, off], after=start)
+    assert len(dispatcher) == 2
+
+    assert dispatcher.due(start + timedelta(minutes=59)) == []
+    assert dispatcher.due(start + timedelta(hours=1, minutes=1)) == [1]
+    # 08:30 local = 01:30 UTC
+    assert dispatcher.due(start + timedelta(hours=1, minutes=31)) == [2]
+    # Five hourly fires missed: the site is enqueued once, not five times
+    assert dispatcher.due(start + timedelta(hours=6, minutes=1)) == [1]
+    assert dispatcher.due(start + timedelta(hours=6, minutes=2)) == []
+
+
+def _tick_at(monkeypatch, *times):
+    enqueued = []
+    monkeypatch.setattr(tasks.generate_drafts_for_sites, "delay", enqueued.append)
+    monkeypatch.setattr(tasks, "_dispatcher", SiteDispatcher())
+    clock = iter(datetime(2025, 1, 1, h, m, tzinfo=UTC) for h, m in times)
+    monkeypatch.setattr(tasks, "_utcnow", lambda: next(clock))
+    return enqueued
+
+
+def test_dispatch_tick_enqueues_only_due_sites(sqlite_db, monkeypatch):
+    hourly = _site(sqlite_db, "0 * * * *")
+    _site(sqlite_db, "0 9 * * *")
+    _site(sqlite_db, "* * * * *", enabled=False)
+    enqueued = _tick_at(monkeypatch, (0, 30), (0, 59), (1, 0))
+
+    assert tasks.dispatch_due_sites() == 0  # first tick only records the window
+    assert tasks.dispatch_due_sites() == 0
+    assert tasks.dispatch_due_sites() == 1
+    assert enqueued == [[hourly.id]]
+
+
+def test_schedule_edits_apply_on_next_tick(
+    client, sqlite_db, auth_headers, monkeypatch
+):
+    user = sqlite_db.query(User).filter(User.email == "tester@example.com").first()
+    user.role_id = sqlite_db.query(Role).filter(Role.name == "manager").first().id
+    daily = _site(sqlite_db, "0 9 * * *")
+    off = _site(sqlite_db, "30 * * * *", enabled=False)
+    enqueued = _tick_at(monkeypatch, (0, 0), (0, 10), (0, 31))
+    tasks.dispatch_due_sites()
+
+    def _full_reload(*args, **kwargs):
+        raise AssertionError("edited sites should be reloaded one by one")
+
+    monkeypatch.setattr(tasks._dispatcher, "load", _full_reload)
+
+    r = client.patch(
+        f"/api/sites/{daily.id}", json={"schedule_cron": "5 * * * *"}, headers=auth_headers
+    )
+    assert r.status_code == 200
+    # Written straight through the ORM, as the Telegram bot does
+    off.is_auto_enabled = True
+    added = _site(sqlite_db, "20 * * * *")
+    assert tasks.dispatch_due_sites() == 1
+    assert tasks.dispatch_due_sites() == 2
+    assert enqueued == [[daily.id], [added.id, off.id]]
+    assert tasks._dispatcher.version == 4
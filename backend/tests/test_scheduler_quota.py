@@ -1,7 +1,12 @@
 from datetime import datetime
 
-from src.database.models import ContentQueue, Site
-from src.scheduler.tasks import generate_draft_for_site
+from src.database.models import ContentQueue, Keyword, Site, SiteDailyCounter
+from src.scheduler.tasks import (
+    generate_draft_for_site,
+    generate_drafts,
+    generate_drafts_for_sites,
+)
+from src.scheduler.utils import reconcile_daily_counters
 
 
 def setup_site(db, **overrides):
@@ -44,3 +49,71 @@ def test_active_hours_enforced(sqlite_db):
     site = setup_site(db, active_start_hour=start, active_end_hour=end)
     res = generate_draft_for_site(site.id)
     assert res == 0
+
+
+def test_quota_counter_reconciled_with_table(sqlite_db):
+    db = sqlite_db
+    site = setup_site(db, daily_quota=3)
+    # Drafts added by hand count against the quota from the first reservation
+    db.add(ContentQueue(site_id=site.id, title="manual", body="b"))
+    db.commit()
+    assert generate_draft_for_site(site.id) > 0
+    assert generate_draft_for_site(site.id) > 0
+    assert generate_draft_for_site(site.id) == 0
+    counter = db.query(SiteDailyCounter).filter_by(site_id=site.id).one()
+    assert counter.generated == 3
+
+    db.query(ContentQueue).filter(ContentQueue.title == "manual").delete()
+    db.commit()
+    assert reconcile_daily_counters(db) == 1
+    db.refresh(counter)
+    assert counter.generated == 2
+    assert generate_draft_for_site(site.id) > 0
+    assert generate_draft_for_site(site.id) == 0
+
+    # Every draft deleted: the site is not left blocked for the day
+    db.query(ContentQueue).filter(ContentQueue.site_id == site.id).delete()
+    db.commit()
+    assert reconcile_daily_counters(db) == 1
+    db.refresh(counter)
+    assert counter.generated == 0
+
+
+def test_batched_drafts_stop_at_quota(sqlite_db, max_queries):
+    db = sqlite_db
+    site = setup_site(db, daily_quota=5)
+    other = setup_site(db, daily_quota=10)
+    first = generate_drafts(site.id, 3)
+    assert len(first) == 3
+    assert generate_drafts(site.id, 3) == [first[-1] + 1, first[-1] + 2]
+    assert generate_drafts(site.id, 3) == []
+
+    generate_drafts(other.id, 1)
+
+    # Site lookup, a failed reservation plus re-read for the spent site,
+    # one reservation and one keyword claim for the other, one insert
+    with max_queries(6):
+        created = generate_drafts_for_sites([site.id, other.id, 999], 4)
+    assert list(created) == [other.id] and len(created[other.id]) == 4
+    titles = [r.title for r in db.query(ContentQueue).filter_by(site_id=other.id)]
+    assert len(set(titles)) == 5
+
+
+def test_drafts_rotate_through_least_recently_used_keywords(sqlite_db):
+    db = sqlite_db
+    site = setup_site(db, daily_quota=100)
+    other = setup_site(db, daily_quota=100)
+    db.add_all(Keyword(site_id=site.id, keyword=f"kw{i}") for i in range(5))
+    db.add(Keyword(site_id=other.id, keyword="elsewhere"))
+    db.commit()
+
+    def topics(ids):
+        rows = db.query(ContentQueue).filter(ContentQueue.id.in_(ids))
+        return sorted(r.title.split(" - ")[0] for r in rows)
+
+    assert topics(generate_drafts(site.id, 3)) == ["kw0", "kw1", "kw2"]
+    # Never-used keywords first, then the oldest use
+    assert topics(generate_drafts(site.id, 3)) == ["kw0", "kw3", "kw4"]
+    assert topics(generate_drafts(site.id, 2)) == ["kw1", "kw2"]
+    used = db.query(Keyword).filter_by(site_id=other.id).one()
+    assert used.last_used_at.year == 1970
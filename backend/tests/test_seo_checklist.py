@@ -0,0 +1,182 @@
+from sqlalchemy import text
+from src.core.seo_checklist import checklist, checklist_many
+from src.database.models import ContentQueue, Site
+
+LONG_BODY = "\n## Heading\n" + "x" * 250
+
+
+def test_checklist_single_pass_flags():
+    report = checklist("A good enough title", LONG_BODY + '<img src="a.png">')
+    assert report["warnings"] == ["image_without_alt"]
+    assert report["score"] == 90
+    report = checklist("short", "<h2>t</h2><img alt='x'>")
+    assert report["issues"] == ["title_too_short(<10)", "content_too_short(<200)"]
+    assert report["warnings"] == []
+    assert not report["passed"]
+
+
+def test_checklist_many_parallel_matches_serial():
+    docs = [(f"Title number {i}", LONG_BODY if i % 2 else "tiny") for i in range(1200)]
+    assert checklist_many(docs, parallel=True) == checklist_many(docs, parallel=False)
+
+
+def test_checklist_batch_scores_site_queue(
+    client, sqlite_db, auth_headers, monkeypatch
+):
+    from src.api.routes import content
+
+    db = sqlite_db
+    site = Site(name="S", wp_url="https://example.com", wp_username="u", wp_password_enc="p")
+    db.add(site)
+    db.commit()
+    db.add_all(
+        [
+            ContentQueue(site_id=site.id, title="A good enough title", body=LONG_BODY),
+            ContentQueue(site_id=site.id, title="short", body="tiny"),
+            ContentQueue(site_id=site.id, title="approved", body="x", status="approved"),
+        ]
+    )
+    db.commit()
+    pending = db.query(ContentQueue.id).filter(ContentQueue.status == "pending")
+    ids = [r.id for r in pending.order_by(ContentQueue.id)]
+
+    r = client.post(
+        "/api/content-queue/checklist/batch",
+        json={"site_id": site.id},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert data["count"] == 2
+    assert [item["passed"] for item in data["results"]] == [True, False]
+    assert data["next_after_id"] is None
+
+    # A site's queue is paged, never loaded whole
+    monkeypatch.setattr(content, "CHECKLIST_BATCH_MAX", 1)
+    pages, after_id = [], 0
+    while after_id is not None:
+        r = client.post(
+            "/api/content-queue/checklist/batch",
+            json={"site_id": site.id, "after_id": after_id},
+            headers=auth_headers,
+        )
+        pages.append([item["id"] for item in r.json()["results"]])
+        after_id = r.json()["next_after_id"]
+    assert pages == [[ids[0]], [ids[1]]]
+
+    r = client.post(
+        "/api/content-queue/checklist/batch",
+        json={"items": [{"id": 7, "title": "short", "body": "tiny"}]},
+        headers=auth_headers,
+    )
+    assert r.json()["results"][0]["id"] == 7
+
+
+def test_checklist_persisted_and_rescored_only_on_edit(client, sqlite_db, auth_headers):
+    db = sqlite_db
+    site = Site(name="S", wp_url="https://example.com", wp_username="u", wp_password_enc="p")
+    db.add(site)
+    db.commit()
+    good = ContentQueue(site_id=site.id, title="A good enough title", body=LONG_BODY)
+    bad = ContentQueue(site_id=site.id, title="short", body="tiny")
+    db.add_all([good, bad])
+    db.commit()
+    assert (good.checklist_score, good.checklist_passed) == (100, True)
+    assert (bad.checklist_score, bad.checklist_passed) == (40, False)
+
+    stored_hash = good.checklist_hash
+    good.status = "approved"
+    db.commit()
+    assert good.checklist_hash == stored_hash
+    good.body = "tiny now"
+    db.commit()
+    assert good.checklist_hash != stored_hash
+    assert good.checklist_passed is False
+
+    r = client.get(
+        "/api/content-queue/",
+        params={"sort": "-score", "limit": 1},
+        headers=auth_headers,
+    )
+    first = r.json()[0]
+    r = client.get(
+        "/api/content-queue/",
+        params={"sort": "-score", "limit": 1, "cursor": r.headers["x-next-cursor"]},
+        headers=auth_headers,
+    )
+    second = r.json()[0]
+    assert first["checklist_score"] >= second["checklist_score"]
+    assert {first["id"], second["id"]} == {good.id, bad.id}
+
+    r = client.get(
+        "/api/content-queue/", params={"min_score": 50}, headers=auth_headers
+    )
+    assert [item["id"] for item in r.json()] == [good.id]
+
+    r = client.get(f"/api/content-queue/{bad.id}/checklist", headers=auth_headers)
+    assert r.json()["issues"] == ["title_too_short(<10)", "content_too_short(<200)"]
+
+
+def test_score_cursor_walks_unscored_rows_once(client, sqlite_db, auth_headers):
+    db = sqlite_db
+    site = Site(name="S", wp_url="https://example.com", wp_username="u", wp_password_enc="p")
+    db.add(site)
+    db.commit()
+    scored = ContentQueue(site_id=site.id, title="A good enough title", body=LONG_BODY)
+    db.add(scored)
+    db.commit()
+    # Raw SQL skips the ORM listener, so these stay unscored
+    for title in ("raw one", "raw two"):
+        db.execute(
+            text(
+                "INSERT INTO content_queue (site_id, title, body, status)"
+                " VALUES (:s, :t, 'b', 'pending')"
+            ),
+            {"s": site.id, "t": title},
+        )
+    db.commit()
+    raw = [r.id for r in db.query(ContentQueue.id).filter(ContentQueue.title.like("raw%"))]
+
+    def _walk(sort):
+        ids, params = [], {"sort": sort, "limit": 1}
+        while True:
+            r = client.get("/api/content-queue/", params=params, headers=auth_headers)
+            ids += [item["id"] for item in r.json()]
+            if "x-next-cursor" not in r.headers:
+                return ids
+            params["cursor"] = r.headers["x-next-cursor"]
+
+    assert _walk("-score") == [scored.id, *sorted(raw, reverse=True)]
+    assert _walk("score") == [*sorted(raw), scored.id]
+
+
+def test_reads_score_raw_rows_without_writing(client, sqlite_db, auth_headers):
+    from src.scheduler import utils
+
+    db = sqlite_db
+    site = Site(name="S", wp_url="https://example.com", wp_username="u", wp_password_enc="p")
+    db.add(site)
+    db.commit()
+    for title in ("raw one", "A good enough raw title"):
+        db.execute(
+            text(
+                "INSERT INTO content_queue (site_id, title, body, status)"
+                " VALUES (:s, :t, :b, 'pending')"
+            ),
+            {"s": site.id, "t": title, "b": LONG_BODY},
+        )
+    db.commit()
+    short, good = db.query(ContentQueue).order_by(ContentQueue.id).all()
+
+    r = client.get(f"/api/content-queue/{good.id}", headers=auth_headers)
+    assert (r.json()["checklist_score"], r.json()["checklist_passed"]) == (100, True)
+    r = client.get(f"/api/content-queue/{short.id}/checklist", headers=auth_headers)
+    assert r.json()["issues"] == ["title_too_short(<10)"]
+    db.expire_all()
+    assert [row.checklist_hash for row in db.query(ContentQueue)] == [None, None]
+
+    assert utils.score_unscored(db) == 2
+    assert utils.score_unscored(db) == 0
+    db.expire_all()
+    assert (good.checklist_score, good.checklist_passed) == (100, True)
+    assert short.checklist_passed is False
@@ -0,0 +1,80 @@
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from src.database.models import Role, Site, User
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    delay = 0.2
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        status = 500 if self.path.startswith("/broken/") else 200
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"[]")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def wp_fleet():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_sweep_is_concurrent_and_cached(
+    client, sqlite_db, auth_headers, wp_fleet, max_queries
+):
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        dead = f"http://127.0.0.1:{s.getsockname()[1]}"
+    urls = [f"{wp_fleet}/site{i}" for i in range(30)]
+    urls += [f"{wp_fleet}/broken/", dead]
+    sqlite_db.add_all(
+        Site(name=f"s{i}", wp_url=url, wp_username="u", wp_password_enc="p")
+        for i, url in enumerate(urls)
+    )
+    sqlite_db.commit()
+    # Probing every site and writing its health needs sites.update
+    r = client.post("/api/sites/test-connections", json={}, headers=auth_headers)
+    assert r.status_code == 403
+    user = sqlite_db.query(User).filter(User.email == "tester@example.com").first()
+    user.role_id = sqlite_db.query(Role).filter(Role.name == "manager").first().id
+    sqlite_db.commit()
+
+    started = time.perf_counter()
+    # Auth, one site query and one bulk update: no per-site reloads
+    with max_queries(8):
+        r = client.post("/api/sites/test-connections", json={}, headers=auth_headers)
+    elapsed = time.perf_counter() - started
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert (data["checked"], data["ok"], data["failed"]) == (32, 30, 2)
+    # 32 probes of 0.2s each finish in about one round trip, not 6.4s
+    assert elapsed < 2
+    broken, down = data["results"][-2:]
+    assert (broken["status_code"], broken["error"]) == (500, "http_500")
+    assert down["status_code"] is None and down["error"]
+
+    sites = client.get("/api/sites/", headers=auth_headers).json()
+    assert [s["health_ok"] for s in sites] == [True] * 30 + [False, False]
+    assert sites[0]["health_latency_ms"] >= 200
+    assert sites[0]["health_checked_at"]
+
+    r = client.post(
+        "/api/sites/test-connections",
+        json={"site_ids": [data["results"][0]["site_id"]]},
+        headers=auth_headers,
+    )
+    assert r.json()["checked"] == 1
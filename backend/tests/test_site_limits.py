@@ -0,0 +1,105 @@
+import socket
+import time
+
+import pytest
+from src.core import site_limits, wordpress_client
+from src.core.site_limits import (
+    CircuitOpenError,
+    RateLimitedError,
+    SiteGuard,
+)
+from src.core.wordpress_client import (
+    WordPressClient,
+    WordPressCredentials,
+    site_credentials,
+)
+
+SITE = "http://wp.example"
+
+
+def test_breaker_opens_fails_fast_and_recovers_after_probe(monkeypatch):
+    monkeypatch.setattr(site_limits, "WP_BREAKER_FAILURES", 3)
+    monkeypatch.setattr(site_limits, "WP_BREAKER_COOLDOWN", 0.2)
+    g = SiteGuard(redis_url=None)
+    for _ in range(3):
+        g.acquire(SITE)
+        g.record(SITE, ok=False)
+    assert g.breaker_states([SITE])[SITE]["state"] == "open"
+    with pytest.raises(CircuitOpenError) as exc:
+        g.acquire(SITE)
+    assert 0 < exc.value.retry_in <= 0.2
+
+    time.sleep(0.25)
+    g.acquire(SITE)  # the single probe is let through
+    assert g.breaker_states([SITE])[SITE]["state"] == "half_open"
+    with pytest.raises(CircuitOpenError):
+        g.acquire(SITE)
+    g.record(SITE, ok=True)
+    assert g.breaker_states([SITE])[SITE] == {
+        "state": "closed",
+        "failures": 0,
+        "retry_in": 0.0,
+    }
+
+
+def test_token_bucket_spaces_calls_after_burst(monkeypatch):
+    monkeypatch.setattr(site_limits, "WP_RATE_PER_SEC", 10.0)
+    monkeypatch.setattr(site_limits, "WP_RATE_BURST", 2)
+    monkeypatch.setattr(site_limits, "WP_RATE_MAX_WAIT", 0.15)
+    g = SiteGuard(redis_url=None)
+    assert [g.acquire(SITE) for _ in range(2)] == [0.0, 0.0]
+    assert 0.05 < g.acquire(SITE) <= 0.1  # reserved: wait, then go
+    with pytest.raises(RateLimitedError):
+        g.acquire(SITE)  # next token is further away than the max wait
+    assert g.acquire("http://other.example") == 0.0  # buckets are per site
+
+
+def test_unreachable_site_trips_breaker(client, sqlite_db, auth_headers, monkeypatch):
+    from src.database.models import Site
+
+    monkeypatch.setattr(wordpress_client, "_sessions", {})
+    monkeypatch.setattr(wordpress_client, "WP_MAX_RETRIES", 0)
+    monkeypatch.setattr(site_limits, "WP_BREAKER_FAILURES", 2)
+    monkeypatch.setattr(site_limits.guard, "_breakers", {})
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        dead = f"http://127.0.0.1:{s.getsockname()[1]}"
+    sqlite_db.add(Site(name="down", wp_url=dead, wp_username="u", wp_password_enc="p"))
+    sqlite_db.commit()
+
+    wp = WordPressClient(WordPressCredentials(base_url=dead, username="u", password="p"))
+    for _ in range(2):
+        with pytest.raises(Exception) as exc:
+            wp.test_connection()
+        assert not isinstance(exc.value, CircuitOpenError)
+    with pytest.raises(CircuitOpenError):
+        wp.create_post(title="t", content="c")
+
+    r = client.get("/api/sites/breakers", headers=auth_headers)
+    assert r.status_code == 200, r.text
+    [breaker] = r.json()
+    assert (breaker["name"], breaker["state"], breaker["failures"]) == ("down", "open", 2)
+
+
+def test_breaker_endpoints_key_sites_stored_without_scheme(
+    client, sqlite_db, auth_headers, monkeypatch
+):
+    from src.database.models import Role, Site, User
+
+    user = sqlite_db.query(User).filter(User.email == "tester@example.com").first()
+    user.role_id = sqlite_db.query(Role).filter(Role.name == "manager").first().id
+    monkeypatch.setattr(site_limits, "WP_BREAKER_FAILURES", 1)
+    monkeypatch.setattr(site_limits.guard, "_breakers", {})
+    site = Site(name="bare", wp_url=" blog.example/ ", wp_username="u", wp_password_enc="p")
+    sqlite_db.add(site)
+    sqlite_db.commit()
+    # Clients call the normalized URL, so that is where failures are recorded
+    site_limits.guard.record(site_credentials(site).base_url, ok=False)
+
+    [breaker] = client.get("/api/sites/breakers", headers=auth_headers).json()
+    assert breaker["state"] == "open"
+    r = client.post(f"/api/sites/{site.id}/breaker/reset", headers=auth_headers)
+    assert r.json()["state"] == "closed"
+    assert site_limits.guard.breaker_states(["https://blog.example"]) == {
+        "https://blog.example": {"state": "closed", "failures": 0, "retry_in": 0.0}
+    }
@@ -0,0 +1,25 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[1]
+LOADED = (
+    "import sys, src.api.main; "
+    "print([m for m in sys.modules if m.startswith(('src.scheduler', 'celery'))])"
+)
+
+
+def test_api_import_skips_scheduler_and_database():
+    # An unroutable database: any import-time query would hang on connect
+    env = dict(os.environ, DATABASE_URL="postgresql://u:p@10.255.255.1:5432/db")
+    out = subprocess.run(
+        [sys.executable, "-c", LOADED],
+        cwd=BACKEND,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == "[]"
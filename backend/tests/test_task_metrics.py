@@ -0,0 +1,83 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from src.scheduler import celery_app
+from src.scheduler import metrics as metrics_module
+from src.scheduler.metrics import metrics, queue_lengths
+from src.scheduler.tasks import generate_draft_for_site
+
+
+@pytest.fixture()
+def clean_metrics():
+    metrics.reset()
+    yield metrics
+    metrics.reset()
+
+
+def _run(task, headers, runtime, state):
+    celery_app._stamp_ready_at(headers=headers)
+    task.push_request(id="t1", ready_at=headers["ready_at"], is_eager=False)
+    try:
+        celery_app._start_timer(task_id="t1")
+        time.sleep(runtime)
+        celery_app._record_run(task_id="t1", task=task, state=state)
+    finally:
+        task.pop_request()
+
+
+def test_signals_record_wait_runtime_and_outcome(
+    client, auth_headers, clean_metrics, monkeypatch
+):
+    _run(generate_draft_for_site, {}, 0.02, "SUCCESS")
+    # A countdown is not queue wait: it is measured from the eta
+    eta = datetime.now(timezone.utc) + timedelta(seconds=30)
+    _run(generate_draft_for_site, {"eta": eta.isoformat()}, 0, "RETRY")
+
+    def _no_broker(url, queues, *args):
+        return {q: 0 for q in queues}
+
+    monkeypatch.setattr(metrics_module, "queue_lengths", _no_broker)
+    r = client.get("/scheduler/metrics", headers=auth_headers)
+    assert r.status_code == 200
+    body = r.json()
+    assert set(body["queues"]) == {"celery", "generation", "publish", "maintenance", "dispatch"}
+    stats = body["tasks"]["src.scheduler.tasks.generate_draft_for_site"]
+    assert (stats["succeeded"], stats["failed"], stats["retried"]) == (1, 0, 1)
+    assert stats["runtime"]["count"] == 2
+    assert stats["runtime"]["sum"] >= 0.02
+    assert stats["runtime"]["buckets"]["0.01"] == 1
+    assert stats["wait"]["buckets"]["0.01"] == 2
+
+
+def test_tasks_are_routed_to_their_pools():
+    route = celery_app.app.amqp.router.route
+    assert route({}, "src.scheduler.tasks.publish_content_task")["queue"].name == "publish"
+    bulk = route({}, "src.scheduler.tasks.generate_drafts_for_sites")
+    assert (bulk["queue"].name, bulk["priority"]) == ("generation", 6)
+    tick = route({}, "src.scheduler.tasks.dispatch_due_sites")
+    assert tick["queue"].name == "dispatch"
+
+
+def test_queue_lengths_sum_priority_lists(monkeypatch):
+    lists = {"publish": 2, "publish:6": 3, "generation:9": 40}
+
+    class _Pipe:
+        def __init__(self):
+            self.calls = []
+
+        def llen(self, name):
+            self.calls.append(lists.get(name, 0))
+
+        def execute(self):
+            return self.calls
+
+    class _Redis:
+        def pipeline(self, transaction=True):
+            return _Pipe()
+
+    monkeypatch.setattr(metrics_module.redis.Redis, "from_url", lambda *a, **k: _Redis())
+    assert queue_lengths("redis://broker/0", ["publish", "generation"], [0, 3, 6, 9]) == {
+        "generation": 40,
+        "publish": 5,
+    }
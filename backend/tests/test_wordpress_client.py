@@ -0,0 +1,253 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from src.core import wordpress_client
+from src.core.wordpress_client import (
+    PublishJob,
+    WordPressClient,
+    WordPressCredentials,
+    publish_many,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    statuses: list[int] = []
+    delay = 0.0
+    lock = threading.Lock()
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+    paths: list[str] = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.paths.append(self.path)
+        site = self.path.split("/wp-json")[0]
+        with self.lock:
+            self.in_flight[site] = self.in_flight.get(site, 0) + 1
+            self.peak[site] = max(self.peak.get(site, 0), self.in_flight[site])
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight[site] -= 1
+        status = self.statuses.pop(0) if self.statuses else 201
+        body = json.dumps({"id": 1, "link": "http://wp/1"}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def wp_server(monkeypatch):
+    monkeypatch.setattr(wordpress_client, "_sessions", {})
+    monkeypatch.setattr(wordpress_client, "WP_RETRY_BACKOFF", 0)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_is_shared_and_connections_reused(wp_server):
+    creds = WordPressCredentials(base_url=wp_server, username="u", password="p")
+    for _ in range(3):
+        WordPressClient(creds).create_post(title="t", content="c")
+    assert WordPressClient(creds).session is WordPressClient(creds).session
+    stats = wordpress_client.connection_stats()[wp_server]
+    assert stats == {"requests": 3, "connections": 1, "reused": 2}
+
+
+def test_post_retried_on_429_but_not_on_5xx(wp_server):
+    client = WordPressClient(
+        WordPressCredentials(base_url=wp_server, username="u", password="p")
+    )
+    _Handler.statuses = [429, 429]
+    assert client.create_post(title="t", content="c")["id"] == 1
+    _Handler.statuses = [503]
+    with pytest.raises(Exception):
+        client.create_post(title="t", content="c")
+    assert _Handler.statuses == []
+
+
+def test_every_retry_passes_through_the_site_guard(wp_server, monkeypatch):
+    from src.core import site_limits
+
+    calls = []
+    monkeypatch.setattr(site_limits.guard, "acquire", lambda url: calls.append(url) or 0)
+    monkeypatch.setattr(site_limits.guard, "record", lambda url, ok: calls.append(ok))
+    client = WordPressClient(
+        WordPressCredentials(base_url=wp_server, username="u", password="p")
+    )
+    _Handler.statuses = [429, 429]
+    client.create_post(title="t", content="c")
+    # One token and one breaker result per request actually sent
+    assert calls == [wp_server, True] * 3
+
+
+def test_publish_many_respects_per_site_limit(wp_server, monkeypatch):
+    monkeypatch.setattr(_Handler, "delay", 0.05)
+    monkeypatch.setattr(_Handler, "peak", {})
+    jobs = [
+        PublishJob(
+            key=i,
+            creds=WordPressCredentials(
+                base_url=f"{wp_server}/site{i % 2}", username="u", password="p"
+            ),
+            title="t",
+            content="c",
+        )
+        for i in range(12)
+    ]
+    started = time.perf_counter()
+    results = asyncio.run(publish_many(jobs, max_concurrency=8, per_site_concurrency=2))
+    elapsed = time.perf_counter() - started
+
+    assert [r.key for r in results] == list(range(12))
+    assert all(r.ok for r in results)
+    assert max(_Handler.peak.values()) <= 2
+    # 2 sites x 2 slots in parallel: 3 rounds, not 12 sequential requests
+    assert elapsed < 12 * 0.05
+
+
+def test_async_client_keeps_guard_calls_off_the_event_loop(wp_server, monkeypatch):
+    from src.core import site_limits
+
+    loop_thread = threading.get_ident()
+    guard_threads = []
+    acquire, record = site_limits.guard.acquire, site_limits.guard.record
+
+    def _acquire(base_url):
+        guard_threads.append(threading.get_ident())
+        return acquire(base_url)
+
+    def _record(base_url, ok):
+        guard_threads.append(threading.get_ident())
+        record(base_url, ok)
+
+    monkeypatch.setattr(site_limits.guard, "acquire", _acquire)
+    monkeypatch.setattr(site_limits.guard, "record", _record)
+    jobs = [
+        PublishJob(
+            key=0,
+            creds=WordPressCredentials(base_url=wp_server, username="u", password="p"),
+            title="t",
+            content="c",
+        )
+    ]
+    assert asyncio.run(publish_many(jobs))[0].ok
+    assert len(guard_threads) == 2 and loop_thread not in guard_threads
+
+
+def test_publish_batch_endpoint(
+    client, sqlite_db, auth_headers, wp_server, max_queries
+):
+    from sqlalchemy import update
+    from src.database.models import ContentQueue, Site
+
+    db = sqlite_db
+    site = Site(name="S", wp_url=wp_server, wp_username="u", wp_password_enc="p")
+    db.add(site)
+    db.commit()
+    body = "\n## Heading\n" + "x" * 250
+    title = "A publishable title"
+    ready = ContentQueue(site_id=site.id, title=title, body=body, status="approved")
+    pending = ContentQueue(site_id=site.id, title=title, body=body)
+    db.add_all([ready, pending])
+    db.commit()
+    ids = [ready.id, pending.id]
+    # Stale checklists: the endpoint rescores and commits before publishing
+    db.execute(update(ContentQueue).values(checklist_hash=None))
+    db.commit()
+
+    with max_queries(20) as statements:
+        r = client.post(
+            "/api/content-queue/publish-batch", json={"ids": ids}, headers=auth_headers
+        )
+    # No row is reloaded one by one after the rescore commit
+    assert not [
+        q for q in statements if q.startswith("SELECT") and "content_queue.id = ?" in q
+    ]
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert data["published"] == 1
+    assert data["results"][0] == {
+        "id": ready.id,
+        "ok": True,
+        "post_id": 1,
+        "link": "http://wp/1",
+        "error": None,
+    }
+    assert data["results"][1]["error"] == "invalid_from:pending"
+    db.expire_all()
+    assert db.get(ContentQueue, ready.id).status == "published"
+
+
+def test_publish_is_queued_once_and_republish_updates_post(
+    client, sqlite_db, auth_headers, wp_server, monkeypatch
+):
+    from src.database.models import ContentQueue, Site
+    from src.scheduler.celery_app import app as celery_app
+
+    monkeypatch.setattr(celery_app.conf, "task_always_eager", True)
+    monkeypatch.setattr(_Handler, "paths", [])
+    db = sqlite_db
+    site = Site(name="S", wp_url=wp_server, wp_username="u", wp_password_enc="p")
+    db.add(site)
+    db.commit()
+    row = ContentQueue(
+        site_id=site.id, title="A publishable title", body="\n## Heading\n" + "x" * 250
+    )
+    db.add(row)
+    db.commit()
+
+    url = f"/api/content-queue/{row.id}/publish"
+    r = client.post(url, headers=auth_headers)
+    assert r.status_code == 202, r.text
+    job = r.json()
+    assert job["status"] == "succeeded"
+    assert (job["post_id"], job["link"]) == (1, "http://wp/1")
+    # Same content version: same job, no second request to WordPress
+    assert client.post(url, headers=auth_headers).json()["job_id"] == job["job_id"]
+    assert _Handler.paths == ["/wp-json/wp/v2/posts"]
+
+    r = client.get(f"/api/content-queue/publish-jobs/{job['job_id']}", headers=auth_headers)
+    assert r.json() == job
+    db.expire_all()
+    assert (row.status, row.wp_post_id, row.wp_link) == ("published", 1, "http://wp/1")
+
+    row.body += " edited"
+    db.commit()
+    second = client.post(url, headers=auth_headers).json()
+    assert second["job_id"] != job["job_id"]
+    assert second["status"] == "succeeded"
+    assert _Handler.paths[-1] == "/wp-json/wp/v2/posts/1"
+
+
+def test_unexpected_publish_error_fails_the_job(sqlite_db, monkeypatch):
+    from src.database.models import PublishRequest, Site
+    from src.scheduler import tasks
+
+    db = sqlite_db
+    site = Site(name="S", wp_url="http://wp.invalid", wp_username="u", wp_password_enc="p")
+    db.add(site)
+    db.commit()
+    req = PublishRequest(idempotency_key="k", site_id=site.id, title="T", body="b")
+    db.add(req)
+    db.commit()
+
+    def _broken(*args):
+        raise RuntimeError("mirror unavailable")
+
+    monkeypatch.setattr(tasks, "find_duplicates", _broken)
+    result = tasks.publish_content_task.apply(args=(req.id,))
+    assert isinstance(result.result, RuntimeError)
+    db.expire_all()
+    assert (req.status, req.error) == ("failed", "RuntimeError: mirror unavailable")
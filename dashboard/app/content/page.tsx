@@ -4,8 +4,19 @@ import { useRouter } from 'next/navigation';
 import React, { useEffect, useState } from 'react';
 
 type Content = { site_id: number; title: string; body?: string | null; status?: string };
+type PublishJob = {
+    job_id: number;
+    status: 'queued' | 'running' | 'succeeded' | 'failed';
+    post_id?: number | null;
+    link?: string | null;
+    error?: string | null;
+};
 type Checklist = { passed: boolean; score: number; issues: string[]; warnings: string[] };
 
+// Long enough for the worker's retries (30s backoff, doubled up to 5 times)
+const PUBLISH_POLL_MS = 2000;
+const PUBLISH_POLL_DEADLINE_MS = 20 * 60 * 1000;
+
 export default function ContentPage() {
     const router = useRouter();
     const [items, setItems] = useState<Content[]>([]);
@@ -63,19 +74,31 @@ export default function ContentPage() {
                 setPublishMsg(null);
                 return;
             }
-            const res = await apiFetch<{ ok: boolean; post_id?: number; link?: string; raw?: any }>(
-                '/content/publish',
-                {
-                    method: 'POST',
-                    body: JSON.stringify({
-                        site_id: content.site_id,
-                        title: content.title,
-                        body: content.body || '',
-                        status: 'draft',
-                    }),
+            let job = await apiFetch<PublishJob>('/content/publish', {
+                method: 'POST',
+                body: JSON.stringify({
+                    site_id: content.site_id,
+                    title: content.title,
+                    body: content.body || '',
+                    status: 'draft',
+                }),
+            });
+            setPublishMsg('Publishing...');
+            // Publishing runs in a worker; poll the job until it settles
+            const deadline = Date.now() + PUBLISH_POLL_DEADLINE_MS;
+            while (job.status === 'queued' || job.status === 'running') {
+                if (Date.now() > deadline) {
+                    setPublishMsg(null);
+                    setError(`Publish job #${job.job_id} is still ${job.status}; check it later.`);
+                    return;
                 }
-            );
-            if (res.ok && res.link) setPublishMsg(`Published: ${res.link}`);
+                await new Promise((resolve) => setTimeout(resolve, PUBLISH_POLL_MS));
+                job = await apiFetch<PublishJob>(`/content/publish-jobs/${job.job_id}`);
+            }
+            if (job.status === 'failed') {
+                setPublishMsg(null);
+                setError(job.error || 'Publish failed.');
+            } else if (job.link) setPublishMsg(`Published: ${job.link}`);
             else setPublishMsg('Published (no link returned).');
         } catch (e: any) {
             setError(e.message);
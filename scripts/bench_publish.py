@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Publish throughput benchmark against the fake WordPress server.
+
+Modes:
+    client  sync WordPressClient.create_post from --threads threads
+    async   publish_many() (async client, bounded concurrency)
+    batch   POST /api/content-queue/publish-batch, in-process on a temp SQLite DB
+    queue   POST /api/content-queue/{id}/publish with Celery run eagerly
+
+Reports posts/sec and p50/p95/p99 latency of individual WordPress calls:
+
+    python scripts/bench_publish.py --mode async --posts 2000 --sites 20 --latency-ms 80
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Thêm backend vào Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+# Measure the client, not the per-site token bucket (override to include it)
+os.environ.setdefault("WP_RATE_PER_SEC", "100000")
+os.environ.setdefault("WP_RATE_BURST", "100000")
+os.environ.setdefault("WP_GUARD_REDIS_URL", "")
+os.environ.setdefault(
+    "DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db")
+)
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+
+from fake_wordpress import FakeWordPress, FakeWordPressConfig  # noqa: E402
+from src.core import wordpress_client  # noqa: E402
+from src.core.wordpress_client import (  # noqa: E402
+    PublishJob,
+    WordPressClient,
+    WordPressCredentials,
+    publish_many,
+)
+
+TITLE = "Benchmark post with a reasonable title #{}"
+BODY = "\n## Heading\n" + "Benchmark body text. " * 20
+
+_latencies: list[float] = []
+_latency_lock = threading.Lock()
+
+
+def _record(seconds: float) -> None:
+    with _latency_lock:
+        _latencies.append(seconds)
+
+
+def _time_wordpress_calls() -> None:
+    """Record the duration of every create_post, sync and async."""
+    sync_create = WordPressClient.create_post
+    async_create = wordpress_client.AsyncWordPressClient.create_post
+
+    def timed_sync(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return sync_create(self, *args, **kwargs)
+        finally:
+            _record(time.perf_counter() - started)
+
+    async def timed_async(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await async_create(self, *args, **kwargs)
+        finally:
+            _record(time.perf_counter() - started)
+
+    WordPressClient.create_post = timed_sync
+    wordpress_client.AsyncWordPressClient.create_post = timed_async
+
+
+def _creds(site_urls: list[str], i: int) -> WordPressCredentials:
+    return WordPressCredentials(
+        base_url=site_urls[i % len(site_urls)], username="bench", password="bench"
+    )
+
+
+def run_client(site_urls: list[str], posts: int, threads: int, **_) -> int:
+    def _one(i: int) -> bool:
+        try:
+            WordPressClient(_creds(site_urls, i)).create_post(
+                title=TITLE.format(i), content=BODY, status="publish"
+            )
+            return True
+        except Exception:
+            return False
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return sum(pool.map(_one, range(posts)))
+
+
+def run_async(site_urls, posts, concurrency, per_site, **_) -> int:
+    jobs = [
+        PublishJob(
+            key=i, creds=_creds(site_urls, i), title=TITLE.format(i), content=BODY
+        )
+        for i in range(posts)
+    ]
+    results = asyncio.run(
+        publish_many(jobs, max_concurrency=concurrency, per_site_concurrency=per_site)
+    )
+    return sum(r.ok for r in results)
+
+
+def _api_fixture(site_urls: list[str], posts: int, status: str):
+    from fastapi.testclient import TestClient
+    from src.api.main import app
+    from src.database.models import Base, ContentQueue, Site
+    from src.database.session import SessionLocal, engine
+
+    Base.metadata.create_all(bind=engine)
+    client = TestClient(app)
+    form = {"Content-Type": "application/x-www-form-urlencoded"}
+    client.post(
+        "/api/auth/register",
+        data={"email": "bench@example.com", "password": "bench123"},
+        headers=form,
+    )
+    token = client.post(
+        "/api/auth/login",
+        data={"username": "bench@example.com", "password": "bench123"},
+        headers=form,
+    ).json()["access_token"]
+
+    db = SessionLocal()
+    try:
+        sites = [
+            Site(name=f"bench-{i}", wp_url=url, wp_username="u", wp_password_enc="p")
+            for i, url in enumerate(site_urls)
+        ]
+        db.add_all(sites)
+        db.flush()
+        rows = [
+            ContentQueue(
+                site_id=sites[i % len(sites)].id,
+                title=TITLE.format(i),
+                body=BODY,
+                status=status,
+            )
+            for i in range(posts)
+        ]
+        db.add_all(rows)
+        db.commit()
+        ids = [r.id for r in rows]
+    finally:
+        db.close()
+    return client, {"Authorization": f"Bearer {token}"}, ids
+
+
+def run_batch(site_urls, posts, concurrency, per_site, **_) -> int:
+    wordpress_client.WP_PUBLISH_CONCURRENCY = concurrency
+    wordpress_client.WP_PUBLISH_PER_SITE = per_site
+    client, headers, ids = _api_fixture(site_urls, posts, "approved")
+    published = 0
+    for start in range(0, len(ids), 500):
+        r = client.post(
+            "/api/content-queue/publish-batch",
+            json={"ids": ids[start : start + 500]},
+            headers=headers,
+        )
+        r.raise_for_status()
+        published += r.json()["published"]
+    return published
+
+
+def run_queue(site_urls, posts, **_) -> int:
+    from src.scheduler.celery_app import app as celery_app
+
+    celery_app.conf.task_always_eager = True
+    client, headers, ids = _api_fixture(site_urls, posts, "approved")
+    published = 0
+    for content_id in ids:
+        r = client.post(f"/api/content-queue/{content_id}/publish", headers=headers)
+        published += r.status_code == 202 and r.json()["status"] == "succeeded"
+    return published
+
+
+MODES = {"client": run_client, "async": run_async, "batch": run_batch, "queue": run_queue}
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    if len(samples) < 2:
+        value = samples[0] * 1000 if samples else 0.0
+        return {"p50": value, "p95": value, "p99": value}
+    cuts = statistics.quantiles(samples, n=100)
+    return {"p50": cuts[49] * 1000, "p95": cuts[94] * 1000, "p99": cuts[98] * 1000}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--mode", choices=sorted(MODES), default="async")
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--sites", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=20, help="client mode")
+    parser.add_argument("--concurrency", type=int, default=20, help="async/batch")
+    parser.add_argument("--per-site", type=int, default=4, help="async/batch")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="print one JSON line")
+    args = parser.parse_args()
+
+    server = FakeWordPress(
+        ("127.0.0.1", 0),
+        FakeWordPressConfig(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            retry_after=args.retry_after,
+            seed=args.seed,
+        ),
+    ).start()
+    site_urls = [f"{server.url}/site{i}" for i in range(args.sites)]
+    _time_wordpress_calls()
+    try:
+        started = time.perf_counter()
+        ok = MODES[args.mode](
+            site_urls,
+            posts=args.posts,
+            threads=args.threads,
+            concurrency=args.concurrency,
+            per_site=args.per_site,
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        server.stop()
+
+    result = {
+        "mode": args.mode,
+        "posts": args.posts,
+        "published": ok,
+        "failed": args.posts - ok,
+        "seconds": round(elapsed, 3),
+        "posts_per_sec": round(ok / elapsed, 1) if elapsed else 0.0,
+        **{k: round(v, 1) for k, v in _percentiles(_latencies).items()},
+        "server": server.stats,
+    }
+    if args.json:
+        print(json.dumps(result))
+        return
+    print(f"📊 {args.mode}: {ok}/{args.posts} published in {result['seconds']}s")
+    print(f"   throughput : {result['posts_per_sec']} posts/sec")
+    print(
+        f"   latency ms : p50 {result['p50']}  p95 {result['p95']}  p99 {result['p99']}"
+    )
+    print(f"   server     : {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,7 @@ echo ""
 echo "📋 Checking docker-compose.yml for restart policies..."
 
 # Check if all services have restart policy
-services=("postgres" "redis" "backend" "worker" "beat" "bot" "dashboard" "nginx")
+services=("postgres" "redis" "backend" "worker" "worker-publish" "worker-maintenance" "worker-dispatch" "beat" "bot" "dashboard" "nginx")
 missing_restart=()
 
 for service in "${services[@]}"; do
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Fake WordPress REST server for load-testing the publish path locally.
+
+Implements the parts of /wp-json/wp/v2/posts that WordPressClient uses, with
+configurable latency, 5xx errors and 429s. Any path prefix before /wp-json
+is treated as a separate site, so one server can stand in for a whole fleet:
+
+    python scripts/fake_wordpress.py --port 8081 --latency-ms 80 --error-rate 0.01
+    # sites: http://127.0.0.1:8081/site1, http://127.0.0.1:8081/site2, ...
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+API = "/wp-json/wp/v2/posts"
+
+
+@dataclass
+class FakeWordPressConfig:
+    latency_ms: float = 50.0
+    jitter_ms: float = 20.0
+    error_rate: float = 0.0  # share of requests answered with 500
+    rate_limit_rate: float = 0.0  # share of requests answered with 429
+    retry_after: int = 1  # seconds, sent with every 429
+    seed: Optional[int] = None
+
+
+@dataclass
+class _Site:
+    posts: dict[int, dict] = field(default_factory=dict)
+    next_id: int = 1
+
+
+class FakeWordPress(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # the default of 5 drops connection bursts
+
+    def __init__(self, address: tuple[str, int], config: FakeWordPressConfig):
+        super().__init__(address, _Handler)
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.lock = threading.Lock()
+        self.sites: dict[str, _Site] = {}
+        self.stats = {"requests": 0, "created": 0, "updated": 0, "500": 0, "429": 0}
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeWordPress":
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat(timespec="seconds")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like a real WordPress host
+    server: FakeWordPress
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, payload, headers: Optional[dict] = None) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self) -> Optional[tuple[_Site, Optional[int], dict]]:
+        parts = urlsplit(self.path)
+        prefix, sep, rest = parts.path.partition(API)
+        if not sep or rest not in ("", "/") and not rest.strip("/").isdigit():
+            self._send(404, {"code": "rest_no_route"})
+            return None
+        with self.server.lock:
+            site = self.server.sites.setdefault(prefix.rstrip("/"), _Site())
+        post_id = int(rest.strip("/")) if rest.strip("/") else None
+        return site, post_id, parse_qs(parts.query)
+
+    def _injected_failure(self) -> bool:
+        cfg, srv = self.server.config, self.server
+        with srv.lock:
+            srv.stats["requests"] += 1
+            roll = srv.random.random()
+            delay = max(0.0, cfg.latency_ms + srv.random.uniform(-1, 1) * cfg.jitter_ms)
+        time.sleep(delay / 1000)
+        if roll < cfg.rate_limit_rate:
+            with srv.lock:
+                srv.stats["429"] += 1
+            self._send(429, {"code": "rate_limited"}, {"Retry-After": cfg.retry_after})
+            return True
+        if roll < cfg.rate_limit_rate + cfg.error_rate:
+            with srv.lock:
+                srv.stats["500"] += 1
+            self._send(500, {"code": "internal_server_error"})
+            return True
+        return False
+
+    def do_GET(self):
+        route = self._route()
+        if route is None or self._injected_failure():
+            return
+        site, post_id, query = route
+        if post_id is not None:
+            post = site.posts.get(post_id)
+            if post is None:
+                return self._send(404, {"code": "rest_post_invalid_id"})
+            return self._send(200, post)
+
+        modified_after = query.get("modified_after", [""])[0]
+        per_page = min(100, int(query.get("per_page", ["10"])[0]))
+        page = int(query.get("page", ["1"])[0])
+        fields = [f for f in query.get("_fields", [""])[0].split(",") if f]
+        with self.server.lock:
+            posts = sorted(site.posts.values(), key=lambda p: (p["modified"], p["id"]))
+        if modified_after:
+            posts = [p for p in posts if p["modified"] > modified_after.rstrip("Z")]
+        total = len(posts)
+        chunk = posts[(page - 1) * per_page : page * per_page]
+        if fields:
+            chunk = [{k: p[k] for k in fields if k in p} for p in chunk]
+        pages = max(1, -(-total // per_page))
+        self._send(200, chunk, {"X-WP-Total": total, "X-WP-TotalPages": pages})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        route = self._route()
+        if route is None or self._injected_failure():
+            return
+        site, post_id, _ = route
+        with self.server.lock:
+            if post_id is None:
+                post_id = site.next_id
+                site.next_id += 1
+                post = {"id": post_id, "date": _now(), "status": "draft"}
+                self.server.stats["created"] += 1
+                status = 201
+            elif post_id in site.posts:
+                post = site.posts[post_id]
+                self.server.stats["updated"] += 1
+                status = 200
+            else:
+                post = None
+            if post is not None:
+                for key in ("title", "content", "status", "slug"):
+                    if key in payload:
+                        post[key] = payload[key]
+                post.setdefault("slug", f"post-{post_id}")
+                post["modified"] = _now()
+                post["link"] = f"{self.server.url}{self.path.split(API)[0]}/?p={post_id}"
+                site.posts[post_id] = post
+        if post is None:
+            return self._send(404, {"code": "rest_post_invalid_id"})
+        self._send(status, post)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+    config = FakeWordPressConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    server = FakeWordPress((args.host, args.port), config)
+    print(f"🧪 Fake WordPress listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"📊 {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -62,13 +62,15 @@ else
     echo "❌ FAILED"
 fi
 
-# Check Celery worker
-echo -n "Celery Worker: "
-if docker compose exec -T worker celery -A src.scheduler.celery_app.app inspect ping >/dev/null 2>&1; then
-    echo "✅ OK"
-else
-    echo "❌ FAILED"
-fi
+# Check Celery workers (one pool per queue)
+for worker in worker worker-publish worker-maintenance worker-dispatch; do
+    echo -n "Celery Worker ($worker): "
+    if docker compose exec -T "$worker" celery -A src.scheduler.celery_app.app inspect ping >/dev/null 2>&1; then
+        echo "✅ OK"
+    else
+        echo "❌ FAILED"
+    fi
+done
 
 # Check Celery beat
 echo -n "Celery Beat: "
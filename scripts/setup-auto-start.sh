@@ -86,7 +86,7 @@ echo ""
 echo "📋 Service will start containers in this order:"
 echo "  1. postgres, redis (infrastructure)"
 echo "  2. backend (depends on postgres, redis)"
-echo "  3. worker, beat (depends on backend, redis)"
+echo "  3. worker, worker-publish, worker-maintenance, worker-dispatch, beat (depends on backend, redis)"
 echo "  4. bot (depends on backend)"
 echo "  5. dashboard (depends on backend)"
 echo "  6. nginx (depends on backend, dashboard)"